@@ -2,140 +2,349 @@
 
 """Extract registry information."""
 
-from .collection_api import get_collection, get_context  # noqa:F401
-from .metaresource_api import (  # noqa:F401
-    get_registry,
-    get_registry_description,
-    get_registry_example,
-    get_registry_homepage,
-    get_registry_name,
-    get_registry_provider_uri_format,
-    get_registry_short_name,
-    get_registry_uri,
-)
-from .parse_iri import (  # noqa:F401
-    curie_from_iri,
-    ensure_prefix_list,
-    parse_iri,
-    parse_obolibrary_purl,
-)
-from .resolve import (  # noqa:F401
-    count_mappings,
-    get_appears_in,
-    get_banana,
-    get_biocontext_uri_format,
-    get_bioportal_prefix,
-    get_canonical_for,
-    get_contact,
-    get_contact_email,
-    get_contact_github,
-    get_contact_name,
-    get_contact_orcid,
-    get_converter,
-    get_curie_pattern,
-    get_default_converter,
-    get_default_format,
-    get_depends_on,
-    get_description,
-    get_example,
-    get_external,
-    get_fairsharing_prefix,
-    get_has_canonical,
-    get_has_parts,
-    get_homepage,
-    get_identifiers_org_prefix,
-    get_json_download,
-    get_keywords,
-    get_license,
-    get_license_conflicts,
-    get_mappings,
-    get_miriam_uri_format,
-    get_miriam_uri_prefix,
-    get_n2t_prefix,
-    get_name,
-    get_namespace_in_lui,
-    get_obo_context_prefix_map,
-    get_obo_download,
-    get_obo_health_url,
-    get_obofoundry_prefix,
-    get_obofoundry_uri_format,
-    get_obofoundry_uri_prefix,
-    get_ols_prefix,
-    get_ols_uri_format,
-    get_ols_uri_prefix,
-    get_owl_download,
-    get_part_of,
-    get_parts_collections,
-    get_pattern,
-    get_preferred_prefix,
-    get_prefixcommons_uri_format,
-    get_provided_by,
-    get_provides_for,
-    get_rdf_download,
-    get_registry_invmap,
-    get_registry_map,
-    get_repository,
-    get_resource,
-    get_synonyms,
-    get_version,
-    get_versions,
-    get_wikidata_prefix,
-    has_no_terms,
-    is_deprecated,
-    is_novel,
-    is_proprietary,
-    normalize_curie,
-    normalize_parsed_curie,
-    normalize_prefix,
-    parse_curie,
-    read_contributors,
-)
-from .resolve_identifier import (  # noqa:F401
-    get_bioportal_iri,
-    get_bioregistry_iri,
-    get_default_iri,
-    get_identifiers_org_curie,
-    get_identifiers_org_iri,
-    get_iri,
-    get_link,
-    get_n2t_iri,
-    get_obofoundry_iri,
-    get_ols_iri,
-    get_providers,
-    get_providers_list,
-    is_standardizable_curie,
-    is_standardizable_identifier,
-    is_valid_curie,
-    is_valid_identifier,
-    miriam_standardize_identifier,
-    standardize_identifier,
-)
-from .resource_manager import Manager, manager  # noqa:F401
-from .schema.struct import (  # noqa:F401
-    Author,
-    Collection,
-    Context,
-    Provider,
-    Registry,
-    Resource,
-)
-from .schema_utils import (  # noqa:F401
-    is_mismatch,
-    read_collections,
-    read_contexts,
-    read_metaregistry,
-    read_mismatches,
-    read_registry,
-    registries,
-    resources,
-    write_contexts,
-    write_registry,
-)
-from .uri_format import (  # noqa:F401
-    get_extended_prefix_map,
-    get_pattern_map,
-    get_prefix_map,
-    get_uri_format,
-    get_uri_prefix,
-)
-from .utils import curie_to_str  # noqa:F401
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .collection_api import get_collection, get_context  # noqa:F401
+    from .compact import CompactManager, ResourceView  # noqa:F401
+    from .metaresource_api import (  # noqa:F401
+        get_registry,
+        get_registry_description,
+        get_registry_example,
+        get_registry_homepage,
+        get_registry_name,
+        get_registry_provider_uri_format,
+        get_registry_short_name,
+        get_registry_uri,
+    )
+    from .parse_iri import (  # noqa:F401
+        curie_from_iri,
+        ensure_prefix_list,
+        ensure_prefix_trie,
+        parse_iri,
+        parse_iris,
+        parse_obolibrary_purl,
+    )
+    from .resolve import (  # noqa:F401
+        count_mappings,
+        get_appears_in,
+        get_banana,
+        get_biocontext_uri_format,
+        get_bioportal_prefix,
+        get_canonical_for,
+        get_contact,
+        get_contact_email,
+        get_contact_github,
+        get_contact_name,
+        get_contact_orcid,
+        get_converter,
+        get_curie_pattern,
+        get_default_converter,
+        get_default_format,
+        get_depends_on,
+        get_description,
+        get_example,
+        get_external,
+        get_fairsharing_prefix,
+        get_has_canonical,
+        get_has_parts,
+        get_homepage,
+        get_identifiers_org_prefix,
+        get_json_download,
+        get_keywords,
+        get_license,
+        get_license_conflicts,
+        get_mappings,
+        get_miriam_uri_format,
+        get_miriam_uri_prefix,
+        get_n2t_prefix,
+        get_name,
+        get_namespace_in_lui,
+        get_obo_context_prefix_map,
+        get_obo_download,
+        get_obo_health_url,
+        get_obofoundry_prefix,
+        get_obofoundry_uri_format,
+        get_obofoundry_uri_prefix,
+        get_ols_prefix,
+        get_ols_uri_format,
+        get_ols_uri_prefix,
+        get_owl_download,
+        get_part_of,
+        get_parts_collections,
+        get_pattern,
+        get_preferred_prefix,
+        get_prefixcommons_uri_format,
+        get_provided_by,
+        get_provides_for,
+        get_rdf_download,
+        get_registry_invmap,
+        get_registry_map,
+        get_repository,
+        get_resource,
+        get_synonyms,
+        get_version,
+        get_versions,
+        get_wikidata_prefix,
+        has_no_terms,
+        is_deprecated,
+        is_novel,
+        is_proprietary,
+        normalize_curie,
+        normalize_parsed_curie,
+        normalize_prefix,
+        parse_curie,
+        read_contributors,
+    )
+    from .resolve_identifier import (  # noqa:F401
+        get_bioportal_iri,
+        get_bioregistry_iri,
+        get_default_iri,
+        get_identifiers_org_curie,
+        get_identifiers_org_iri,
+        get_iri,
+        get_link,
+        get_n2t_iri,
+        get_obofoundry_iri,
+        get_ols_iri,
+        get_providers,
+        get_providers_list,
+        is_standardizable_curie,
+        is_standardizable_identifier,
+        is_valid_curie,
+        is_valid_identifier,
+        miriam_standardize_identifier,
+        standardize_identifier,
+        validate_curies,
+    )
+    from .resource_manager import CurieValidationResults, Manager, manager  # noqa:F401
+    from .schema.struct import (  # noqa:F401
+        Author,
+        Collection,
+        Context,
+        Provider,
+        Registry,
+        Resource,
+    )
+    from .schema_utils import (  # noqa:F401
+        is_mismatch,
+        read_collections,
+        read_contexts,
+        read_metaregistry,
+        read_mismatches,
+        read_registry,
+        registries,
+        resources,
+        write_contexts,
+        write_registry,
+    )
+    from .uri_format import (  # noqa:F401
+        get_extended_prefix_map,
+        get_pattern_map,
+        get_prefix_map,
+        get_uri_format,
+        get_uri_prefix,
+    )
+    from .utils import curie_to_str  # noqa:F401
+
+#: A mapping from the names exported by the package to the submodules that define
+#: them. These are only imported the first time they're accessed, so ``import bioregistry``
+#: stays cheap, e.g., for code that only needs :mod:`bioregistry.version` or the schema.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    name: module
+    for module, names in {
+        "collection_api": [
+            "get_collection",
+            "get_context",
+        ],
+        "compact": [
+            "CompactManager",
+            "ResourceView",
+        ],
+        "metaresource_api": [
+            "get_registry",
+            "get_registry_description",
+            "get_registry_example",
+            "get_registry_homepage",
+            "get_registry_name",
+            "get_registry_provider_uri_format",
+            "get_registry_short_name",
+            "get_registry_uri",
+        ],
+        "parse_iri": [
+            "curie_from_iri",
+            "ensure_prefix_list",
+            "ensure_prefix_trie",
+            "parse_iri",
+            "parse_iris",
+            "parse_obolibrary_purl",
+        ],
+        "resolve": [
+            "count_mappings",
+            "get_appears_in",
+            "get_banana",
+            "get_biocontext_uri_format",
+            "get_bioportal_prefix",
+            "get_canonical_for",
+            "get_contact",
+            "get_contact_email",
+            "get_contact_github",
+            "get_contact_name",
+            "get_contact_orcid",
+            "get_converter",
+            "get_curie_pattern",
+            "get_default_converter",
+            "get_default_format",
+            "get_depends_on",
+            "get_description",
+            "get_example",
+            "get_external",
+            "get_fairsharing_prefix",
+            "get_has_canonical",
+            "get_has_parts",
+            "get_homepage",
+            "get_identifiers_org_prefix",
+            "get_json_download",
+            "get_keywords",
+            "get_license",
+            "get_license_conflicts",
+            "get_mappings",
+            "get_miriam_uri_format",
+            "get_miriam_uri_prefix",
+            "get_n2t_prefix",
+            "get_name",
+            "get_namespace_in_lui",
+            "get_obo_context_prefix_map",
+            "get_obo_download",
+            "get_obo_health_url",
+            "get_obofoundry_prefix",
+            "get_obofoundry_uri_format",
+            "get_obofoundry_uri_prefix",
+            "get_ols_prefix",
+            "get_ols_uri_format",
+            "get_ols_uri_prefix",
+            "get_owl_download",
+            "get_part_of",
+            "get_parts_collections",
+            "get_pattern",
+            "get_preferred_prefix",
+            "get_prefixcommons_uri_format",
+            "get_provided_by",
+            "get_provides_for",
+            "get_rdf_download",
+            "get_registry_invmap",
+            "get_registry_map",
+            "get_repository",
+            "get_resource",
+            "get_synonyms",
+            "get_version",
+            "get_versions",
+            "get_wikidata_prefix",
+            "has_no_terms",
+            "is_deprecated",
+            "is_novel",
+            "is_proprietary",
+            "normalize_curie",
+            "normalize_parsed_curie",
+            "normalize_prefix",
+            "parse_curie",
+            "read_contributors",
+        ],
+        "resolve_identifier": [
+            "get_bioportal_iri",
+            "get_bioregistry_iri",
+            "get_default_iri",
+            "get_identifiers_org_curie",
+            "get_identifiers_org_iri",
+            "get_iri",
+            "get_link",
+            "get_n2t_iri",
+            "get_obofoundry_iri",
+            "get_ols_iri",
+            "get_providers",
+            "get_providers_list",
+            "is_standardizable_curie",
+            "is_standardizable_identifier",
+            "is_valid_curie",
+            "is_valid_identifier",
+            "miriam_standardize_identifier",
+            "standardize_identifier",
+            "validate_curies",
+        ],
+        "resource_manager": [
+            "CurieValidationResults",
+            "Manager",
+            "manager",
+        ],
+        "schema.struct": [
+            "Author",
+            "Collection",
+            "Context",
+            "Provider",
+            "Registry",
+            "Resource",
+        ],
+        "schema_utils": [
+            "is_mismatch",
+            "read_collections",
+            "read_contexts",
+            "read_metaregistry",
+            "read_mismatches",
+            "read_registry",
+            "registries",
+            "resources",
+            "write_contexts",
+            "write_registry",
+        ],
+        "uri_format": [
+            "get_extended_prefix_map",
+            "get_pattern_map",
+            "get_prefix_map",
+            "get_uri_format",
+            "get_uri_prefix",
+        ],
+        "utils": [
+            "curie_to_str",
+        ],
+    }.items()
+    for name in names
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name or a submodule the first time it's accessed."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    else:
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise  # the submodule exists, but one of its dependencies doesn't
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the attributes of the package, including the ones that aren't imported yet."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule sets it as an attribute of the package. This keeps
+        # the :mod:`bioregistry.parse_iri` module from shadowing the function of
+        # the same name that it defines, whenever the module gets imported.
+        if isinstance(value, types.ModuleType) and _LAZY_ATTRIBUTES.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+"""An :mod:`asyncio` interface to the Bioregistry.
+
+The functions in :mod:`bioregistry` and the methods of :class:`bioregistry.Manager`
+are synchronous, so calling the slow ones (e.g., building a converter or parsing
+millions of CURIEs) from a coroutine would block the event loop. An
+:class:`AsyncManager` wraps a manager and runs slow work in a thread pool or a
+process pool instead.
+
+.. code-block:: python
+
+    import asyncio
+
+    from bioregistry.aio import AsyncManager
+
+    async def main():
+        async with AsyncManager() as manager:
+            # build the converter and indexes in a thread, without blocking the loop
+            await manager.warm()
+
+            # parse CURIEs in chunks, a few chunks at a time
+            pairs = await manager.parse_curies(["GO:0000001", "chebi:1234"])
+
+            # stream results as they're ready
+            async for iri in manager.iter_iris(["GO:0000001", "chebi:1234"]):
+                print(iri)
+
+    asyncio.run(main())
+
+Lookups of single prefixes and CURIEs (e.g., :meth:`AsyncManager.normalize_prefix`)
+only take microseconds once the manager is warmed up, so they run directly in
+the event loop.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .resource_manager import Manager, manager
+from .schema import Resource
+from .utils import iter_chunks
+
+__all__ = [
+    "AsyncManager",
+]
+
+X = TypeVar("X")
+
+#: The default number of elements in each chunk of a bulk operation
+DEFAULT_CHUNKSIZE = 1_000
+#: The default number of chunks of a bulk operation that are processed at the same time
+DEFAULT_CONCURRENCY = 4
+
+#: The manager used in worker processes, which is set by :func:`_set_worker_manager`
+_WORKER_MANAGER: Optional[Manager] = None
+
+
+def _set_worker_manager(manager_: Manager) -> None:
+    global _WORKER_MANAGER
+    _WORKER_MANAGER = manager_
+
+
+def _map_chunk(manager_: Optional[Manager], name: str, chunk: List[Any]) -> List[Any]:
+    """Call a method of the manager on each element in the chunk.
+
+    :param manager_: The manager. If None, uses the worker process's manager, so
+        it doesn't have to be pickled for each chunk.
+    :param name: The name of the method
+    :param chunk: A list of elements
+    :returns: The results, in order
+    :raises RuntimeError: If the worker process's manager wasn't set
+    """
+    if manager_ is None:
+        if _WORKER_MANAGER is None:
+            raise RuntimeError("worker manager was not initialized")
+        manager_ = _WORKER_MANAGER
+    func = getattr(manager_, name)
+    return [func(element) for element in chunk]
+
+
+async def _aiter_chunks(
+    items: Union[Iterable[X], AsyncIterable[X]], chunksize: int
+) -> AsyncIterator[List[X]]:
+    if not isinstance(items, AsyncIterable):
+        for chunk in iter_chunks(items, chunksize):
+            yield chunk
+        return
+    chunk = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class AsyncManager:
+    """Run the slow parts of a manager without blocking the event loop."""
+
+    def __init__(
+        self,
+        manager_: Optional[Manager] = None,
+        *,
+        executor: Optional[Executor] = None,
+        processes: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """Instantiate the async manager.
+
+        :param manager_: The manager to wrap. Defaults to :data:`bioregistry.manager`.
+        :param executor: The executor that work is offloaded to. If None, uses
+            the event loop's default thread pool, unless ``processes`` is given.
+        :param processes: If given, the bulk operations (e.g., :meth:`parse_curies`)
+            are run in a pool of this many processes, which are given the manager
+            once when they start. This is useful for large inputs, since threads
+            can't parse in parallel. The pool is shut down by :meth:`close`.
+        :param chunksize: The number of elements in each chunk of a bulk operation
+        :param concurrency: The maximum number of chunks that are processed at the
+            same time. This bounds the memory used for pending results.
+        :raises ValueError: If both an executor and a number of processes are given
+        """
+        if executor is not None and processes is not None:
+            raise ValueError("can't give both an executor and a number of processes")
+        self.manager = manager_ or manager
+        self.chunksize = chunksize
+        self.concurrency = concurrency
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        if processes is not None:
+            self._process_executor = ProcessPoolExecutor(
+                processes, initializer=_set_worker_manager, initargs=(self.manager,)
+            )
+        self.executor = executor
+
+    async def __aenter__(self) -> "AsyncManager":
+        """Use the async manager in an async context manager, which closes it on exit."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Close the async manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the process pool, if one was made."""
+        if self._process_executor is not None:
+            self._process_executor.shutdown()
+            self._process_executor = None
+
+    async def run(self, func: Callable[..., X], *args: Any, **kwargs: Any) -> X:
+        """Run a function in the executor and wait for its result.
+
+        :param func: The function, e.g., a method of :data:`manager`
+        :param args: Positional arguments for the function
+        :param kwargs: Keyword arguments for the function
+        :returns: The function's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def warm(self) -> None:
+        """Build the converter and the indexes used by lookups, e.g., before serving requests."""
+        await self.run(self._warm)
+
+    def _warm(self) -> None:
+        self.manager.converter  # noqa:B018
+        self.manager.warm_derived_index()
+
+    async def get_converter(self, **kwargs: Any):
+        """Get a converter, building it in the executor if it's not cached.
+
+        :param kwargs: Keyword arguments for :meth:`bioregistry.Manager.get_converter`
+        :returns: A converter
+        """
+        return await self.run(self.manager.get_converter, **kwargs)
+
+    async def rasterize(self):
+        """Build a dictionary representing the fully constituted registry in the executor."""
+        return await self.run(self.manager.rasterize)
+
+    def normalize_prefix(self, prefix: str) -> Optional[str]:
+        """Get the normalized prefix, see :meth:`bioregistry.Manager.normalize_prefix`."""
+        return self.manager.normalize_prefix(prefix)
+
+    def get_resource(self, prefix: str) -> Optional[Resource]:
+        """Get a resource, see :meth:`bioregistry.Manager.get_resource`."""
+        return self.manager.get_resource(prefix)
+
+    def parse_curie(self, curie: str) -> Union[Tuple[str, str], Tuple[None, None]]:
+        """Parse a CURIE, see :meth:`bioregistry.Manager.parse_curie`."""
+        return self.manager.parse_curie(curie)
+
+    def get_iri(self, curie: str) -> Optional[str]:
+        """Get the best IRI for a CURIE, see :meth:`bioregistry.Manager.get_iri`."""
+        return self.manager.get_iri(curie)
+
+    async def iter_resources(self) -> AsyncIterator[Tuple[str, Resource]]:
+        """Iterate over the prefixes and resources, letting other tasks run between chunks.
+
+        :yields: Pairs of prefixes and resources
+        """
+        items = list(self.manager.registry.items())
+        for chunk in iter_chunks(items, self.chunksize):
+            for pair in chunk:
+                yield pair
+            await asyncio.sleep(0)
+
+    async def _imap(
+        self, name: str, items: Union[Iterable[Any], AsyncIterable[Any]]
+    ) -> AsyncIterator[Any]:
+        """Call a method of the manager on each element in chunks and yield the results in order.
+
+        Like :func:`bioregistry.utils.imap_ordered`, only a bounded number of chunks
+        are pending at a time, so the input can be larger than fits in memory.
+
+        :param name: The name of the method of the manager
+        :param items: An iterable or async iterable of elements
+        :yields: The results of calling the method on each element, in order
+        """
+        loop = asyncio.get_running_loop()
+        if self._process_executor is not None:
+            executor: Optional[Executor] = self._process_executor
+            manager_ = None
+        else:
+            executor, manager_ = self.executor, self.manager
+        pending: Deque[asyncio.Future] = deque()
+        async for chunk in _aiter_chunks(items, self.chunksize):
+            pending.append(loop.run_in_executor(executor, _map_chunk, manager_, name, chunk))
+            if len(pending) >= self.concurrency:
+                for result in await pending.popleft():
+                    yield result
+        while pending:
+            for result in await pending.popleft():
+                yield result
+
+    def iter_parse_curies(
+        self, curies: Union[Iterable[str], AsyncIterable[str]]
+    ) -> AsyncIterator[Union[Tuple[str, str], Tuple[None, None]]]:
+        """Parse CURIEs in chunks and yield the results in order.
+
+        :param curies: CURIEs, which can come from an async iterable (e.g., a stream)
+        :returns: An async iterator of prefix/identifier pairs (or pairs of Nones)
+        """
+        return self._imap("parse_curie", curies)
+
+    async def parse_curies(
+        self, curies: Union[Iterable[str], AsyncIterable[str]]
+    ) -> List[Union[Tuple[str, str], Tuple[None, None]]]:
+        """Parse CURIEs in chunks.
+
+        :param curies: CURIEs, which can come from an async iterable (e.g., a stream)
+        :returns: A list of prefix/identifier pairs (or pairs of Nones), in the same order
+
+        >>> import asyncio
+        >>> asyncio.run(AsyncManager().parse_curies(["GO:0000001", "nope:nope"]))
+        [('go', '0000001'), (None, None)]
+        """
+        return [pair async for pair in self.iter_parse_curies(curies)]
+
+    def iter_iris(
+        self, curies: Union[Iterable[str], AsyncIterable[str]]
+    ) -> AsyncIterator[Optional[str]]:
+        """Get the best IRI for each CURIE in chunks and yield them in order.
+
+        :param curies: CURIEs, which can come from an async iterable (e.g., a stream)
+        :returns: An async iterator of IRIs (or Nones)
+        """
+        return self._imap("get_iri", curies)
+
+    async def get_iris(
+        self, curies: Union[Iterable[str], AsyncIterable[str]]
+    ) -> List[Optional[str]]:
+        """Get the best IRI for each CURIE in chunks.
+
+        :param curies: CURIEs, which can come from an async iterable (e.g., a stream)
+        :returns: A list of IRIs (or Nones), in the same order
+
+        >>> import asyncio
+        >>> asyncio.run(AsyncManager().get_iris(["chebi:24867", "nope:nope"]))
+        ['https://www.ebi.ac.uk/chebi/searchId.do?chebiId=CHEBI:24867', None]
+        """
+        return [iri async for iri in self.iter_iris(curies)]
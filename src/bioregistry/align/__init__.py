@@ -27,6 +27,7 @@ from .ncbi import NcbiAligner
 from .obofoundry import OBOFoundryAligner
 from .ols import OLSAligner
 from .ontobee import OntobeeAligner
+from .orchestrator import SourceTiming, align_all, get_timing_table
 from .prefixcommons import PrefixCommonsAligner
 from .re3data import Re3dataAligner
 from .uniprot import UniProtAligner
@@ -37,6 +38,9 @@ __all__ = [
     # Abstract
     "Aligner",
     "aligner_resolver",
+    "align_all",
+    "get_timing_table",
+    "SourceTiming",
     # Concrete
     "AberOWLAligner",
     "BioContextAligner",
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""Align all external registries at once.
+
+Downloading and processing the external registries is slow, but the sources
+don't depend on each other, so :func:`align_all` gets all of them concurrently,
+in a process pool (or a thread pool). Aligning isn't independent: each aligner
+matches against the prefixes that the aligners before it added (e.g., the ones
+with ``include_new``), so the alignments are applied one at a time to a single
+shared :class:`bioregistry.Manager`, always in the given order. An aligner is
+applied as soon as its own source is ready and all the aligners before it are
+done, which overlaps alignment with the downloads that are still running.
+The registry is only written once, at the end.
+"""
+
+import logging
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Type
+
+from tabulate import tabulate
+
+from .utils import Aligner
+from ..resource_manager import Manager
+from ..utils import OLSBroken
+
+__all__ = [
+    "SourceTiming",
+    "align_all",
+    "get_timing_table",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The errors that make a source get skipped instead of stopping the alignment
+SKIPPED_ERRORS = (IOError, OLSBroken)
+
+
+class SourceTiming(NamedTuple):
+    """How long it took to get and align an external registry."""
+
+    #: The metaprefix of the external registry
+    key: str
+    #: The time spent downloading and processing the external registry, in seconds
+    get_seconds: float
+    #: The time spent waiting for the source and the aligners before it, in seconds
+    wait_seconds: float
+    #: The time spent aligning, in seconds
+    align_seconds: float
+    #: The number of records in the external registry
+    records: int
+    #: The error that made the source get skipped, if any
+    error: Optional[str] = None
+
+
+def _get(
+    aligner_cls: Type[Aligner], force_download: Optional[bool]
+) -> Tuple[Mapping[str, Any], float]:
+    start = time.perf_counter()
+    external_registry = aligner_cls.get_external_registry(force_download=force_download)
+    return external_registry, time.perf_counter() - start
+
+
+def align_all(
+    aligner_classes: Iterable[Type[Aligner]],
+    *,
+    force_download: Optional[bool] = None,
+    dry: bool = False,
+    manager: Optional[Manager] = None,
+    workers: Optional[int] = None,
+    processes: bool = True,
+) -> List[SourceTiming]:
+    """Align several external registries, getting them concurrently.
+
+    :param aligner_classes: The aligners, in the order they're applied
+    :param force_download: Force re-download of the data
+    :param dry: If true, don't write changes to the registry
+    :param manager: The manager whose registry is aligned. If none given, a new one is loaded.
+    :param workers: The number of sources that are got at the same time. Defaults to the
+        executor's default.
+    :param processes: If true, gets the sources in a process pool, so processing them
+        runs in parallel. Otherwise, uses a thread pool.
+    :returns: The timing of each source, in the order they're applied
+    """
+    aligner_classes = list(aligner_classes)
+    if manager is None:
+        manager = Manager()
+    executor: Executor
+    if processes:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="align")
+
+    rv = []
+    with executor:
+        futures: List[Future] = [
+            executor.submit(_get, aligner_cls, force_download) for aligner_cls in aligner_classes
+        ]
+        for aligner_cls, future in zip(aligner_classes, futures):
+            start = time.perf_counter()
+            try:
+                external_registry, get_seconds = future.result()
+            except SKIPPED_ERRORS as e:
+                logger.warning("[%s] failed to get external registry: %s", aligner_cls.key, e)
+                rv.append(SourceTiming(aligner_cls.key, 0.0, 0.0, 0.0, 0, error=str(e)))
+                continue
+            wait_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            aligner = aligner_cls(manager=manager, external_registry=external_registry)
+            aligner.write_curation_table()
+            align_seconds = time.perf_counter() - start
+            logger.info("[%s] aligned in %.2f seconds", aligner_cls.key, align_seconds)
+            rv.append(
+                SourceTiming(
+                    key=aligner_cls.key,
+                    get_seconds=get_seconds,
+                    wait_seconds=wait_seconds,
+                    align_seconds=align_seconds,
+                    records=len(external_registry),
+                )
+            )
+
+    if not dry:
+        manager.write_registry()
+    return rv
+
+
+def get_timing_table(timings: Iterable[SourceTiming], **kwargs) -> str:
+    """Get a table of the timings from :func:`align_all`, built by :mod:`tabulate`."""
+    kwargs.setdefault("tablefmt", "rst")
+    rows = [
+        (
+            timing.key,
+            timing.records,
+            round(timing.get_seconds, 2),
+            round(timing.wait_seconds, 2),
+            round(timing.align_seconds, 2),
+            timing.error or "",
+        )
+        for timing in timings
+    ]
+    return tabulate(
+        rows,
+        headers=("source", "records", "get (s)", "wait (s)", "align (s)", "error"),
+        **kwargs,
+    )
@@ -51,33 +51,65 @@ class Aligner:
 
     normalize_invmap: ClassVar[bool] = False
 
-    def __init__(self, force_download: Optional[bool] = None):
-        """Instantiate the aligner."""
+    def __init__(
+        self,
+        force_download: Optional[bool] = None,
+        *,
+        manager: Optional[Manager] = None,
+        external_registry: Optional[Mapping[str, Any]] = None,
+    ):
+        """Instantiate the aligner.
+
+        :param force_download: Force re-download of the data
+        :param manager: The manager whose registry is aligned. If none given, a new one
+            is loaded. Several aligners can share one, then it's only written once.
+        :param external_registry: The external registry, if it was already got with
+            :meth:`get_external_registry` (e.g., in another process)
+        :raises TypeError: If the subclass doesn't define a key and curation header,
+            or if its key isn't a metaprefix in the manager's metaregistry
+        """
         if not hasattr(self.__class__, "key"):
             raise TypeError
         if not hasattr(self.__class__, "curation_header"):
             raise TypeError
 
-        self.manager = Manager()
+        self.manager = Manager() if manager is None else manager
 
         if self.key not in self.manager.metaregistry:
             raise TypeError(f"invalid metaprefix for aligner: {self.key}")
 
-        kwargs = dict(self.getter_kwargs or {})
-        kwargs.setdefault("force_download", True)
-        if force_download is not None:
-            kwargs["force_download"] = force_download
-        self.external_registry = self.__class__.getter(**kwargs)
+        if external_registry is None:
+            external_registry = self.get_external_registry(force_download=force_download)
+        self.external_registry = external_registry
         self.skip_external = self.get_skip()
 
-        # Get all of the pre-curated mappings from the Bioregistry
-        self.external_id_to_bioregistry_id = self.manager.get_registry_invmap(
-            self.key,
-            normalize=self.normalize_invmap,
+        # Get all of the pre-curated mappings from the Bioregistry. This is copied
+        # since it's updated during alignment and the manager's copy is cached
+        self.external_id_to_bioregistry_id = dict(
+            self.manager.get_registry_invmap(
+                self.key,
+                normalize=self.normalize_invmap,
+            )
         )
 
         # Run lexical alignment
         self._align()
+        # resources might have been added and mappings changed, so rebuild the
+        # synonym index and drop the cached prefix maps
+        self.manager.clear_caches()
+
+    @classmethod
+    def get_external_registry(cls, force_download: Optional[bool] = None) -> Mapping[str, Any]:
+        """Download and process the external registry.
+
+        :param force_download: Force re-download of the data
+        :returns: The external registry, as returned by :data:`getter`
+        """
+        kwargs = dict(cls.getter_kwargs or {})
+        kwargs.setdefault("force_download", True)
+        if force_download is not None:
+            kwargs["force_download"] = force_download
+        return cls.getter(**kwargs)
 
     @property
     def internal_registry(self) -> Dict[str, Resource]:
@@ -146,6 +178,8 @@ class Aligner:
         _entry[self.subkey] = external_id
         self.internal_registry[bioregistry_id][self.key] = _entry
         self.external_id_to_bioregistry_id[external_id] = bioregistry_id
+        # the resource was modified in place, so anything derived from it is stale
+        self.manager.clear_derived_index(bioregistry_id)
 
     def prepare_external(self, external_id: str, external_entry: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare a dictionary to be added to the bioregistry for each external registry entry.
@@ -11,6 +11,7 @@ from .utils import (
     _autocomplete,
     _normalize_prefix_or_404,
     _search,
+    cached_response,
     serialize,
     serialize_model,
 )
@@ -38,6 +39,7 @@ api_blueprint = Blueprint("metaregistry_api", __name__, url_prefix="/api")
 
 
 @api_blueprint.route("/registry")
+@cached_response
 def resources():
     """Get all resources.
 
@@ -58,6 +60,7 @@ def resources():
 
 
 @api_blueprint.route("/registry/<prefix>")
+@cached_response
 def resource(prefix: str):
     """Get a resource.
 
@@ -131,6 +134,7 @@ def resource_from_metaregistry(metaprefix: str, metaidentifier: str):
 
 
 @api_blueprint.route("/metaregistry/<metaprefix>/mappings.json")
+@cached_response
 def bioregistry_to_external_mapping(metaprefix: str):
     """Get mappings from the Bioregistry to an external registry.
 
@@ -148,6 +152,7 @@ def bioregistry_to_external_mapping(metaprefix: str):
 
 
 @api_blueprint.route("/metaregistry/<metaprefix>/registry_subset.json")
+@cached_response
 def get_external_registry_slim(metaprefix: str):
     """Get a slim, rasterized version of the Bioregistry for records in the external registry.
 
@@ -163,14 +168,14 @@ def get_external_registry_slim(metaprefix: str):
         return abort(404, f"invalid metaprefix: {metaprefix}")
     return sanitize_mapping(
         {
-            prefix: manager.rasterized_resource(resource_)
-            for prefix, resource_ in manager.registry.items()
-            if metaprefix in resource_.get_mappings()
+            prefix: manager.rasterized_resource(manager.registry[prefix])
+            for prefix in manager.get_registry_map(metaprefix)
         }
     )
 
 
 @api_blueprint.route("/metaregistry")
+@cached_response
 def metaresources():
     """Get all metaresources.
 
@@ -191,6 +196,7 @@ def metaresources():
 
 
 @api_blueprint.route("/metaregistry/<metaprefix>")
+@cached_response
 def metaresource(metaprefix: str):
     """Get a metaresource.
 
@@ -220,6 +226,7 @@ def metaresource(metaprefix: str):
 
 
 @api_blueprint.route("/collections")
+@cached_response
 def collections():
     """Get all collections.
 
@@ -240,6 +247,7 @@ def collections():
 
 
 @api_blueprint.route("/collection/<identifier>")
+@cached_response
 def collection(identifier: str):
     """Get a collection.
 
@@ -270,6 +278,7 @@ def collection(identifier: str):
 
 
 @api_blueprint.route("/collection/<identifier>.context.jsonld")
+@cached_response
 def collection_context(identifier: str):
     """Get a collection as a JSON-LD context.
 
@@ -299,6 +308,7 @@ def collection_context(identifier: str):
 
 
 @api_blueprint.route("/contexts")
+@cached_response
 def contexts():
     """Get all contexts.
 
@@ -319,6 +329,7 @@ def contexts():
 
 
 @api_blueprint.route("/context/<identifier>")
+@cached_response
 def context(identifier: str):
     """Get a context.
 
@@ -395,6 +406,7 @@ def reference(prefix: str, identifier: str):
 
 
 @api_blueprint.route("/contributors")
+@cached_response
 def contributors():
     """Get all contributors.
 
@@ -415,6 +427,7 @@ def contributors():
 
 
 @api_blueprint.route("/contributor/<orcid>")
+@cached_response
 def contributor(orcid: str):
     """Get a contributor.
 
@@ -468,11 +481,16 @@ def search():
       description: The prefix for the entry
       required: true
       type: string
+    - name: limit
+      in: query
+      description: The maximum number of results
+      required: false
+      type: integer
     """  # noqa:DAR101,DAR201
     q = request.args.get("q")
     if q is None:
         abort(400)
-    return jsonify(_search(manager, q))
+    return jsonify(_search(manager, q, limit=request.args.get("limit", type=int)))
 
 
 @api_blueprint.route("/autocomplete")
@@ -486,14 +504,20 @@ def autocomplete():
       description: The prefix for the entry
       required: true
       type: string
+    - name: limit
+      in: query
+      description: The maximum number of search results
+      required: false
+      type: integer
     """  # noqa:DAR101,DAR201
     q = request.args.get("q")
     if q is None:
         abort(400)
-    return jsonify(_autocomplete(manager, q))
+    return jsonify(_autocomplete(manager, q, limit=request.args.get("limit", type=int)))
 
 
 @api_blueprint.route("/context.jsonld")
+@cached_response
 def generate_context_json_ld():
     """Generate an *ad-hoc* context JSON-LD file from the given parameters.
 
@@ -531,6 +555,7 @@ def generate_context_json_ld():
 
 
 @api_blueprint.route("/external/mapping/<source>/<target>")
+@cached_response
 def mapping(source: str, target: str):
     """Get mappings between two external prefixes.
 
@@ -551,29 +576,16 @@ def mapping(source: str, target: str):
         return {"bad source prefix": source}, 400
     if target not in manager.metaregistry:
         return {"bad target prefix": target}, 400
-    rv = {}
-    source_only = set()
-    target_only = set()
-    for resource in manager.registry.values():
-        mappings = resource.get_mappings()
-        mp1_prefix = mappings.get(source)
-        mp2_prefix = mappings.get(target)
-        if mp1_prefix and mp2_prefix:
-            rv[mp1_prefix] = mp2_prefix
-        elif mp1_prefix and not mp2_prefix:
-            source_only.add(mp1_prefix)
-        elif not mp1_prefix and mp2_prefix:
-            target_only.add(mp2_prefix)
-
+    external_mappings = manager.get_mapping_table().get_mappings(source, target)
     return jsonify(
         meta=dict(
-            len_overlap=len(rv),
+            len_overlap=len(external_mappings.mappings),
             source=source,
             target=target,
-            len_source_only=len(source_only),
-            len_target_only=len(target_only),
-            source_only=sorted(source_only),
-            target_only=sorted(target_only),
+            len_source_only=len(external_mappings.source_only),
+            len_target_only=len(external_mappings.target_only),
+            source_only=external_mappings.source_only,
+            target_only=external_mappings.target_only,
         ),
-        mappings=rv,
+        mappings=external_mappings.mappings,
     )
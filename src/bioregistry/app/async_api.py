@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""Native :mod:`asyncio` endpoints for bulk resolution.
+
+These are served by FastAPI directly, rather than through the Flask application
+that's mounted with :class:`starlette.middleware.wsgi.WSGIMiddleware`, so parsing
+large batches of CURIEs runs in a thread pool without tying up a WSGI worker.
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter
+from flask import Flask
+from pydantic import BaseModel, Field
+
+from ..aio import AsyncManager
+
+__all__ = [
+    "get_async_router",
+]
+
+
+class BulkRequest(BaseModel):
+    """A batch of CURIEs."""
+
+    curies: List[str] = Field(..., description="The CURIEs", example=["GO:0000001", "chebi:1234"])
+
+
+class ParsedCURIE(BaseModel):
+    """The normalized prefix and identifier of a CURIE."""
+
+    curie: str = Field(..., description="The CURIE, as given")
+    prefix: Optional[str] = Field(description="The normalized prefix, if the CURIE could be parsed")
+    identifier: Optional[str] = Field(
+        description="The normalized identifier, if the CURIE could be parsed"
+    )
+
+
+class ResolvedCURIE(BaseModel):
+    """The best IRI for a CURIE."""
+
+    curie: str = Field(..., description="The CURIE, as given")
+    iri: Optional[str] = Field(description="The best IRI, if the CURIE could be resolved")
+
+
+def get_async_router(app: Flask) -> APIRouter:
+    """Get a router with the async endpoints.
+
+    :param app: The Flask application, whose manager is used. It's looked up on
+        each request, so it's swapped along with the rest of the application's
+        (see :mod:`bioregistry.app.reload`).
+    :returns: A router to include in the FastAPI application
+    """
+    router = APIRouter(prefix="/api/bulk", tags=["bulk"])
+
+    @router.post("/parse", response_model=List[ParsedCURIE])
+    async def parse_curies(request: BulkRequest):
+        """Parse and normalize a batch of CURIEs."""
+        pairs = await AsyncManager(app.manager).parse_curies(request.curies)
+        return [
+            ParsedCURIE(curie=curie, prefix=prefix, identifier=identifier)
+            for curie, (prefix, identifier) in zip(request.curies, pairs)
+        ]
+
+    @router.post("/iri", response_model=List[ResolvedCURIE])
+    async def get_iris(request: BulkRequest):
+        """Get the best IRI for each of a batch of CURIEs."""
+        iris = await AsyncManager(app.manager).get_iris(request.curies)
+        return [ResolvedCURIE(curie=curie, iri=iri) for curie, iri in zip(request.curies, iris)]
+
+    return router
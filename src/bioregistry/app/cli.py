@@ -2,6 +2,7 @@
 
 """Web command for running the app."""
 
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
@@ -28,6 +29,11 @@ __all__ = [
 @click.option("--collections", type=Path, help="Path to a local collections file")
 @click.option("--contexts", type=Path, help="Path to a local contexts file")
 @click.option("--config", type=Path, help="Path to a configuration file")
+@click.option(
+    "--reload-interval",
+    type=float,
+    help="Check the data files for changes this often (in seconds) and reload them without restarting",
+)
 @click.option(
     "--base-url",
     type=str,
@@ -46,17 +52,20 @@ def web(
     contexts: Optional[Path],
     config: Optional[Path],
     base_url: Optional[str],
+    reload_interval: Optional[float],
 ):
     """Run the web application."""
     import uvicorn
 
     from .impl import get_app
-    from ..resource_manager import Manager
+    from .reload import ManagerReloader
+    from ..resource_manager import SNAPSHOT_DATA_PATHS, Manager
 
     if with_gunicorn:
         click.secho("--with-gunicorn is deprecated", fg="yellow")
 
-    manager = Manager(
+    loader = partial(
+        Manager,
         registry=registry,
         metaregistry=metaregistry,
         collections=collections,
@@ -64,6 +73,18 @@ def web(
         # is being able to load custom mismatches necessary?
         base_url=base_url,
     )
+    manager = loader()
+    if reload_interval is None:
+        reloader = None
+    else:
+        # custom files replace the corresponding default ones. The remaining
+        # default files (i.e., the mismatches) are always used
+        custom_paths = (registry, metaregistry, collections, contexts)
+        paths = [
+            *(custom or default for custom, default in zip(custom_paths, SNAPSHOT_DATA_PATHS)),
+            *SNAPSHOT_DATA_PATHS[len(custom_paths) :],
+        ]
+        reloader = ManagerReloader(loader, paths=paths, interval=reload_interval)
     app = get_app(
         manager=manager,
         config=config,
@@ -71,5 +92,6 @@ def web(
         and metaregistry is None
         and collections is None
         and contexts is None,
+        reloader=reloader,
     )
     uvicorn.run(app, host=host, port=int(port), workers=workers)
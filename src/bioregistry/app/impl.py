@@ -16,12 +16,16 @@ from starlette.middleware.wsgi import WSGIMiddleware
 from bioregistry import curie_to_str, resource_manager, version
 
 from .api import api_blueprint
+from .async_api import get_async_router
 from .constants import BIOSCHEMAS
+from .proxies import manager as manager_proxy
 from .ui import ui_blueprint
 
 if TYPE_CHECKING:
     import bioregistry
 
+    from .reload import ManagerReloader
+
 __all__ = [
     "get_app",
 ]
@@ -101,6 +105,7 @@ def get_app(
     config: Union[None, str, Path, Mapping[str, Any]] = None,
     first_party: bool = True,
     return_flask: bool = False,
+    reloader: Optional["ManagerReloader"] = None,
 ):
     """Prepare the flask application.
 
@@ -108,6 +113,8 @@ def get_app(
     :param config: Additional configuration to be passed to the flask application. See below.
     :param first_party: Set to true if deploying the "canonical" bioregistry instance
     :param return_flask: Set to true to get internal flask app
+    :param reloader: If given, is used to swap in a new manager when the data
+        changes. See :mod:`bioregistry.app.reload`.
     :returns: An instantiated WSGI application
     :raises ValueError: if there's an issue with the configuration's integrity
     """
@@ -175,11 +182,17 @@ def get_app(
     app.register_blueprint(api_blueprint)
     app.register_blueprint(ui_blueprint)
 
-    # Make manager available in all jinja templates
-    app.jinja_env.globals.update(manager=app.manager, curie_to_str=curie_to_str)
+    # Make manager available in all jinja templates. This uses the proxy so
+    # it's the same manager as the rest of the request, even after a reload
+    app.jinja_env.globals.update(manager=manager_proxy, curie_to_str=curie_to_str)
+
+    sparql_graph = MappingServiceGraph(converter=app.manager.converter)
+    if reloader is not None:
+        reloader.init_app(app, sparql_graph=sparql_graph)
 
     fast_api = FastAPI()
-    fast_api.include_router(_get_sparql_router(app))
+    fast_api.include_router(_get_sparql_router(app, sparql_graph))
+    fast_api.include_router(get_async_router(app))
     fast_api.mount("/", WSGIMiddleware(app))
     if return_flask:
         return fast_api, app
@@ -196,8 +209,7 @@ SELECT ?s ?o WHERE {
 """.rstrip()
 
 
-def _get_sparql_router(app) -> APIRouter:
-    sparql_graph = MappingServiceGraph(converter=app.manager.converter)
+def _get_sparql_router(app, sparql_graph: MappingServiceGraph) -> APIRouter:
     sparql_processor = MappingServiceSPARQLProcessor(graph=sparql_graph)
     sparql_router = SparqlRouter(
         path="/sparql",
@@ -1,6 +1,6 @@
 """Proxies for the web application."""
 
-from flask import current_app
+from flask import current_app, g, has_request_context
 from werkzeug.local import LocalProxy
 
 from bioregistry.resource_manager import Manager
@@ -9,4 +9,22 @@ __all__ = [
     "manager",
 ]
 
-manager: Manager = LocalProxy(lambda: current_app.manager)
+
+def _get_manager() -> Manager:
+    """Get the app's manager, which stays the same for the whole request.
+
+    :returns: The manager that was the app's manager when it was first used in
+        the current request, or the app's current manager outside of a request
+
+    The app's manager can be swapped by a :class:`bioregistry.app.reload.ManagerReloader`,
+    so it's pinned the first time it's used in a request. This way, a request
+    that's in progress during a reload finishes with the old manager.
+    """
+    if not has_request_context():
+        return current_app.manager
+    if "manager" not in g:
+        g.manager = current_app.manager
+    return g.manager
+
+
+manager: Manager = LocalProxy(_get_manager)
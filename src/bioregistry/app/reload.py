@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+"""Reload the web application's registry without restarting it.
+
+A :class:`ManagerReloader` builds a new :class:`bioregistry.Manager` in a
+background thread, then swaps it into the app. Requests that are in progress
+during the swap finish with the old manager (see :mod:`bioregistry.app.proxies`),
+and the new manager's converter and indexes are built before the swap, so the
+first requests afterwards aren't slower.
+
+A reload can be triggered in two ways:
+
+1. By polling the modification times of the data files every
+   ``interval`` seconds
+2. By a ``POST`` to ``/api/reload`` with an ``Authorization: Bearer <token>``
+   header, when the ``METAREGISTRY_RELOAD_TOKEN`` configuration is set
+
+.. code-block:: python
+
+    from bioregistry.app.impl import get_app
+    from bioregistry.app.reload import ManagerReloader
+
+    app = get_app(reloader=ManagerReloader(interval=60))
+"""
+
+import hmac
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Sequence, Union
+
+from flask import Flask, abort, current_app, jsonify, request
+
+from ..resource_manager import SNAPSHOT_DATA_PATHS, Manager
+
+if TYPE_CHECKING:
+    from curies.mapping_service import MappingServiceGraph
+
+__all__ = [
+    "ManagerReloader",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The key for the reloader in :data:`flask.Flask.extensions`
+EXTENSION_KEY = "bioregistry_reloader"
+
+
+class ManagerReloader:
+    """Builds new managers and swaps them into a web application."""
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], Manager]] = None,
+        paths: Optional[Sequence[Union[str, Path]]] = None,
+        interval: Optional[float] = None,
+    ):
+        """Instantiate the reloader.
+
+        :param loader: A function that builds a new manager. Defaults to
+            :meth:`bioregistry.Manager.from_snapshot`.
+        :param paths: The data files whose modification is checked. Defaults to
+            the files used by the default manager.
+        :param interval: The number of seconds between checks of the data files.
+            If None, the files aren't checked and reloads are only triggered
+            explicitly.
+        """
+        self.loader = loader or Manager.from_snapshot
+        self.paths = [Path(path) for path in (paths or SNAPSHOT_DATA_PATHS)]
+        self.interval = interval
+        self.app: Optional[Flask] = None
+        self.sparql_graph: Optional["MappingServiceGraph"] = None
+        #: The number of managers swapped into the app
+        self.reloads = 0
+        self._mtimes = self._get_mtimes()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def init_app(self, app: Flask, sparql_graph: Optional["MappingServiceGraph"] = None) -> None:
+        """Register the reloader with an app and start checking the data files.
+
+        :param app: The app whose ``manager`` attribute is swapped on reload
+        :param sparql_graph: The SPARQL service's graph, whose converter is swapped
+            at the same time
+        """
+        self.app = app
+        self.sparql_graph = sparql_graph
+        app.extensions[EXTENSION_KEY] = self
+        if app.config.get("METAREGISTRY_RELOAD_TOKEN"):
+            app.add_url_rule("/api/reload", "reload", _reload_view, methods=["POST"])
+        if self.interval is not None:
+            self.start()
+
+    def _get_mtimes(self) -> Dict[Path, float]:
+        return {path: os.stat(path).st_mtime for path in self.paths if path.is_file()}
+
+    def check(self) -> bool:
+        """Reload if any of the data files were modified since the last check.
+
+        :returns: If a new manager was swapped in
+        """
+        mtimes = self._get_mtimes()
+        if mtimes == self._mtimes:
+            return False
+        self._mtimes = mtimes
+        return self.reload() is not None
+
+    def reload(self) -> Optional[Manager]:
+        """Build a new manager and swap it into the app.
+
+        :returns: The new manager, or None if another reload was already in progress
+        :raises RuntimeError: If the reloader hasn't been registered with an app
+        """
+        if self.app is None:
+            raise RuntimeError("the reloader has to be registered with init_app() first")
+        if not self._lock.acquire(blocking=False):
+            logger.info("skipping reload since one is already in progress")
+            return None
+        try:
+            manager = self.loader()
+            # build everything the first requests would need before swapping, so
+            # they aren't slower than usual
+            converter = manager.converter
+            manager.warm_derived_index()
+            manager.get_search_index()
+            manager.get_content_hash()
+            # assigning attributes is atomic, so each request sees one manager or the other
+            self.app.manager = manager
+            if self.sparql_graph is not None:
+                self.sparql_graph.converter = converter
+            self.reloads += 1
+            logger.info("reloaded manager with %d resources", len(manager.registry))
+            return manager
+        finally:
+            self._lock.release()
+
+    def reload_in_background(self) -> threading.Thread:
+        """Run :meth:`reload` in a new thread."""
+        thread = threading.Thread(
+            target=self._reload_logged, name="bioregistry-reload", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _reload_logged(self) -> None:
+        try:
+            self.reload()
+        except Exception:
+            # keep serving the old manager
+            logger.exception("failed to reload manager")
+
+    def start(self) -> None:
+        """Start checking the data files in a background thread."""
+        if self.interval is None:
+            raise ValueError("an interval is required to check the data files")
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="bioregistry-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop checking the data files."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("failed to reload manager")
+
+
+def _reload_view():
+    """Reload the registry in the background.
+
+    ---
+    tags:
+    - admin
+    responses:
+      202:
+        description: The reload was started
+      403:
+        description: The token was missing or wrong
+    """  # noqa:DAR101,DAR201
+    token = current_app.config["METAREGISTRY_RELOAD_TOKEN"]
+    authorization = request.headers.get("Authorization", "")
+    if not hmac.compare_digest(authorization.encode(), f"Bearer {token}".encode()):
+        abort(403)
+    current_app.extensions[EXTENSION_KEY].reload_in_background()
+    return jsonify(status="reloading"), 202
@@ -2,8 +2,8 @@
 
 """Utility functions for the Bioregistry :mod:`flask` app."""
 
-import json
-from functools import partial
+import hashlib
+from functools import partial, wraps
 from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import yaml
@@ -11,6 +11,7 @@ from flask import (
     Response,
     abort,
     current_app,
+    make_response,
     redirect,
     render_template,
     request,
@@ -18,12 +19,12 @@ from flask import (
 )
 from pydantic import BaseModel
 
+from bioregistry import json_utils
 from bioregistry.resource_manager import Manager
 from bioregistry.schema import sanitize_model
-from bioregistry.utils import extended_encoder
+from bioregistry.utils import BoundedCache
 
 from .proxies import manager
-from ..utils import _norm
 
 
 def _get_resource_providers(
@@ -63,17 +64,13 @@ def _normalize_prefix_or_404(prefix: str, endpoint: Optional[str] = None):
     return norm_prefix
 
 
-def _search(manager_: Manager, q: str) -> List[Tuple[str, str]]:
-    q_norm = _norm(q)
-    results = [
-        (prefix, lookup if _norm(prefix) != lookup else "")
-        for lookup, prefix in manager_.synonyms.items()
-        if q_norm in lookup
-    ]
-    return sorted(results)
+def _search(manager_: Manager, q: str, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+    return manager_.get_search_index().search(q, limit=limit)
 
 
-def _autocomplete(manager_: Manager, q: str, url_prefix: Optional[str] = None) -> Mapping[str, Any]:
+def _autocomplete(
+    manager_: Manager, q: str, url_prefix: Optional[str] = None, limit: Optional[int] = None
+) -> Mapping[str, Any]:
     r"""Run the autocomplete algorithm.
 
     :param manager_: A manager
@@ -81,18 +78,19 @@ def _autocomplete(manager_: Manager, q: str, url_prefix: Optional[str] = None) -
     :param url_prefix:
         The explicit URL prefix. If not used, relative paths are generated. Introduced to
         solve https://github.com/biopragmatics/bioregistry/issues/596.
+    :param limit: The maximum number of search results
     :return: A dictionary with the autocomplete results.
 
     Before completion is of prefix:
 
     >>> from bioregistry import manager
     >>> _autocomplete(manager, 'cheb')
-    {'query': 'cheb', 'results': [('chebi', ''), ('chebi', 'chebiid'), ('goche', 'gochebi')], 'success': True, 'reason': 'searched prefix', 'url': None}
+    {'query': 'cheb', 'results': [('chebi', ''), ('chebi', 'chebiid'), ('chiro', 'ChEBI Integrated Role Ontology'), ('goche', 'gochebi')], 'success': True, 'reason': 'searched prefix', 'url': None}
 
     If only prefix is complete:
 
-    >>> _autocomplete(manager, 'chebi')
-    {'query': 'chebi', 'results': [('chebi', ''), ('chebi', 'chebiid'), ('goche', 'gochebi')], 'success': True, 'reason': 'matched prefix', 'url': '/chebi'}
+    >>> _autocomplete(manager, 'chebi', limit=2)
+    {'query': 'chebi', 'results': [('chebi', ''), ('chebi', 'chebiid')], 'success': True, 'reason': 'matched prefix', 'url': '/chebi'}
 
     Not matching the pattern:
 
@@ -118,7 +116,7 @@ def _autocomplete(manager_: Manager, q: str, url_prefix: Optional[str] = None) -
             url = None
         return dict(
             query=q,
-            results=_search(manager_, q),
+            results=_search(manager_, q, limit=limit),
             success=True,
             reason=reason,
             url=url,
@@ -159,12 +157,67 @@ def _autocomplete(manager_: Manager, q: str, url_prefix: Optional[str] = None) -
     )
 
 
+#: The key for the response cache in :data:`flask.Flask.extensions`
+RESPONSE_CACHE_KEY = "bioregistry_response_cache"
+
+
+def _get_response_cache() -> BoundedCache:
+    cache = current_app.extensions.get(RESPONSE_CACHE_KEY)
+    if cache is None:
+        maxsize = current_app.config.get("METAREGISTRY_RESPONSE_CACHE_SIZE", 128)
+        cache = current_app.extensions[RESPONSE_CACHE_KEY] = BoundedCache(maxsize=maxsize)
+    return cache
+
+
+def cached_response(func: Callable[..., Any]) -> Callable[..., Response]:
+    """Cache the responses of a view of the manager's data, and give them strong ETags.
+
+    Responses are cached on the endpoint, its arguments, the query string, the
+    media type negotiated from the ``Accept`` header, and the manager's
+    :meth:`Manager.get_content_hash`, so they're rebuilt whenever the data changes
+    (e.g., after a reload). Since the response can depend on the ``Accept`` header,
+    it's marked with ``Vary: Accept``. Requests with a matching ``If-None-Match``
+    header get an empty 304 response. Only successful responses are cached.
+
+    The size of the cache can be set with the ``METAREGISTRY_RESPONSE_CACHE_SIZE``
+    configuration. It defaults to 128.
+
+    :param func: A view function
+    :returns: The view function, wrapped so its responses are cached
+    """
+
+    @wraps(func)
+    def _wrapped(*args, **kwargs) -> Response:
+        key = (
+            request.endpoint,
+            tuple(sorted((request.view_args or {}).items())),
+            tuple(sorted(request.args.items(multi=True))),
+            _get_accept_header_media_type(),
+            manager.get_content_hash(),
+        )
+        cache = _get_response_cache()
+        cached = cache.lookup(key)
+        if cached is None:
+            response = make_response(func(*args, **kwargs))
+            if response.status_code != 200 or response.is_streamed:
+                return response
+            body = response.get_data()
+            cached = body, response.content_type, hashlib.sha256(body).hexdigest()
+            cache.set(key, cached)
+        body, content_type, etag = cached
+        rv = current_app.response_class(body, content_type=content_type)
+        rv.vary.add("Accept")
+        rv.set_etag(etag)
+        # this modifies the response in place, e.g., to make it a 304
+        rv.make_conditional(request)
+        return rv
+
+    return _wrapped
+
+
 def jsonify(data):
     """Dump data as JSON, like like :func:`flask.jsonify`."""
-    return current_app.response_class(
-        json.dumps(data, ensure_ascii=False, default=extended_encoder),
-        mimetype="application/json",
-    )
+    return current_app.response_class(json_utils.dumps(data), mimetype="application/json")
 
 
 def yamlify(data):
@@ -237,6 +290,10 @@ def get_accept_media_type() -> str:
             return rv
         return abort(400, f"bad query parameter format={fmt}. Should be one of {list(FORMAT_MAP)}")
 
+    return _get_accept_header_media_type()
+
+
+def _get_accept_header_media_type() -> str:
     # If accept is specifically set to one of the special quanties, then use it.
     accept = str(request.accept_mimetypes)
     if accept in FORMAT_MAP.values():
@@ -4,7 +4,17 @@
 
 import click
 
-from . import curie_parsing, curie_validation, uri_parsing
+from . import (
+    compact_memory,
+    curie_parsing,
+    curie_validation,
+    import_time,
+    json_serialization,
+    pandas_processing,
+    rdf_export,
+    shared_index_memory,
+    uri_parsing,
+)
 
 
 @click.command()
@@ -16,6 +26,12 @@ def main(ctx: click.Context, rebuild: bool, replicates: int):
     ctx.invoke(curie_parsing.main, rebuild=rebuild, replicates=replicates)
     ctx.invoke(uri_parsing.main, rebuild=rebuild, replicates=replicates)
     ctx.invoke(curie_validation.main, rebuild=rebuild, replicates=replicates)
+    ctx.invoke(pandas_processing.main)
+    ctx.invoke(import_time.main, replicates=replicates)
+    ctx.invoke(json_serialization.main, replicates=replicates)
+    ctx.invoke(compact_memory.main, replicates=replicates)
+    ctx.invoke(shared_index_memory.main)
+    ctx.invoke(rdf_export.main)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+"""A benchmark for the memory used by the full and compact managers.
+
+Each replicate runs in a fresh interpreter. After importing the modules needed,
+it loads either a full :class:`bioregistry.Manager` from its snapshot (with its
+derived attribute index warmed up, like in the web application) or a
+:class:`bioregistry.CompactManager` from a pickle, then reports the memory
+allocated by Python and the increase in the peak resident set size.
+"""
+
+import pickle
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Tuple
+
+import click
+from tabulate import tabulate
+from tqdm import trange
+
+from bioregistry import Manager
+
+#: The code run in a fresh interpreter for each replicate. The first argument is
+#: either "full" or the path to a pickled compact manager.
+SCRIPT = """\
+import gc, pickle, resource, sys, time, tracemalloc
+from bioregistry.compact import CompactManager
+from bioregistry.resource_manager import Manager
+gc.collect()
+tracemalloc.start()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+if sys.argv[1] == "full":
+    manager = Manager.from_snapshot()
+    manager.warm_derived_index()
+else:
+    with open(sys.argv[1], "rb") as file:
+        manager = pickle.load(file)
+elapsed = time.perf_counter() - start
+assert manager.normalize_curie("GO:GO:0000001") == "go:0000001"
+gc.collect()
+traced, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+print(traced, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss, elapsed)
+"""
+
+#: The units of the peak resident set size reported by :func:`resource.getrusage`
+RSS_UNITS = 1 if sys.platform == "darwin" else 1024
+
+
+def get_usage(argument: str) -> Tuple[float, float, float]:
+    """Get the megabytes allocated, megabytes of peak RSS increase, and seconds to load a manager."""
+    output = subprocess.check_output(  # noqa:S603
+        [sys.executable, "-c", SCRIPT, argument], text=True
+    )
+    traced, rss, elapsed = map(float, output.split())
+    return traced / 1_000_000, rss * RSS_UNITS / 1_000_000, elapsed
+
+
+@click.command()
+@click.option("--replicates", type=int, default=5, show_default=True)
+def main(replicates: int):
+    """Test the memory used by the full and compact managers."""
+    manager = Manager.from_snapshot()
+    results: Dict[str, List[Tuple[float, float, float]]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory).joinpath("compact.pkl")
+        with path.open("wb") as file:
+            pickle.dump(manager.compact(), file, protocol=pickle.HIGHEST_PROTOCOL)
+        for name, argument in [("full", "full"), ("compact", path.as_posix())]:
+            results[name] = [
+                get_usage(argument)
+                for _ in trange(replicates, desc=f"Loading {name}", unit="replicate", leave=False)
+            ]
+
+    click.echo(f"Bioregistry Manager Memory Benchmark ({replicates} replicates)\n")
+    click.echo(
+        tabulate(
+            [
+                (
+                    name,
+                    median(traced for traced, _, _ in rows),
+                    median(rss for _, rss, _ in rows),
+                    median(elapsed for _, _, elapsed in rows),
+                )
+                for name, rows in results.items()
+            ],
+            headers=["manager", "allocated (MB)", "peak RSS increase (MB)", "load time (s)"],
+            floatfmt=".2f",
+            tablefmt="github",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
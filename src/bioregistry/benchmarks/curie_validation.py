@@ -1,7 +1,9 @@
 """A benchmark for Bioregistry's CURIE validator."""
 
 import random
+import re
 import time
+from statistics import mean
 from typing import Iterable, Tuple
 
 import click
@@ -59,6 +61,40 @@ def iter_curies() -> Iterable[Tuple[str, str, str, str]]:
                     yield prefix, example_extended, "false", curie_to_str(synonym, example_extended)
 
 
+def is_valid_curie_uncompiled(curie: str) -> bool:
+    """Validate a CURIE, deriving and compiling its pattern on every call.
+
+    :param curie: A CURIE
+    :returns: If the CURIE's prefix is in the Bioregistry and its identifier
+        matches the prefix's pattern (or the prefix has no pattern)
+
+    This reproduces how validation worked before the manager kept an index
+    of compiled patterns, and is used as a point of comparison.
+    """
+    try:
+        prefix, identifier = curie.split(":", 1)
+    except ValueError:
+        return False
+    resource = manager.registry.get(prefix)
+    if resource is None:
+        return False
+    pattern = resource.get_pattern()
+    if pattern is None:
+        return True
+    return re.compile(pattern).fullmatch(identifier) is not None
+
+
+def _get_throughput(curies, func, replicates: int) -> float:
+    """Get the average number of CURIEs validated per second."""
+    durations = []
+    for _ in trange(replicates, desc=f"Timing {func.__name__}", unit="replicate", leave=False):
+        start = time.time()
+        for *_, curie in curies:
+            func(curie)
+        durations.append(time.time() - start)
+    return len(curies) / mean(durations)
+
+
 @click.command()
 @click.option("--rebuild", is_flag=True)
 @click.option("--replicates", type=int, default=10)
@@ -103,6 +139,13 @@ def main(rebuild: bool, replicates: int):
     )
     click.echo(title)
 
+    indexed = _get_throughput(curies, bioregistry.is_valid_curie, replicates)
+    uncompiled = _get_throughput(curies, is_valid_curie_uncompiled, replicates)
+    click.echo(
+        f"Throughput with pattern index: {round(indexed):,} CURIE/s, "
+        f"without: {round(uncompiled):,} CURIE/s ({indexed / uncompiled:.1f}x)"
+    )
+
     fig, ax = plt.subplots()
     sns.histplot(data=df[df["time"] > 0], x="time", hue="label", ax=ax, log_scale=True)
     ax.axvline(m)
@@ -0,0 +1,73 @@
+"""A benchmark for how long it takes to import the Bioregistry.
+
+Each replicate runs in a fresh interpreter, so nothing is already imported.
+It times ``import bioregistry`` and then the first lookup, which loads the
+data. The benchmark fails if the median import time goes over the threshold.
+"""
+
+import subprocess
+import sys
+from statistics import median
+from typing import List, Tuple
+
+import click
+from tabulate import tabulate
+from tqdm import trange
+
+#: The code run in a fresh interpreter for each replicate
+SCRIPT = """\
+import time
+start = time.perf_counter()
+import bioregistry
+imported = time.perf_counter()
+bioregistry.normalize_prefix("GO")
+used = time.perf_counter()
+print(imported - start, used - imported)
+"""
+
+
+def get_times() -> Tuple[float, float]:
+    """Get the time to import the Bioregistry and the time for its first lookup in a new interpreter."""
+    output = subprocess.check_output([sys.executable, "-c", SCRIPT], text=True)  # noqa:S603
+    import_time, first_use_time = map(float, output.split())
+    return import_time, first_use_time
+
+
+@click.command()
+@click.option("--replicates", type=int, default=10, show_default=True)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.1,
+    show_default=True,
+    help="The maximum acceptable median import time, in seconds",
+)
+def main(replicates: int, threshold: float):
+    """Test the time it takes to import the Bioregistry."""
+    import_times: List[float] = []
+    first_use_times: List[float] = []
+    for _ in trange(replicates, desc="Importing", unit="replicate", leave=False):
+        import_time, first_use_time = get_times()
+        import_times.append(import_time)
+        first_use_times.append(first_use_time)
+
+    click.echo(f"Bioregistry Import Time Benchmark ({replicates} replicates)\n")
+    click.echo(
+        tabulate(
+            [
+                ("import bioregistry", median(import_times), max(import_times)),
+                ("first lookup", median(first_use_times), max(first_use_times)),
+            ],
+            headers=["step", "median (s)", "max (s)"],
+            floatfmt=".4f",
+            tablefmt="github",
+        )
+    )
+    if median(import_times) > threshold:
+        raise click.ClickException(
+            f"median import time {median(import_times):.4f}s is over the threshold {threshold}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
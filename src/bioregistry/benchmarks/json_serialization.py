@@ -0,0 +1,112 @@
+"""A benchmark for the JSON serialization backends in :mod:`bioregistry.json_utils`.
+
+For each backend that's installed, this times serving ``/api/registry``
+(with the response cache turned off) and writing the registry with
+:func:`bioregistry.schema_utils.write_registry`, and checks that each backend
+writes the same registry file as the standard library.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+from typing import Callable, List
+
+import click
+from tabulate import tabulate
+from tqdm import tqdm
+
+from bioregistry import json_utils, manager
+from bioregistry.app.impl import get_app
+from bioregistry.schema_utils import write_registry
+
+#: The environment variable read by :func:`bioregistry.json_utils.get_backend`
+BACKEND_VARIABLE = "BIOREGISTRY_JSON_BACKEND"
+
+
+def _set_backend(backend: str) -> None:
+    os.environ[BACKEND_VARIABLE] = backend
+    json_utils.get_backend.cache_clear()
+
+
+def _median_time(func: Callable[[], None], replicates: int) -> float:
+    times = []
+    for _ in range(replicates):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return median(times)
+
+
+@click.command()
+@click.option("--replicates", type=int, default=10, show_default=True)
+def main(replicates: int):
+    """Test the throughput of each JSON serialization backend."""
+    backends: List[str] = []
+    for backend in json_utils.BACKENDS:
+        try:
+            json_utils.dumps(None, backend=backend)
+        except ImportError:
+            continue
+        backends.append(backend)
+
+    _, app = get_app(config={"METAREGISTRY_RESPONSE_CACHE_SIZE": 0}, return_flask=True)
+    client = app.test_client()
+    megabytes = len(json_utils.dumps(manager.registry, backend="json")) / 1_000_000
+
+    original = os.environ.get(BACKEND_VARIABLE)
+    table = []
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        expected_path = Path(directory).joinpath("expected.json")
+        path = Path(directory).joinpath("bioregistry.json")
+        write_registry(manager.registry, path=expected_path)
+        try:
+            for backend in tqdm(backends, desc="Benchmarking", unit="backend", leave=False):
+                _set_backend(backend)
+                api_time = _median_time(lambda: client.get("/api/registry"), replicates)
+                write_time = _median_time(
+                    lambda: write_registry(manager.registry, path=path), replicates
+                )
+                if path.read_bytes() != expected_path.read_bytes():
+                    failures.append(backend)
+                table.append(
+                    (
+                        backend,
+                        api_time * 1000,
+                        megabytes / api_time,
+                        write_time * 1000,
+                        megabytes / write_time,
+                    )
+                )
+        finally:
+            if original is None:
+                os.environ.pop(BACKEND_VARIABLE, None)
+            else:
+                os.environ[BACKEND_VARIABLE] = original
+            json_utils.get_backend.cache_clear()
+
+    click.echo(
+        f"Bioregistry JSON Serialization Benchmark ({megabytes:.1f} MB, {replicates} replicates)\n"
+    )
+    click.echo(
+        tabulate(
+            table,
+            headers=[
+                "backend",
+                "/api/registry (ms)",
+                "/api/registry (MB/s)",
+                "write_registry (ms)",
+                "write_registry (MB/s)",
+            ],
+            floatfmt=".1f",
+            tablefmt="github",
+        )
+    )
+    if failures:
+        raise click.ClickException(f"output differed from the standard library: {failures}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""A benchmark for Bioregistry's :mod:`pandas` utilities.
+
+This compares the implementations in :mod:`bioregistry.pandas`, which process
+rows in groups by prefix, against the row-wise implementations they replaced,
+and checks that both give the same results.
+"""
+
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+import click
+import pandas as pd
+from tabulate import tabulate
+from tqdm import tqdm
+
+import bioregistry
+import bioregistry.pandas as brpd
+from bioregistry import manager
+
+#: Columns of the frame built by :func:`get_frame`, mirroring the GAF columns
+#: used in the examples in :mod:`bioregistry.pandas`
+COLUMNS = ["prefix", "identifier", "curie"]
+
+
+def get_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Get a frame of prefixes, identifiers, and CURIEs sampled from the Bioregistry's examples."""
+    examples: List[Tuple[str, str, str]] = []
+    for prefix, resource in tqdm(
+        manager.registry.items(), desc="Generating test rows", unit="prefix", leave=False
+    ):
+        example = resource.get_example()
+        if not example:
+            continue
+        for synonym in {prefix, resource.get_preferred_prefix() or prefix, prefix.upper()}:
+            examples.append((synonym, example, f"{synonym}:{example}"))
+        banana = resource.get_banana()
+        if banana:
+            banana_example = f"{banana}{resource.get_banana_peel()}{example}"
+            examples.append((prefix, banana_example, f"{prefix}:{banana_example}"))
+        examples.append((prefix, f"{example}!", f"{prefix}:{example}!"))
+    examples.append(("nopenope", "0000001", "nopenope:0000001"))
+    random.seed(seed)
+    return pd.DataFrame(random.choices(examples, k=rows), columns=COLUMNS)
+
+
+def _rowwise_validate_identifiers(df: pd.DataFrame) -> pd.Series:
+    patterns = {prefix: manager.get_pattern_re(prefix) for prefix in df["prefix"].unique()}
+    rv = []
+    for prefix, identifier in df[["prefix", "identifier"]].values:
+        pattern = patterns[prefix]
+        rv.append(None if pattern is None else bool(pattern.fullmatch(identifier)))
+    return pd.Series(rv, index=df.index)
+
+
+def _rowwise_identifiers_to_curies(df: pd.DataFrame) -> pd.Series:
+    prefixes = df["prefix"].map(bioregistry.normalize_prefix)
+    return pd.Series(
+        [
+            bioregistry.curie_to_str(prefix, identifier) if prefix is not None else None
+            for prefix, identifier in zip(prefixes, df["identifier"])
+        ],
+        index=df.index,
+    )
+
+
+def _grouped_identifiers_to_curies(df: pd.DataFrame) -> pd.Series:
+    df = df.copy()
+    brpd.identifiers_to_curies(df, "identifier", prefix_column="prefix")
+    return df["identifier"]
+
+
+def _grouped_normalize_curies(df: pd.DataFrame) -> pd.Series:
+    brpd.normalize_curies(df, "curie", target_column="result")
+    return df.pop("result")
+
+
+def _grouped_curies_to_iris(df: pd.DataFrame) -> pd.Series:
+    brpd.curies_to_iris(df, "curie", target_column="result")
+    return df.pop("result")
+
+
+#: Pairs of row-wise and grouped implementations for each function
+IMPLEMENTATIONS: Dict[str, Tuple[Callable[[pd.DataFrame], pd.Series], ...]] = {
+    "validate_identifiers": (
+        _rowwise_validate_identifiers,
+        lambda df: brpd.validate_identifiers(df, "identifier", prefix_column="prefix"),
+    ),
+    "identifiers_to_curies": (
+        _rowwise_identifiers_to_curies,
+        _grouped_identifiers_to_curies,
+    ),
+    "normalize_curies": (
+        lambda df: df["curie"].map(bioregistry.normalize_curie),
+        _grouped_normalize_curies,
+    ),
+    "curies_to_iris": (
+        lambda df: df["curie"].map(bioregistry.get_iri),
+        _grouped_curies_to_iris,
+    ),
+}
+
+
+def _time(func: Callable[[pd.DataFrame], pd.Series], df: pd.DataFrame) -> Tuple[float, pd.Series]:
+    start = time.time()
+    rv = func(df)
+    return time.time() - start, rv
+
+
+@click.command()
+@click.option("--rows", type=int, default=200_000, show_default=True)
+@click.option("--goa", is_flag=True, help="Use the GOA example instead of generated rows")
+def main(rows: int, goa: bool):
+    """Test processing dataframes."""
+    if goa:
+        df = brpd.get_goa_example()
+        df = pd.DataFrame({"prefix": df[0], "identifier": df[1], "curie": df[4]})
+    else:
+        df = get_frame(rows)
+
+    # warm up caches
+    manager.validate_curies(df["curie"].unique())
+
+    table = []
+    failures = 0
+    for name, (rowwise, grouped) in IMPLEMENTATIONS.items():
+        rowwise_time, expected = _time(rowwise, df)
+        grouped_time, actual = _time(grouped, df)
+        mismatches = int((expected.fillna("") != actual.fillna("")).sum())
+        failures += mismatches
+        table.append(
+            (
+                name,
+                f"{len(df.index) / rowwise_time:,.0f}",
+                f"{len(df.index) / grouped_time:,.0f}",
+                f"{rowwise_time / grouped_time:.1f}x",
+                mismatches,
+            )
+        )
+
+    click.echo(f"Bioregistry Pandas Benchmark on {len(df.index):,} rows\n")
+    click.echo(
+        tabulate(
+            table,
+            headers=["function", "row-wise (rows/s)", "grouped (rows/s)", "speedup", "errors"],
+            tablefmt="github",
+        )
+    )
+    if failures:
+        raise click.ClickException(f"grouped results differed from row-wise in {failures} rows")
+
+
+if __name__ == "__main__":
+    main()
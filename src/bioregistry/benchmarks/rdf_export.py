@@ -0,0 +1,105 @@
+"""A benchmark for exporting the full Bioregistry as RDF with :mod:`rdflib` and as a stream.
+
+Each replicate runs in a fresh interpreter. After loading the manager, it writes
+either N-Triples or Turtle, either by building an :class:`rdflib.Graph` with
+:func:`bioregistry.export.rdf_export.get_full_rdf` and serializing it, or with
+the streaming writers in :mod:`bioregistry.export.rdf_stream`. The time is measured
+separately from the peak memory allocated by Python, since tracing allocations
+makes the export slower.
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Tuple
+
+import click
+from tabulate import tabulate
+from tqdm import tqdm
+
+#: The code run in a fresh interpreter for each replicate. The arguments are the
+#: method, the format, the path to write to, and what to measure.
+SCRIPT = """\
+import gc, itertools, sys, time, tracemalloc
+from bioregistry import manager
+from bioregistry.export.rdf_export import get_full_namespaces, get_full_rdf, iter_full_rdf_chunks
+from bioregistry.export.rdf_stream import write_ntriples, write_turtle
+method, fmt, path, measure = sys.argv[1:]
+manager.registry
+gc.collect()
+if measure == "memory":
+    tracemalloc.start()
+start = time.perf_counter()
+if method == "rdflib":
+    get_full_rdf(manager).serialize(path, format=fmt, encoding="utf-8")
+else:
+    with open(path, "w", encoding="utf-8") as file:
+        if fmt == "nt":
+            write_ntriples(itertools.chain.from_iterable(iter_full_rdf_chunks(manager)), file)
+        else:
+            write_turtle(iter_full_rdf_chunks(manager), file, get_full_namespaces(manager))
+elapsed = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1] if measure == "memory" else 0
+print(elapsed, peak)
+"""
+
+#: Pairs of methods and formats that are compared
+CASES = [
+    ("rdflib", "nt"),
+    ("stream", "nt"),
+    ("rdflib", "turtle"),
+    ("stream", "turtle"),
+]
+
+
+def _run(method: str, fmt: str, path: Path, measure: str) -> Tuple[float, float]:
+    output = subprocess.check_output(  # noqa:S603
+        [sys.executable, "-c", SCRIPT, method, fmt, path.as_posix(), measure], text=True
+    )
+    elapsed, peak = map(float, output.split())
+    return elapsed, peak
+
+
+def get_usage(method: str, fmt: str, path: Path) -> Tuple[float, float]:
+    """Get the seconds and the peak megabytes allocated to write the full RDF."""
+    elapsed, _ = _run(method, fmt, path, "time")
+    _, peak = _run(method, fmt, path, "memory")
+    return elapsed, peak / 1_000_000
+
+
+@click.command()
+@click.option("--replicates", type=int, default=3, show_default=True)
+def main(replicates: int):
+    """Test the time and memory used to export the full RDF."""
+    results: Dict[Tuple[str, str], List[Tuple[float, float]]] = {}
+    sizes: Dict[Tuple[str, str], float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for method, fmt in tqdm(CASES, desc="Exporting", unit="case", leave=False):
+            path = Path(directory).joinpath(f"{method}.{fmt}")
+            results[method, fmt] = [get_usage(method, fmt, path) for _ in range(replicates)]
+            sizes[method, fmt] = path.stat().st_size / 1_000_000
+
+    click.echo(f"Bioregistry RDF Export Benchmark ({replicates} replicates)\n")
+    click.echo(
+        tabulate(
+            [
+                (
+                    method,
+                    fmt,
+                    median(elapsed for elapsed, _ in rows),
+                    median(peak for _, peak in rows),
+                    sizes[method, fmt],
+                )
+                for (method, fmt), rows in results.items()
+            ],
+            headers=["method", "format", "time (s)", "peak allocated (MB)", "size (MB)"],
+            floatfmt=".2f",
+            tablefmt="github",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
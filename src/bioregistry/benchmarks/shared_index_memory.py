@@ -0,0 +1,138 @@
+"""A benchmark for the memory used by worker processes with and without a shared index.
+
+This starts several worker processes at the same time, like a web server would.
+Each either loads a full :class:`bioregistry.Manager` and builds its converter,
+or uses a lazy manager with a memory-mapped shared index (see
+:mod:`bioregistry.shared_index`). Then, each looks up all synonyms, patterns,
+URI format strings, and a URI for each URI prefix.
+
+Once all workers are done, each reports its resident set size (RSS), its
+proportional set size (PSS, where shared pages are divided between the processes
+sharing them), and its unique set size (USS, the pages only it uses). This needs
+the ``/proc`` file system, so it only runs on Linux.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from typing import Dict, List
+
+import click
+from tabulate import tabulate
+from tqdm import tqdm
+
+from bioregistry import Manager
+
+#: The path to the memory statistics of the current process
+SMAPS_ROLLUP = Path("/proc/self/smaps_rollup")
+
+#: The code run in each worker. The arguments are the mode ("full" or "shared"),
+#: the path to the shared index, and the path to the queries.
+SCRIPT = """\
+import gc, json, sys
+from bioregistry.resource_manager import Manager
+mode, index_path, queries_path = sys.argv[1:]
+if mode == "full":
+    manager = Manager.from_snapshot()
+    manager.converter
+else:
+    manager = Manager.lazy()
+    manager.use_shared_index(index_path)
+with open(queries_path) as file:
+    queries = json.load(file)
+for prefix in queries["prefixes"]:
+    manager.normalize_prefix(prefix)
+    manager.get_pattern(prefix)
+    manager.get_uri_format(prefix)
+for uri in queries["uris"]:
+    manager.parse_uri(uri)
+del queries
+gc.collect()
+print("ready", flush=True)
+sys.stdin.readline()
+rv = {}
+with open("/proc/self/smaps_rollup") as file:
+    for line in file:
+        key, _, value = line.partition(":")
+        if value.strip().endswith("kB"):
+            rv[key] = int(value.split()[0])
+print(json.dumps(rv), flush=True)
+"""
+
+
+def _run_workers(mode: str, workers: int, index_path: Path, queries_path: Path) -> List[Dict]:
+    processes = [
+        subprocess.Popen(  # noqa:S603
+            [sys.executable, "-c", SCRIPT, mode, index_path.as_posix(), queries_path.as_posix()],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(workers)
+    ]
+    # measure once all workers are running, so shared pages are counted correctly
+    for process in tqdm(processes, desc=f"Starting {mode} workers", unit="worker", leave=False):
+        if process.stdout.readline().strip() != "ready":  # type: ignore
+            raise click.ClickException(f"a {mode} worker failed")
+    rv = []
+    for process in processes:
+        output, _ = process.communicate("\n")
+        rv.append(json.loads(output))
+    return rv
+
+
+@click.command()
+@click.option("--workers", type=int, default=4, show_default=True)
+def main(workers: int):
+    """Test the memory used by workers with and without a shared index."""
+    if not SMAPS_ROLLUP.is_file():
+        raise click.ClickException("this benchmark needs /proc/self/smaps_rollup")
+    manager = Manager.from_snapshot()
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        index_path = Path(directory).joinpath("bioregistry.idx")
+        manager.write_shared_index(index_path)
+        queries_path = Path(directory).joinpath("queries.json")
+        queries_path.write_text(
+            json.dumps(
+                {
+                    "prefixes": sorted(manager.synonyms),
+                    "uris": [
+                        f"{uri_prefix}1234" for uri_prefix in manager.converter.reverse_prefix_map
+                    ],
+                }
+            )
+        )
+        index_megabytes = index_path.stat().st_size / 1_000_000
+        for mode in ["full", "shared"]:
+            results = _run_workers(mode, workers, index_path, queries_path)
+            uss = [result["Private_Clean"] + result["Private_Dirty"] for result in results]
+            rows.append(
+                (
+                    mode,
+                    median(result["Rss"] for result in results) / 1000,
+                    median(result["Pss"] for result in results) / 1000,
+                    median(uss) / 1000,
+                    sum(result["Pss"] for result in results) / 1000,
+                )
+            )
+
+    click.echo(
+        f"Bioregistry Shared Index Memory Benchmark ({workers} workers, "
+        f"{index_megabytes:.1f} MB index)\n"
+    )
+    click.echo(
+        tabulate(
+            rows,
+            headers=["manager", "RSS (MB)", "PSS (MB)", "USS (MB)", "total PSS (MB)"],
+            floatfmt=".1f",
+            tablefmt="github",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
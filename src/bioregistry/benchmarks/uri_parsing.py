@@ -1,8 +1,9 @@
 """A benchmark for Bioregistry's URI parser."""
 
 import time
+import warnings
 from statistics import mean
-from typing import Iterable, Tuple
+from typing import Callable, Iterable, List, Sequence, Tuple, Union
 
 import click
 import matplotlib.pyplot as plt
@@ -12,6 +13,7 @@ from tqdm import tqdm, trange
 import bioregistry
 from bioregistry import manager
 from bioregistry.constants import URI_PARSING_DATA_PATH, URI_PARSING_SVG_PATH
+from bioregistry.parse_iri import _parse_iri, ensure_prefix_list, ensure_prefix_trie
 
 
 def get_uris(rebuild: bool = True):
@@ -40,6 +42,40 @@ def iter_uris() -> Iterable[Tuple[str, str, str, str]]:
                     yield prefix, extra_example, metaprefix, url
 
 
+def parse_iri_linear(
+    iri: str, prefix_list: List[Tuple[str, str]]
+) -> Union[Tuple[str, str], Tuple[None, None]]:
+    """Parse an IRI with a linear scan over the prefix list, as done before the trie."""
+    for prefix, prefix_url in prefix_list:
+        if iri.startswith(prefix_url):
+            return prefix, iri[len(prefix_url) :]
+    return None, None
+
+
+def _get_throughput(urls: Sequence[str], func: Callable[[str], object]) -> float:
+    start = time.time()
+    for url in urls:
+        func(url)
+    return len(urls) / (time.time() - start)
+
+
+def compare_custom_prefix_map(urls: Sequence[str]) -> None:
+    """Compare parsing with a custom prefix map with a linear scan and with a trie."""
+    prefix_list = ensure_prefix_list()
+    prefix_trie = ensure_prefix_trie()
+    linear_results = [parse_iri_linear(url, prefix_list) for url in urls]
+    trie_results = [prefix_trie.parse_uri(url) for url in urls]
+    differences = sum(a != b for a, b in zip(linear_results, trie_results))
+    click.echo(
+        f"Custom prefix map ({len(prefix_list):,} URI prefixes):\n"
+        f"  linear scan: {_get_throughput(urls, lambda url: parse_iri_linear(url, prefix_list)):,.0f} URI/s\n"
+        f"  trie:        {_get_throughput(urls, prefix_trie.parse_uri):,.0f} URI/s\n"
+        f"  full parse_iri with trie: "
+        f"{_get_throughput(urls, lambda url: _parse_iri(url, prefix_trie)):,.0f} URI/s\n"
+        f"  {differences:,} URIs matched a longer URI prefix with the trie than with the scan"
+    )
+
+
 @click.command()
 @click.option("--rebuild", is_flag=True)
 @click.option("--replicates", type=int, default=10)
@@ -67,6 +103,10 @@ def main(rebuild: bool, replicates: int):
     ax.set_title(title)
     fig.savefig(URI_PARSING_SVG_PATH)
 
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        compare_custom_prefix_map([url for _, _, _, url in uris])
+
 
 if __name__ == "__main__":
     main()
@@ -3,6 +3,7 @@
 """Command line interface for the bioregistry."""
 
 import sys
+from typing import Optional
 
 import click
 
@@ -10,7 +11,8 @@ from .app.cli import web
 from .compare import compare
 from .export.cli import export
 from .lint import lint
-from .utils import OLSBroken, get_hexdigests, secho
+from .normalize_file import normalize_file
+from .utils import get_hexdigests, secho
 from .version import VERSION
 
 
@@ -43,10 +45,23 @@ def download():
 @click.option("--skip-re3data", is_flag=True)
 @click.option("--skip-slow", is_flag=True)
 @click.option("--no-force", is_flag=True)
-def align(skip_fairsharing: bool, skip_re3data: bool, skip_slow: bool, no_force: bool):
+@click.option("--workers", type=int, help="the number of sources that are got at the same time")
+@click.option(
+    "--threads",
+    is_flag=True,
+    help="if set, get the sources in threads instead of processes",
+)
+def align(
+    skip_fairsharing: bool,
+    skip_re3data: bool,
+    skip_slow: bool,
+    no_force: bool,
+    workers: Optional[int],
+    threads: bool,
+):
     """Align all external registries."""
     try:
-        from .align import aligner_resolver
+        from .align import align_all, aligner_resolver, get_timing_table
     except ImportError:
         click.secho(
             "Could not import alignment dependencies."
@@ -62,14 +77,20 @@ def align(skip_fairsharing: bool, skip_re3data: bool, skip_slow: bool, no_force:
         skip.add("fairsharing")
     if skip_re3data or skip_slow:
         skip.add("re3data")
-    for aligner_cls in aligner_resolver:
-        if aligner_cls.key in skip:
-            continue
-        secho(f"Aligning {aligner_cls.key}")
-        try:
-            aligner_cls.align(force_download=not no_force)
-        except (IOError, OLSBroken) as e:
-            secho(f"Failed to align {aligner_cls.key}: {e}", fg="red")
+    aligner_classes = [
+        aligner_cls for aligner_cls in aligner_resolver if aligner_cls.key not in skip
+    ]
+    secho(f"Aligning {len(aligner_classes)} external registries")
+    timings = align_all(
+        aligner_classes,
+        force_download=not no_force,
+        workers=workers,
+        processes=not threads,
+    )
+    for timing in timings:
+        if timing.error:
+            secho(f"Failed to align {timing.key}: {timing.error}", fg="red")
+    click.echo(get_timing_table(timings))
 
     if pre_digests != get_hexdigests():
         secho("Alignment created updates", fg="green")
@@ -80,6 +101,7 @@ main.add_command(lint)
 main.add_command(compare)
 main.add_command(export)
 main.add_command(web)
+main.add_command(normalize_file)
 
 
 @main.command()
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""Compact, read-only views of the registry for resolving prefixes and CURIEs.
+
+Each :class:`bioregistry.Resource` is a full :mod:`pydantic` model with dozens
+of fields and the metadata imported from each external registry, but resolving
+prefixes and validating identifiers only needs a few of them. A
+:class:`ResourceView` holds just those, already resolved the same way as in
+:meth:`bioregistry.Manager.rasterized_resource`, in a tuple without a per-instance
+dictionary. A :class:`CompactManager` answers the most common lookups with
+the same results as :class:`bioregistry.Manager`, using only the views and the
+synonym index, so it takes a fraction of the memory. This makes it a good fit
+for worker processes that only resolve CURIEs.
+
+.. code-block:: python
+
+    import pickle
+
+    from bioregistry import manager
+
+    compact_manager = manager.compact()
+    assert compact_manager.normalize_curie("GO:0000001") == "go:0000001"
+
+    # compact managers can be pickled and loaded without loading the full registry
+    with open("compact.pkl", "wb") as file:
+        pickle.dump(compact_manager, file)
+"""
+
+from typing import Dict, Mapping, NamedTuple, Optional, Pattern, Tuple, Union
+
+from .schema import Resource
+from .schema.struct import _compile_pattern, _standardize_identifier
+from .utils import NormDict, curie_to_str
+
+__all__ = [
+    "ResourceView",
+    "CompactManager",
+]
+
+
+class ResourceView(NamedTuple):
+    """The fields of a resource needed to resolve its prefix and identifiers.
+
+    >>> from bioregistry import get_resource
+    >>> view = ResourceView.from_resource(get_resource("go"))
+    >>> view.banana
+    'GO'
+    >>> view.standardize_identifier("GO:0000001")
+    '0000001'
+    >>> view.get_uri("0000001")
+    'http://amigo.geneontology.org/amigo/term/GO:0000001'
+    """
+
+    #: The canonical prefix
+    prefix: str
+    #: The name, see :meth:`bioregistry.Resource.get_name`
+    name: Optional[str]
+    #: The preferred prefix, see :meth:`bioregistry.Resource.get_preferred_prefix`
+    preferred_prefix: Optional[str]
+    #: The regular expression for identifiers, see :meth:`bioregistry.Resource.get_pattern`
+    pattern: Optional[str]
+    #: The URI format string, see :meth:`bioregistry.Resource.get_uri_format`
+    uri_format: Optional[str]
+    #: The URI prefix, see :meth:`bioregistry.Resource.get_uri_prefix`
+    uri_prefix: Optional[str]
+    #: The redundant prefix in identifiers, see :meth:`bioregistry.Resource.get_banana`
+    banana: Optional[str]
+    #: The delimiter after the banana, see :meth:`bioregistry.Resource.get_banana_peel`
+    banana_peel: str
+    #: An example identifier, see :meth:`bioregistry.Resource.get_example`
+    example: Optional[str]
+    #: The synonyms of the prefix, sorted
+    synonyms: Tuple[str, ...]
+    #: Is the resource deprecated? See :meth:`bioregistry.Resource.is_deprecated`
+    deprecated: bool
+
+    @classmethod
+    def from_resource(cls, resource: Resource) -> "ResourceView":
+        """Get the view of a resource.
+
+        :param resource: A resource, which can be a rasterized one from
+            :meth:`bioregistry.Manager.rasterized_resource`
+        :returns: A view with the values resolved the same way as in a rasterized resource
+        """
+        return cls(
+            prefix=resource.prefix,
+            name=resource.get_name(),
+            preferred_prefix=resource.get_preferred_prefix(),
+            pattern=resource.get_pattern(),
+            uri_format=resource.get_uri_format(),
+            uri_prefix=resource.get_uri_prefix(),
+            banana=resource.get_banana(),
+            banana_peel=resource.get_banana_peel(),
+            example=resource.get_example(),
+            synonyms=tuple(sorted(resource.get_synonyms())),
+            deprecated=resource.is_deprecated(),
+        )
+
+    def get_pattern_re(self) -> Optional[Pattern[str]]:
+        """Get the compiled pattern, if it's available."""
+        if self.pattern is None:
+            return None
+        return _compile_pattern(self.pattern)
+
+    def standardize_identifier(self, identifier: str) -> str:
+        """Remove the banana or redundant prefix from an identifier, if present."""
+        return _standardize_identifier(
+            identifier, prefix=self.prefix, banana=self.banana, peel=self.banana_peel
+        )
+
+    def is_valid_identifier(self, identifier: str) -> bool:
+        """Check if the identifier matches the pattern, if there is one."""
+        pattern = self.get_pattern_re()
+        if pattern is None:
+            return True
+        return pattern.fullmatch(identifier) is not None
+
+    def get_uri(self, identifier: str) -> Optional[str]:
+        """Get the URI for an identifier with the URI format string, if it's available."""
+        if self.uri_format is None:
+            return None
+        return self.uri_format.replace("$1", identifier)
+
+
+class CompactManager:
+    """A read-only manager for resolving prefixes and CURIEs using resource views.
+
+    Get one with :meth:`bioregistry.Manager.compact`. Its methods give the same
+    results as the methods of :class:`bioregistry.Manager` with the same names.
+    """
+
+    def __init__(self, views: Mapping[str, ResourceView], synonyms: Mapping[str, str]):
+        """Instantiate a compact manager.
+
+        :param views: A mapping from canonical prefixes to resource views
+        :param synonyms: A mapping from synonyms to canonical prefixes, like
+            :data:`bioregistry.Manager.synonyms`. If it's not already a
+            :class:`bioregistry.utils.NormDict`, its keys are normalized.
+        """
+        self.views: Dict[str, ResourceView] = dict(views)
+        if isinstance(synonyms, NormDict):
+            self.synonyms = NormDict(synonyms)
+        else:
+            self.synonyms = NormDict()
+            for synonym, prefix in synonyms.items():
+                self.synonyms[synonym] = prefix
+
+    def __len__(self) -> int:
+        """Get the number of resources."""
+        return len(self.views)
+
+    def normalize_prefix(self, prefix: str) -> Optional[str]:
+        """Get the normalized prefix, or return None if not registered."""
+        return self.synonyms.get(prefix)
+
+    def get_resource_view(self, prefix: str) -> Optional[ResourceView]:
+        """Get the view of the resource for the given prefix, which is normalized first."""
+        norm_prefix = self.synonyms.get(prefix)
+        if norm_prefix is None:
+            return None
+        return self.views.get(norm_prefix)
+
+    def parse_curie(self, curie: str, sep: str = ":") -> Union[Tuple[str, str], Tuple[None, None]]:
+        """Parse a CURIE and normalize its prefix and identifier."""
+        try:
+            prefix, identifier = curie.split(sep, 1)
+        except ValueError:
+            return None, None
+        return self.normalize_parsed_curie(prefix, identifier)
+
+    def normalize_curie(self, curie: str, sep: str = ":") -> Optional[str]:
+        """Normalize the prefix and identifier in the CURIE."""
+        prefix, identifier = self.parse_curie(curie, sep=sep)
+        if prefix is None or identifier is None:
+            return None
+        return curie_to_str(prefix, identifier)
+
+    def normalize_parsed_curie(
+        self, prefix: str, identifier: str
+    ) -> Union[Tuple[str, str], Tuple[None, None]]:
+        """Normalize a prefix/identifier pair."""
+        view = self.get_resource_view(prefix)
+        if view is None:
+            return None, None
+        return view.prefix, view.standardize_identifier(identifier)
+
+    def get_name(self, prefix: str) -> Optional[str]:
+        """Get the name for the given prefix, it it's available."""
+        view = self.get_resource_view(prefix)
+        return None if view is None else view.name
+
+    def get_preferred_prefix(self, prefix: str) -> Optional[str]:
+        """Get the preferred prefix (e.g., with stylization) if it exists."""
+        view = self.get_resource_view(prefix)
+        return None if view is None else view.preferred_prefix
+
+    def get_pattern(self, prefix: str) -> Optional[str]:
+        """Get the pattern for the given prefix, if it's available."""
+        view = self.get_resource_view(prefix)
+        return None if view is None else view.pattern
+
+    def get_pattern_re(self, prefix: str) -> Optional[Pattern[str]]:
+        """Get the compiled pattern for the given prefix, if it's available."""
+        view = self.get_resource_view(prefix)
+        return None if view is None else view.get_pattern_re()
+
+    def get_uri_format(self, prefix: str) -> Optional[str]:
+        """Get the URI format string for the given prefix, if it's available."""
+        view = self.get_resource_view(prefix)
+        return None if view is None else view.uri_format
+
+    def get_uri_prefix(self, prefix: str) -> Optional[str]:
+        """Get a well-formed URI prefix, if available."""
+        view = self.get_resource_view(prefix)
+        return None if view is None else view.uri_prefix
+
+    def get_banana(self, prefix: str) -> Optional[str]:
+        """Get the banana (i.e., the redundant prefix before an identifier) if it exists."""
+        view = self.get_resource_view(prefix)
+        return None if view is None else view.banana
+
+    def get_example(self, prefix: str) -> Optional[str]:
+        """Get an example identifier, if it's available."""
+        view = self.get_resource_view(prefix)
+        return None if view is None else view.example
+
+    def is_deprecated(self, prefix: str) -> bool:
+        """Return if the given prefix corresponds to a deprecated resource."""
+        view = self.get_resource_view(prefix)
+        return view is not None and view.deprecated
+
+    def is_valid_identifier(self, prefix: str, identifier: str) -> bool:
+        """Check if the pre-parsed CURIE uses the canonical prefix and a valid identifier."""
+        view = self.views.get(prefix)
+        return view is not None and view.is_valid_identifier(identifier)
+
+    def is_valid_curie(self, curie: str) -> bool:
+        """Check if a CURIE uses the canonical prefix and a valid identifier."""
+        try:
+            prefix, identifier = curie.split(":", 1)
+        except ValueError:
+            return False
+        return self.is_valid_identifier(prefix, identifier)
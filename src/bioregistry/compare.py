@@ -198,10 +198,8 @@ def make_overlaps(keys: List[RegistryInfo]) -> Mapping[str, Mapping[str, Set[str
     for metaprefix, _, _, prefixes in keys:
         # Remap bioregistry prefixes to match the external
         #  vocabulary, when possible
-        bioregistry_remapped = {
-            resource.get_external(metaprefix).get("prefix", prefix)
-            for prefix, resource in bioregistry.read_registry().items()
-        }
+        registry_map = manager.get_mapping_table().get_column(metaprefix)
+        bioregistry_remapped = {registry_map.get(prefix, prefix) for prefix in manager.registry}
         rv[metaprefix] = {
             REMAPPED_KEY: bioregistry_remapped,
             REMAPPED_VALUE: prefixes,
@@ -2,8 +2,10 @@
 
 """Export the Bioregistry to RDF."""
 
+import functools
+import itertools as itt
 import logging
-from typing import Any, Callable, List, Optional, Tuple, Union, cast
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union, cast
 
 import click
 import rdflib
@@ -41,9 +43,12 @@ from bioregistry.schema.constants import (
     bioregistry_resource,
     bioregistry_schema,
     get_schema_rdf,
+    orcid,
 )
 from bioregistry.schema.struct import Collection, Registry, Resource
 
+from .rdf_stream import Triple, write_ntriples, write_turtle
+
 logger = logging.getLogger(__name__)
 
 NAMESPACES = {
@@ -71,12 +76,16 @@ def export_rdf():
         ensure_ascii=False,
     )
 
-    graph = get_full_rdf(manager=manager) + schema_rdf
-    graph.serialize(RDF_TURTLE_PATH.as_posix(), format="turtle")
-    graph.serialize(RDF_NT_PATH.as_posix(), format="nt", encoding="utf-8")
+    namespaces = get_full_namespaces(manager=manager)
+    with RDF_TURTLE_PATH.open("w", encoding="utf-8") as file:
+        write_turtle(iter_full_rdf_chunks(manager=manager), file, namespaces)
+    with RDF_NT_PATH.open("w", encoding="utf-8") as file:
+        write_ntriples(itt.chain.from_iterable(iter_full_rdf_chunks(manager=manager)), file)
     # Currently getting an issue with not being able to shorten URIs
     # graph.serialize(os.path.join(DOCS_DATA, "bioregistry.xml"), format="xml")
 
+    # JSON-LD can't be written as a stream, so it's made from a graph
+    graph = get_full_rdf(manager=manager)
     context = {
         "@language": "en",
         **dict(graph.namespaces()),
@@ -93,17 +102,65 @@ def export_rdf():
 def get_full_rdf(manager: Manager) -> rdflib.Graph:
     """Get a combine RDF graph representing the Bioregistry using :mod:`rdflib`."""
     graph = _graph(manager=manager)
-    _add_schema(graph)
-    for registry in manager.metaregistry.values():
-        registry.add_triples(graph)
-    for collection in manager.collections.values():
-        collection.add_triples(graph)
+    _bind_uri_prefixes(graph, manager=manager)
+    for chunk in iter_full_rdf_chunks(manager=manager):
+        for triple in chunk:
+            graph.add(triple)
+    return graph
+
+
+def _bind_uri_prefixes(graph: rdflib.Graph, *, manager: Manager) -> None:
     for resource in manager.registry.values():
         uri_prefix = resource.get_uri_prefix()
         if uri_prefix:
             graph.bind(resource.prefix, uri_prefix)
-        _add_resource(graph=graph, manager=manager, resource=resource)
-    return graph
+
+
+def get_full_namespaces(manager: Manager) -> List[Tuple[str, str]]:
+    """Get the prefixes and namespaces that :func:`get_full_rdf` binds in its graph."""
+    graph = _graph(manager=manager)
+    _bind_uri_prefixes(graph, manager=manager)
+    return [(prefix, str(namespace)) for prefix, namespace in graph.namespaces()]
+
+
+class _Chunk(list):
+    """A list of triples that can stand in for a graph that triples are added to."""
+
+    add = list.append
+
+
+def iter_full_rdf_chunks(manager: Manager) -> Iterable[List[Triple]]:
+    """Iterate over the triples in :func:`get_full_rdf` without building a graph.
+
+    :param manager: A manager
+    :yields: A list of triples for the schema, then for each registry, collection, and
+        resource. Only one list is kept in memory at a time.
+
+    The triples about each person are only in the first chunk that mentions them,
+    since they're the same everywhere they're mentioned.
+    """
+    people = set()
+    # each takes the graph as a keyword argument, since it's keyword-only in _add_resource
+    add_triples_iterable: Iterable[Callable[..., Any]] = itt.chain(
+        [_add_schema],
+        (registry.add_triples for registry in manager.metaregistry.values()),
+        (collection.add_triples for collection in manager.collections.values()),
+        (
+            functools.partial(_add_resource, resource, manager=manager)
+            for resource in manager.registry.values()
+        ),
+    )
+    for add_triples in add_triples_iterable:
+        chunk = _Chunk()
+        add_triples(graph=chunk)
+        rv = []
+        for triple in chunk:
+            if isinstance(triple[0], URIRef) and triple[0].startswith(orcid):
+                if triple in people:
+                    continue
+                people.add(triple)
+            rv.append(triple)
+        yield rv
 
 
 def collection_to_rdf_str(
@@ -158,7 +215,7 @@ def _get_resource_function_2() -> List[Tuple[Union[str, URIRef], Callable[[Resou
     ]
 
 
-def _add_resource(resource: Resource, *, manager: Manager, graph: rdflib.Graph):  # noqa:C901
+def _add_resource(resource: Resource, *, manager: Manager, graph):  # noqa:C901
     node = cast(URIRef, bioregistry_resource[resource.prefix])
     graph.add((node, RDF.type, bioregistry_schema["0000001"]))
     graph.add((node, RDFS.label, Literal(resource.get_name())))
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""Write RDF triples to a file as they're made, without building a graph.
+
+Building an :class:`rdflib.Graph` for the whole Bioregistry keeps every triple
+(and several indexes over them) in memory before anything is written. The writers
+in this module take triples from an iterable instead, so only the triples that
+are being written are kept in memory:
+
+- :func:`write_ntriples` writes N-Triples, or N-Quads if a graph is given.
+- :func:`write_turtle` writes Turtle one chunk of triples at a time (e.g., the
+  triples about one resource), grouping the triples in each chunk by subject and
+  predicate. The prefixes have to be known in advance, since they're written in
+  the header.
+
+Unlike an :class:`rdflib.Graph`, the writers don't remove duplicate triples across
+chunks. That's allowed, since an RDF graph is a set, so a duplicate triple is
+ignored when it's parsed.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+from rdflib import RDF, BNode, Literal, URIRef
+from rdflib.term import Node
+
+__all__ = [
+    "Triple",
+    "TurtleWriter",
+    "write_ntriples",
+    "write_turtle",
+]
+
+#: A triple of RDF terms from :mod:`rdflib`
+Triple = Tuple[Node, Node, Node]
+
+#: The characters escaped in a quoted literal, with their escapes
+_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+#: A conservative approximation of a Turtle prefix name (``PN_PREFIX``)
+PREFIX_RE = re.compile(r"([A-Za-z]([A-Za-z0-9_.-]*[A-Za-z0-9_-])?)?")
+#: A conservative approximation of a Turtle local name (``PN_LOCAL``)
+LOCAL_RE = re.compile(r"([A-Za-z0-9_]([A-Za-z0-9_.-]*[A-Za-z0-9_-])?)?")
+#: The characters that namespaces usually end with, where an IRI is split to look one up
+_DELIMITER_RE = re.compile(r"[/#_:=?&.-]")
+
+#: The number of terms whose abbreviations are cached by the Turtle writer
+CACHE_SIZE = 1 << 14
+
+
+def _quote(literal: Literal, datatype: Callable[[URIRef], str]) -> str:
+    rv = '"' + str(literal).translate(_ESCAPES) + '"'
+    if literal.language:
+        return f"{rv}@{literal.language}"
+    if literal.datatype:
+        return rv + "^^" + datatype(literal.datatype)
+    return rv
+
+
+def _nt_iri(iri: URIRef) -> str:
+    # formatting is used instead of concatenation, which makes a new URIRef
+    return f"<{iri}>"
+
+
+def _nt_term(term: Node) -> str:
+    if isinstance(term, URIRef):
+        return f"<{term}>"
+    if isinstance(term, Literal):
+        return _quote(term, _nt_iri)
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    raise TypeError(f"can not write term: {term!r}")
+
+
+def write_ntriples(
+    triples: Iterable[Triple],
+    file: TextIO,
+    *,
+    graph: Optional[URIRef] = None,
+) -> int:
+    """Write triples to a file as N-Triples, or N-Quads if a graph is given.
+
+    :param triples: The triples
+    :param file: A file opened for writing text
+    :param graph: The graph that the triples are in. If given, writes N-Quads.
+    :returns: The number of triples written
+    """
+    end = " .\n" if graph is None else f" <{graph}> .\n"
+    count = 0
+    for subject, predicate, obj in triples:
+        file.write(_nt_term(subject) + " " + _nt_term(predicate) + " " + _nt_term(obj) + end)
+        count += 1
+    return count
+
+
+class TurtleWriter:
+    """Write Turtle one chunk of triples at a time."""
+
+    def __init__(self, file: TextIO, namespaces: Iterable[Tuple[str, str]]):
+        """Write the header.
+
+        :param file: A file opened for writing text
+        :param namespaces: Pairs of prefixes and the namespaces they abbreviate. If a
+            prefix or a namespace appears twice, the first one is used. Prefixes that
+            aren't valid in Turtle are skipped.
+        """
+        self.file = file
+        self.namespaces: Dict[str, str] = {}
+        prefixes = set()
+        for prefix, namespace in namespaces:
+            namespace = str(namespace)
+            if (
+                prefix in prefixes
+                or namespace in self.namespaces
+                or not PREFIX_RE.fullmatch(prefix)
+            ):
+                continue
+            prefixes.add(prefix)
+            self.namespaces[namespace] = prefix
+            file.write(f"@prefix {prefix}: <{namespace}> .\n")
+        self.iri = lru_cache(maxsize=CACHE_SIZE)(self._iri)
+
+    def _iri(self, iri: URIRef) -> str:
+        """Abbreviate an IRI with the longest namespace, if possible."""
+        ends = [match.end() for match in _DELIMITER_RE.finditer(iri)]
+        for end in reversed(ends):
+            prefix = self.namespaces.get(iri[:end])
+            if prefix is not None and LOCAL_RE.fullmatch(iri, end):
+                return prefix + ":" + iri[end:]
+        return f"<{iri}>"
+
+    def term(self, term: Node) -> str:
+        """Write a term."""
+        if isinstance(term, URIRef):
+            return self.iri(term)
+        if isinstance(term, Literal):
+            return _quote(term, self.iri)
+        if isinstance(term, BNode):
+            return f"_:{term}"
+        raise TypeError(f"can not write term: {term!r}")
+
+    def write_chunk(self, triples: Iterable[Triple]) -> int:
+        """Write a chunk of triples, grouped by subject and then by predicate.
+
+        :param triples: The triples. They're kept in memory until the chunk is
+            written, and duplicates within the chunk are removed.
+        :returns: The number of triples written
+        """
+        # dictionaries are used as ordered sets, so the output is in the order of the triples
+        subjects: Dict[Node, Dict[Node, Dict[Node, None]]] = {}
+        for subject, predicate, obj in triples:
+            subjects.setdefault(subject, {}).setdefault(predicate, {})[obj] = None
+        count = 0
+        for subject, predicates in subjects.items():
+            lines: List[str] = []
+            for predicate, objects in predicates.items():
+                objects_str = " ,\n        ".join(self.term(obj) for obj in objects)
+                predicate_str = "a" if predicate == RDF.type else self.term(predicate)
+                lines.append(f"{predicate_str} {objects_str}")
+                count += len(objects)
+            self.file.write("\n" + self.term(subject) + " " + " ;\n    ".join(lines) + " .\n")
+        return count
+
+
+def write_turtle(
+    chunks: Iterable[Sequence[Triple]],
+    file: TextIO,
+    namespaces: Iterable[Tuple[str, str]],
+) -> int:
+    """Write chunks of triples to a file as Turtle.
+
+    :param chunks: The chunks of triples, e.g., the triples about each resource
+    :param file: A file opened for writing text
+    :param namespaces: Pairs of prefixes and the namespaces they abbreviate
+    :returns: The number of triples written, not counting duplicates within a chunk
+    """
+    writer = TurtleWriter(file, namespaces)
+    return sum(writer.write_chunk(chunk) for chunk in chunks)
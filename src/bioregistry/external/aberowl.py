@@ -6,9 +6,9 @@ import json
 
 import click
 import yaml
-from pystow.utils import download
 
 from bioregistry.constants import EXTERNAL
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_aberowl",
@@ -27,12 +27,16 @@ def get_aberowl(force_download: bool = False):
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=ABEROWL_URL, path=RAW_PATH, force=True)
+    source = fetch(ABEROWL_URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with RAW_PATH.open() as file:
         entries = yaml.full_load(file)
-    rv = {entry["acronym"]: _process(entry) for entry in entries}
+    rv = source.process_records({entry["acronym"]: entry for entry in entries}, _process)
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
     return rv
 
 
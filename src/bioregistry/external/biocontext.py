@@ -5,9 +5,8 @@
 import json
 from typing import Any, Mapping
 
-from pystow.utils import download
-
 from bioregistry.constants import EXTERNAL, URI_FORMAT_KEY
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_biocontext",
@@ -32,7 +31,10 @@ def get_biocontext(force_download: bool = False) -> Mapping[str, Mapping[str, An
     if PROCESSED_PATH.exists() and not force_download:
         with PROCESSED_PATH.open() as file:
             return json.load(file)
-    download(url=URL, path=RAW_PATH, force=True)
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with RAW_PATH.open() as file:
         data = json.load(file)
     rv = {
@@ -41,6 +43,7 @@ def get_biocontext(force_download: bool = False) -> Mapping[str, Mapping[str, An
     }
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
     return rv
 
 
@@ -5,9 +5,9 @@
 import json
 
 import yaml
-from pystow.utils import download
 
 from bioregistry.constants import EXTERNAL, URI_FORMAT_KEY
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_biolink",
@@ -27,7 +27,10 @@ def get_biolink(force_download: bool = False):
     if PROCESSED_PATH.exists() and not force_download:
         with PROCESSED_PATH.open() as file:
             return json.load(file)
-    download(url=URL, path=RAW_PATH, force=True)
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with RAW_PATH.open() as file:
         data = yaml.safe_load(file)
     rv = {
@@ -36,6 +39,7 @@ def get_biolink(force_download: bool = False):
     }
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
     return rv
 
 
@@ -5,9 +5,8 @@
 import itertools as itt
 import json
 
-from pystow.utils import download
-
 from bioregistry.constants import EXTERNAL, URI_FORMAT_KEY
+from bioregistry.external.fetch import fetch
 
 URL = "https://ftp.expasy.org/databases/cellosaurus/cellosaurus_xrefs.txt"
 
@@ -30,7 +29,10 @@ def get_cellosaurus(force_download: bool = False, keep_missing_uri: bool = True)
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=URL, path=RAW_PATH, force=True)
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with RAW_PATH.open(encoding="ISO8859-1") as file:
         lines = [line.rstrip() for line in file]
 
@@ -62,6 +64,7 @@ def get_cellosaurus(force_download: bool = False, keep_missing_uri: bool = True)
 
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
 
     return rv
 
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+"""Download external registries only when they've changed.
+
+Most external registries publish a single dump that rarely changes between two
+alignments. :func:`fetch` keeps the dump's HTTP validators (its ``ETag`` and
+``Last-Modified`` headers) and a hash of its content in a file next to it, e.g.,
+``raw.meta.json`` next to ``raw.json``. The next time, it makes a conditional
+request, so an unchanged dump isn't downloaded again. If the server doesn't
+support conditional requests, the hash tells if the content changed anyway.
+The metadata files are committed along with the data they describe, so the
+scheduled update can make conditional requests too.
+
+The result remembers which content (and which version of the code that processes
+it) the processed file was made from, so a getter can skip processing entirely
+when nothing changed:
+
+.. code-block:: python
+
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
+    ...  # process the raw data and write the processed data
+    source.mark_processed()
+
+When the dump did change, :meth:`Fetched.process_records` only processes the
+records that are different from the last time.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, TypeVar, Union
+
+import requests
+from pydantic import BaseModel, Field
+
+from bioregistry.constants import BIOREGISTRY_MODULE
+
+__all__ = [
+    "Fetched",
+    "SourceMetadata",
+    "fetch",
+]
+
+logger = logging.getLogger(__name__)
+
+X = TypeVar("X")
+Y = TypeVar("Y")
+
+#: The size of the chunks that downloads are read in
+CHUNK_SIZE = 1 << 16
+
+
+class SourceMetadata(BaseModel):
+    """Information about the last download of an external registry."""
+
+    url: str
+    etag: Optional[str] = Field(description="The ETag header of the last download")
+    last_modified: Optional[str] = Field(
+        description="The Last-Modified header of the last download"
+    )
+    sha256: str = Field(description="The SHA-256 hash of the downloaded content")
+    processed: Optional[str] = Field(
+        description="A hash of the content and the code that the processed data was made from"
+    )
+
+
+def get_metadata_path(path: Path) -> Path:
+    """Get the path of the metadata for a downloaded file, e.g., ``raw.meta.json`` for ``raw.json``."""
+    return path.with_name(f"{path.stem}.meta.json")
+
+
+class Fetched:
+    """The result of :func:`fetch`."""
+
+    def __init__(self, path: Path, metadata: SourceMetadata, changed: bool, code_digest: str = ""):
+        """Instantiate the result.
+
+        :param path: The path to the downloaded file
+        :param metadata: The metadata about the download
+        :param changed: If the content is different from the last download
+        :param code_digest: A hash of the files that processing depends on
+        """
+        self.path = path
+        self.metadata = metadata
+        self.changed = changed
+        self.code_digest = code_digest
+
+    @property
+    def processed_digest(self) -> str:
+        """Get a hash of the content and the code that processes it."""
+        return _hash_text(f"{self.code_digest}:{self.metadata.sha256}")
+
+    @property
+    def metadata_path(self) -> Path:
+        """Get the path of the metadata file."""
+        return get_metadata_path(self.path)
+
+    def _write_metadata(self) -> None:
+        self.metadata_path.write_text(self.metadata.json(indent=2, exclude_none=True) + "\n")
+
+    def is_processed(self, processed_path: Path) -> bool:
+        """Get if the processed file was made from the current content and code.
+
+        :param processed_path: The path to the processed file
+        :returns: If the processed file exists and :meth:`mark_processed` was called
+            after it was made from the current content with the current code
+        """
+        return processed_path.is_file() and self.metadata.processed == self.processed_digest
+
+    def mark_processed(self) -> None:
+        """Remember that the processed file was made from the current content and code."""
+        self.metadata.processed = self.processed_digest
+        self._write_metadata()
+
+    @property
+    def records_cache_path(self) -> Path:
+        """Get the path to the cache of processed records.
+
+        The cache is in the :mod:`pystow` directory rather than next to the
+        downloaded file, since it holds a copy of the processed data.
+
+        :returns: The path to the cache of processed records
+        """
+        return BIOREGISTRY_MODULE.join("external", self.path.parent.name, name="records.json")
+
+    def process_records(
+        self,
+        records: Mapping[str, X],
+        func: Callable[[X], Y],
+        *,
+        force: bool = False,
+        cache_path: Optional[Path] = None,
+    ) -> Dict[str, Y]:
+        """Process records, reusing the results for the ones that didn't change.
+
+        :param records: A dictionary from keys (e.g., prefixes) to raw records. Each
+            record has to be JSON serializable, so it can be hashed.
+        :param func: The function that processes a single record. It has to give
+            the same result for the same record and code, since results are reused.
+            It's given a record after it's hashed, so it's allowed to modify it.
+        :param force: If true, processes all records
+        :param cache_path: The path to the cache of processed records. Defaults
+            to :attr:`records_cache_path`.
+        :returns: A dictionary from keys to processed records
+        """
+        path = self.records_cache_path if cache_path is None else cache_path
+        cache: Dict[str, Any] = {}
+        if path.is_file() and not force:
+            cache = json.loads(path.read_text())
+        rv: Dict[str, Y] = {}
+        new_cache: Dict[str, Any] = {}
+        processed = 0
+        for key, record in records.items():
+            digest = _hash_text(
+                self.code_digest
+                + json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+            )
+            cached = cache.get(key)
+            if cached is not None and cached[0] == digest:
+                value = cached[1]
+            else:
+                value = func(record)
+                processed += 1
+            new_cache[key] = [digest, value]
+            rv[key] = value
+        logger.info(
+            "[%s] processed %d changed records out of %d",
+            self.path.parent.name,
+            processed,
+            len(rv),
+        )
+        # this is written before the caller can modify the results
+        path.write_text(json.dumps(new_cache, sort_keys=True, ensure_ascii=False))
+        return rv
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _hash_files(paths: Iterable[Union[str, Path]]) -> str:
+    sha256 = hashlib.sha256()
+    for path in paths:
+        sha256.update(Path(path).read_bytes())
+    return sha256.hexdigest()
+
+
+def _read_metadata(path: Path) -> Optional[SourceMetadata]:
+    metadata_path = get_metadata_path(path)
+    if not metadata_path.is_file() or not path.is_file():
+        return None
+    try:
+        return SourceMetadata.parse_file(metadata_path)
+    except ValueError:
+        logger.warning("could not read %s", metadata_path)
+        return None
+
+
+def fetch(
+    url: str,
+    path: Union[str, Path],
+    *,
+    force: bool = False,
+    processed_by: Iterable[Union[str, Path]] = (),
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = 300.0,
+    **kwargs: Any,
+) -> Fetched:
+    """Download a file, unless it's the same as the last time.
+
+    If the server responds with an error, :class:`requests.HTTPError` is raised
+    and the file and its metadata are left as they were.
+
+    :param url: The URL of the file
+    :param path: The path where the file is written. Its metadata is written next to it.
+    :param force: If true, makes an unconditional request. The content's hash
+        still decides if it changed.
+    :param processed_by: The files that processing depends on, e.g., the module
+        with the getter (``__file__``) and any configuration. If they change, the
+        content has to be processed again even if it didn't change.
+    :param session: The session used to make the request. If None, uses :mod:`requests`.
+    :param timeout: The timeout, in seconds
+    :param kwargs: Keyword arguments for :func:`requests.get`, e.g., ``headers``
+    :returns: The metadata about the download and if the content changed
+    """
+    path = Path(path)
+    code_digest = _hash_files(processed_by)
+    previous = _read_metadata(path)
+    if previous is not None and previous.url != url:
+        previous = None
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if previous is not None and not force:
+        if previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+
+    get = requests.get if session is None else session.get
+    with get(url, headers=headers, stream=True, timeout=timeout, **kwargs) as response:
+        if response.status_code == 304 and previous is not None:
+            logger.info("[%s] not modified", url)
+            return Fetched(path, previous, changed=False, code_digest=code_digest)
+        response.raise_for_status()
+        sha256 = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, delete=False) as file:
+            complete = False
+            try:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    sha256.update(chunk)
+                    file.write(chunk)
+                complete = True
+            finally:
+                # don't leave a partial download behind
+                if not complete:
+                    os.unlink(file.name)
+        metadata = SourceMetadata(
+            url=url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            sha256=sha256.hexdigest(),
+        )
+
+    if previous is not None and previous.sha256 == metadata.sha256:
+        # keep the existing file, which might have been rewritten (e.g., sorted)
+        os.unlink(file.name)
+        metadata.processed = previous.processed
+        changed = False
+        logger.info("[%s] content did not change", url)
+    else:
+        os.chmod(file.name, 0o644)
+        os.replace(file.name, path)
+        changed = True
+    rv = Fetched(path, metadata, changed=changed, code_digest=code_digest)
+    rv._write_metadata()
+    return rv
@@ -6,9 +6,9 @@ import json
 
 import click
 import yaml
-from pystow.utils import download
 
 from bioregistry.constants import EXTERNAL
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_go",
@@ -44,7 +44,10 @@ def get_go(force_download: bool = False):
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=GO_URL, path=RAW_PATH, force=True)
+    source = fetch(GO_URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with RAW_PATH.open() as file:
         entries = yaml.full_load(file)
     entries = [
@@ -55,6 +58,7 @@ def get_go(force_download: bool = False):
     rv = {entry["database"]: entry for entry in entries}
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
     return rv
 
 
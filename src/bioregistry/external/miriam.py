@@ -6,9 +6,9 @@ import json
 from operator import itemgetter
 
 import click
-from pystow.utils import download
 
 from bioregistry.constants import EXTERNAL, URI_FORMAT_KEY
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_miriam",
@@ -35,23 +35,31 @@ def get_miriam(force_download: bool = False, force_process: bool = False):
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=MIRIAM_URL, path=RAW_PATH, force=force_download)
+    source = fetch(MIRIAM_URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH) and not force_process:
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with open(RAW_PATH) as file:
         data = json.load(file)
 
     data["payload"]["namespaces"] = sorted(data["payload"]["namespaces"], key=itemgetter("prefix"))
-    if force_download:
+    if source.changed:
         with open(RAW_PATH, "w") as file:
             json.dump(data, file, indent=2, sort_keys=True, ensure_ascii=False)
 
-    rv = {
-        record["prefix"]: _process(record)
-        for record in data["payload"]["namespaces"]
-        # records whose prefixes start with `dg.` appear to be unreleased
-        if not record["prefix"].startswith("dg.") and record["prefix"] not in SKIP
-    }
+    rv = source.process_records(
+        {
+            record["prefix"]: record
+            for record in data["payload"]["namespaces"]
+            # records whose prefixes start with `dg.` appear to be unreleased
+            if not record["prefix"].startswith("dg.") and record["prefix"] not in SKIP
+        },
+        _process,
+        force=force_process,
+    )
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
     return rv
 
 
@@ -6,9 +6,9 @@ import json
 
 import click
 import yaml
-from pystow.utils import download
 
 from bioregistry.constants import EXTERNAL, URI_FORMAT_KEY
+from bioregistry.external.fetch import fetch
 
 URL = "https://n2t.net/e/n2t_full_prefixes.yaml"
 DIRECTORY = EXTERNAL / "n2t"
@@ -34,19 +34,26 @@ def get_n2t(force_download: bool = False):
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=URL, path=RAW_PATH, force=True)
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     # they give malformed YAML so time to write a new parser
     with RAW_PATH.open() as file:
         data = yaml.safe_load(file)
 
-    rv = {
-        key: _process(record)
-        for key, record in data.items()
-        if record["type"] == "scheme" and "/" not in key and key not in SKIP
-    }
+    rv = source.process_records(
+        {
+            key: record
+            for key, record in data.items()
+            if record["type"] == "scheme" and "/" not in key and key not in SKIP
+        },
+        _process,
+    )
 
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, sort_keys=True, indent=2)
+    source.mark_processed()
     return rv
 
 
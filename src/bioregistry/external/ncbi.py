@@ -10,9 +10,9 @@ from urllib.parse import urlsplit, urlunsplit
 
 import click
 from bs4 import BeautifulSoup
-from pystow.utils import download
 
 from bioregistry.constants import EXTERNAL
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_ncbi",
@@ -59,7 +59,10 @@ def get_ncbi(force_download: bool = False) -> Dict[str, Dict[str, str]]:
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=URL, path=RAW_PATH, force=True)
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with RAW_PATH.open() as file:
         soup = BeautifulSoup(file, "html.parser")
     # find the data table based on its caption element
@@ -140,6 +143,7 @@ def get_ncbi(force_download: bool = False) -> Dict[str, Dict[str, str]]:
 
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
 
     return rv
 
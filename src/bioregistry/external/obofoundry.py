@@ -9,9 +9,9 @@ from typing import Optional
 import click
 import requests
 import yaml
-from pystow.utils import download
 
 from bioregistry.constants import EXTERNAL
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_obofoundry",
@@ -36,13 +36,17 @@ def get_obofoundry(force_download: bool = False):
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=OBOFOUNDRY_URL, path=RAW_PATH, force=True)
+    source = fetch(OBOFOUNDRY_URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with RAW_PATH.open() as file:
         data = yaml.full_load(file)
 
-    rv = {
-        record["id"]: _process(record) for record in data["ontologies"] if record["id"] not in SKIP
-    }
+    rv = source.process_records(
+        {record["id"]: record for record in data["ontologies"] if record["id"] not in SKIP},
+        _process,
+    )
     for key, record in rv.items():
         for depends_on in record.get("depends_on", []):
             if depends_on not in rv:
@@ -51,6 +55,7 @@ def get_obofoundry(force_download: bool = False):
                 rv[depends_on].setdefault("appears_in", []).append(key)
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True, ensure_ascii=False)
+    source.mark_processed()
 
     return rv
 
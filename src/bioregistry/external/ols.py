@@ -12,10 +12,10 @@ from operator import itemgetter
 from textwrap import dedent
 from typing import Any, Mapping, Optional
 
-import requests
 from pydantic import BaseModel
 
 from bioregistry.constants import DATA_DIRECTORY, EXTERNAL
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_ols",
@@ -46,7 +46,11 @@ def get_ols(force_download: bool = False):
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    data = requests.get(URL).json()
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__, OLS_PROCESSING])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
+    data = json.loads(RAW_PATH.read_text())
     data["_embedded"]["ontologies"] = sorted(
         data["_embedded"]["ontologies"],
         key=itemgetter("ontologyId"),
@@ -55,9 +59,10 @@ def get_ols(force_download: bool = False):
         raise NotImplementedError(
             "Need to implement paging since there are more entries than fit into one page"
         )
-    RAW_PATH.write_text(json.dumps(data, indent=2, sort_keys=True))
+    if source.changed:
+        RAW_PATH.write_text(json.dumps(data, indent=2, sort_keys=True))
 
-    processed = {}
+    ontologies, configs = {}, {}
     for ontology in data["_embedded"]["ontologies"]:
         ols_id = ontology["ontologyId"]
         if ols_id in OLS_SKIP:
@@ -68,10 +73,15 @@ def get_ols(force_download: bool = False):
             if ols_id not in OLS_SKIP:
                 logger.warning("need to curate processing file for OLS prefix %s", ols_id)
             continue
-        processed[ols_id] = _process(ontology, config)
+        ontologies[ols_id] = ontology
+        configs[ols_id] = config
+    processed = source.process_records(
+        ontologies, lambda ontology: _process(ontology, configs[ontology["ontologyId"]])
+    )
 
     with PROCESSED_PATH.open("w") as file:
         json.dump(processed, file, indent=2, sort_keys=True)
+    source.mark_processed()
     return processed
 
 
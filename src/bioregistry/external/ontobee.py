@@ -5,9 +5,9 @@
 import json
 
 from bs4 import BeautifulSoup
-from pystow.utils import download
 
 from bioregistry.constants import EXTERNAL
+from bioregistry.external.fetch import fetch
 
 DIRECTORY = EXTERNAL / "ontobee"
 DIRECTORY.mkdir(exist_ok=True, parents=True)
@@ -28,7 +28,10 @@ def get_ontobee(force_download: bool = False):
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=URL, path=RAW_PATH, force=True)
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     with RAW_PATH.open() as f:
         soup = BeautifulSoup(f, "html.parser")
 
@@ -44,6 +47,7 @@ def get_ontobee(force_download: bool = False):
 
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
 
     return rv
 
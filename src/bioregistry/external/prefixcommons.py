@@ -11,9 +11,8 @@
 import json
 from typing import Any, Dict
 
-from pystow.utils import download
-
 from bioregistry.constants import EXTERNAL
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_prefixcommons",
@@ -86,7 +85,10 @@ def get_prefixcommons(force_download: bool = False):
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    download(url=URL, path=RAW_PATH, force=force_download)
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
     rows = {}
     with RAW_PATH.open() as file:
         lines = iter(file)
@@ -97,6 +99,7 @@ def get_prefixcommons(force_download: bool = False):
                 rows[prefix] = data
 
     PROCESSED_PATH.write_text(json.dumps(rows, sort_keys=True, indent=2))
+    source.mark_processed()
     return rows
 
 
@@ -6,9 +6,8 @@ import json
 import logging
 from typing import Mapping
 
-import requests
-
 from bioregistry.constants import EXTERNAL, URI_FORMAT_KEY
+from bioregistry.external.fetch import fetch
 
 __all__ = [
     "get_uniprot",
@@ -39,12 +38,18 @@ def get_uniprot(force_download: bool = True) -> Mapping[str, Mapping[str, str]]:
         with PROCESSED_PATH.open() as file:
             return json.load(file)
 
-    RAW_PATH.write_text(
-        json.dumps(requests.get(URL).json(), indent=2, sort_keys=True, ensure_ascii=False)
+    source = fetch(URL, RAW_PATH, force=force_download, processed_by=[__file__])
+    if source.is_processed(PROCESSED_PATH):
+        with PROCESSED_PATH.open() as file:
+            return json.load(file)
+    data = json.loads(RAW_PATH.read_text())
+    if source.changed:
+        RAW_PATH.write_text(json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False))
+    processed_records = source.process_records(
+        {record["id"]: record for record in data["results"]}, _process_record
     )
     rv = {}
-    for record in json.loads(RAW_PATH.read_text())["results"]:
-        processed_record = _process_record(record)
+    for processed_record in processed_records.values():
         if processed_record is None:
             continue
         prefix = processed_record.pop("prefix")
@@ -54,6 +59,7 @@ def get_uniprot(force_download: bool = True) -> Mapping[str, Mapping[str, str]]:
 
     with PROCESSED_PATH.open("w") as file:
         json.dump(rv, file, indent=2, sort_keys=True)
+    source.mark_processed()
     return rv
 
 
@@ -5,56 +5,39 @@
 import sys
 from collections import defaultdict
 from datetime import datetime
-from typing import Optional, Set, Tuple
+from typing import DefaultDict, Optional, Set
 
 import click
 import pandas as pd
-import requests
-from tqdm import tqdm
-from tqdm.contrib.concurrent import thread_map
 
 import bioregistry
+from bioregistry.constants import BIOREGISTRY_MODULE
+from bioregistry.health.engine import CheckResult, check_urls, checker_options
 
 __all__ = [
     "main",
 ]
 
+#: The file where results are kept while a run is in progress, so it can be resumed
+CHECKPOINT_NAME = "homepages.jsonl"
 
-def _process(element: Tuple[str, Set[str]]) -> Tuple[str, Set[str], bool, Optional[str]]:
-    homepage, prefixes = element
-    if "github.com" in homepage:  # skip github links for now
-        return homepage, prefixes, False, None
+
+def _get_message(homepage: str, result: Optional[CheckResult]) -> Optional[str]:
+    """Get the reason the homepage failed, or None if it didn't."""
     if "purl.obolibrary.org" in homepage:  # this is never acceptable
-        return homepage, prefixes, True, "no PURLs allowed"
-
-    failed = False
-    msg = ""
-    try:
-        res = requests.get(homepage, timeout=10)
-    except IOError as e:
-        failed = True
-        msg = e.__class__.__name__
-    else:
-        if res.status_code != 200:
-            failed = True
-            msg = f"status: {res.status_code}"
-    if failed:
-        with tqdm.external_write_mode():
-            click.echo(
-                f'[{datetime.now().strftime("%H:%M:%S")}] '
-                + click.style(", ".join(sorted(prefixes)), fg="green")
-                + " at "
-                + click.style(homepage, fg="red")
-                + " failed to download: "
-                + click.style(msg, fg="bright_black")
-            )
-    return homepage, prefixes, failed, msg
+        return "no PURLs allowed"
+    if result is None or not result.failed:
+        return None
+    if result.exception is not None:
+        return result.exception
+    return f"status: {result.status_code}"
 
 
 @click.command()
-def main():
+@checker_options
+def main(resume: bool, **kwargs):
     """Run the homepage health check script."""
-    homepage_to_prefixes = defaultdict(set)
+    homepage_to_prefixes: DefaultDict[str, Set[str]] = defaultdict(set)
     for prefix in bioregistry.read_registry():
         if bioregistry.is_deprecated(prefix):
             continue
@@ -63,9 +46,41 @@ def main():
             continue
         homepage_to_prefixes[homepage].add(prefix)
 
-    rv = thread_map(_process, list(homepage_to_prefixes.items()), desc="Checking homepages")
+    def _callback(homepage: str, result: CheckResult) -> None:
+        msg = _get_message(homepage, result)
+        if msg is None:
+            return
+        click.echo(
+            f'[{datetime.now().strftime("%H:%M:%S")}] '
+            + click.style(", ".join(sorted(homepage_to_prefixes[homepage])), fg="green")
+            + " at "
+            + click.style(homepage, fg="red")
+            + " failed to download: "
+            + click.style(msg, fg="bright_black")
+        )
+
+    checkpoint = BIOREGISTRY_MODULE.join("health", name=CHECKPOINT_NAME)
+    if not resume and checkpoint.is_file():
+        checkpoint.unlink()
+    homepage_to_result = check_urls(
+        (
+            homepage
+            for homepage in homepage_to_prefixes
+            # skip github links for now, and PURLs are never acceptable
+            if "github.com" not in homepage and "purl.obolibrary.org" not in homepage
+        ),
+        method="GET",
+        checkpoint=checkpoint,
+        callback=_callback,
+        desc="Checking homepages",
+        **kwargs,
+    )
+    rv = [
+        (homepage, prefixes, _get_message(homepage, homepage_to_result.get(homepage)))
+        for homepage, prefixes in homepage_to_prefixes.items()
+    ]
 
-    failed = sum(failed for _, _, failed, _ in rv)
+    failed = sum(msg is not None for _, _, msg in rv)
     click.secho(
         f"{failed}/{len(rv)} ({failed / len(rv):.2%}) homepages failed to load", fg="red", bold=True
     )
@@ -74,12 +89,15 @@ def main():
         columns=["prefix", "homepage", "message"],
         data=[
             (prefix, homepage, msg)
-            for homepage, prefixes, failed, msg in rv
-            if failed
-            for prefix in prefixes
+            for homepage, prefixes, msg in rv
+            if msg is not None
+            for prefix in sorted(prefixes)
         ],
     )
     click.echo(df.to_markdown())
+    # the run is complete, so the next one starts from scratch
+    if checkpoint.is_file():
+        checkpoint.unlink()
     sys.exit(1 if 0 < failed else 0)
 
 
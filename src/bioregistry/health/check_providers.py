@@ -3,19 +3,34 @@
 """A script to check which providers in entries in the Bioregistry actually can be accessed."""
 
 import datetime
+import zlib
+from collections import defaultdict
 from operator import attrgetter
-from typing import List, NamedTuple, Optional
+from typing import (
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
 
 import click
-import requests
 import yaml
 from pydantic import BaseModel, Field
-from tqdm import tqdm
-from tqdm.contrib.concurrent import thread_map
 from tqdm.contrib.logging import logging_redirect_tqdm
 
 import bioregistry
-from bioregistry.constants import DOCS_DATA
+from bioregistry.constants import BIOREGISTRY_MODULE, DOCS_DATA
+from bioregistry.health.engine import (
+    CheckResult,
+    check_urls,
+    checker_options,
+    percentile,
+)
 from bioregistry.utils import secho
 
 __all__ = [
@@ -24,6 +39,20 @@ __all__ = [
 
 HEALTH_YAML_PATH = DOCS_DATA.joinpath("health.yaml")
 
+#: The number of most recent checks kept for each provider
+HISTORY_SIZE = 8
+#: The number of most recent checks whose majority decides if a provider is failing,
+#: so a provider that sporadically fails isn't reported as fallen and revived
+WINDOW = 3
+#: The time until a provider whose last check changed its status is checked again
+MIN_INTERVAL = datetime.timedelta(days=1)
+#: The longest time until a provider is checked again, no matter how stable it is
+MAX_INTERVAL = datetime.timedelta(days=16)
+#: The largest fraction of a provider's interval by which it's checked early. This
+#: is different for each provider, so providers whose checks started at the same
+#: time drift apart instead of all being due in the same run.
+JITTER = 0.25
+
 
 class ProviderStatus(BaseModel):
     """A container for provider information."""
@@ -35,6 +64,10 @@ class ProviderStatus(BaseModel):
     failed: bool
     exception: Optional[str]
     context: Optional[str]
+    latency: Optional[float] = Field(description="The time, in seconds, that the check took")
+    skipped: Optional[bool] = Field(
+        description="If the provider wasn't due to be checked, so this is the result of its last check"
+    )
 
 
 class Summary(BaseModel):
@@ -46,10 +79,30 @@ class Summary(BaseModel):
     failure_percent: float = Field(
         ge=0.0, le=100.0, description="The percentage of providers that did not successfully ping."
     )
+    latency_p50: Optional[float] = Field(description="The median latency, in seconds")
+    latency_p95: Optional[float] = Field(description="The 95th percentile latency, in seconds")
+    total_skipped: Optional[int] = Field(
+        description="The number of providers that weren't checked because they weren't due. "
+        "Their results from their last check are counted in the totals."
+    )
+
+
+class HostSummary(BaseModel):
+    """Statistics for the providers on a single host in a single run."""
+
+    host: str
+    total_measured: int
+    total_failed: int
+    latency_p50: Optional[float] = Field(description="The median latency, in seconds")
+    latency_p95: Optional[float] = Field(description="The 95th percentile latency, in seconds")
 
 
 class Delta(BaseModel):
-    """Change between runs."""
+    """Change between runs.
+
+    Whether a provider is failing is decided by the majority of its last
+    :data:`WINDOW` checks, before and after the current run.
+    """
 
     new: List[str] = Field(
         description="Prefixes that are new in the current run that were not present in the previous run"
@@ -75,13 +128,122 @@ class Run(BaseModel):
     date: str = Field(default_factory=lambda: datetime.datetime.now().strftime("%Y-%m-%d"))
     results: List[ProviderStatus]
     summary: Summary
+    hosts: Optional[List[HostSummary]] = Field(description="Statistics for each host")
     delta: Optional[Delta] = Field(description="Information about the changes since the last run")
 
 
+class ProviderHistory(BaseModel):
+    """The most recent checks of a single provider, which decide when it's checked next."""
+
+    url: str
+    last_checked: datetime.datetime
+    failed: List[bool] = Field(
+        default_factory=list, description="If each of the most recent checks failed, oldest first"
+    )
+
+    def add(self, status: ProviderStatus, time: datetime.datetime) -> None:
+        """Add the result of a check.
+
+        :param status: The result of the check
+        :param time: The time of the check
+        """
+        if status.url != self.url:  # the old checks were for a different URL
+            self.url = status.url
+            self.failed = []
+        self.last_checked = time
+        self.failed = self.failed[-(HISTORY_SIZE - 1) :] + [status.failed]
+
+    def is_failing(self, window: int = WINDOW) -> bool:
+        """Get if the majority of the most recent checks failed.
+
+        :param window: The number of most recent checks to consider
+        :returns: If the majority of the most recent checks failed. If they're
+            tied, the most recent check decides.
+
+        >>> ProviderHistory(url="", last_checked=0, failed=[True, False, False]).is_failing()
+        False
+        >>> ProviderHistory(url="", last_checked=0, failed=[False, True, True]).is_failing()
+        True
+        >>> ProviderHistory(url="", last_checked=0, failed=[False, False, True]).is_failing()
+        False
+        """
+        recent = self.failed[-window:]
+        failures = 2 * sum(recent)
+        return failures > len(recent) or (failures == len(recent) and recent[-1])
+
+    def get_interval(
+        self,
+        min_interval: datetime.timedelta = MIN_INTERVAL,
+        max_interval: datetime.timedelta = MAX_INTERVAL,
+    ) -> datetime.timedelta:
+        """Get the time until the provider should be checked again.
+
+        :param min_interval: The interval after the status changed
+        :param max_interval: The longest interval
+        :returns: The minimum interval, doubled for each check in a row (after the
+            first) that had the same status as the last one
+
+        >>> ProviderHistory(url="", last_checked=0, failed=[True, False, False, False]).get_interval()
+        datetime.timedelta(days=4)
+        """
+        streak = 0
+        for failed in reversed(self.failed):
+            if failed != self.failed[-1]:
+                break
+            streak += 1
+        return min(max_interval, min_interval * 2 ** max(0, streak - 1))
+
+    def is_due(
+        self,
+        now: datetime.datetime,
+        jitter: float = 0.0,
+        min_interval: datetime.timedelta = MIN_INTERVAL,
+        max_interval: datetime.timedelta = MAX_INTERVAL,
+    ) -> bool:
+        """Get if the provider should be checked.
+
+        :param now: The current time
+        :param jitter: The fraction of the interval by which the provider is checked early
+        :param min_interval: The interval after the status changed
+        :param max_interval: The longest interval
+        :returns: If the time since the last check is at least the interval
+        """
+        interval = self.get_interval(min_interval=min_interval, max_interval=max_interval)
+        return now - self.last_checked >= interval * (1.0 - jitter)
+
+
 class Database(BaseModel):
     """A database of runs of the provider check."""
 
     runs: List[Run] = Field(default_factory=list)
+    providers: Dict[str, ProviderHistory] = Field(
+        default_factory=dict, description="The most recent checks of each provider"
+    )
+
+    def update(self, results: Iterable[ProviderStatus], time: datetime.datetime) -> None:
+        """Add the results of checks to the providers' histories.
+
+        :param results: The results of the checks
+        :param time: The time of the checks
+        """
+        for status in results:
+            history = self.providers.get(status.prefix)
+            if history is None:
+                history = self.providers[status.prefix] = ProviderHistory(
+                    url=status.url, last_checked=time
+                )
+            history.add(status, time)
+
+    def ensure_providers(self) -> None:
+        """Fill in the providers' histories from the runs, if they're missing.
+
+        Databases from before the histories were kept only have runs, which
+        have the result of every provider.
+        """
+        if self.providers or not self.runs:
+            return
+        for run in sorted(self.runs, key=attrgetter("time")):
+            self.update((status for status in run.results if not status.skipped), run.time)
 
 
 class QueueTuple(NamedTuple):
@@ -92,14 +254,21 @@ class QueueTuple(NamedTuple):
     url: str
 
 
+#: The file where results are kept while a run is in progress, so it can be resumed
+CHECKPOINT_NAME = "providers.jsonl"
+
+
 @click.command()
-def main() -> None:
+@checker_options
+@click.option("--force", is_flag=True, help="Check all providers, even if they're not due")
+def main(resume: bool, force: bool, **kwargs) -> None:
     """Run the provider health check script."""
     if HEALTH_YAML_PATH.is_file():
         database = Database(**yaml.safe_load(HEALTH_YAML_PATH.read_text()))
     else:
         click.secho(f"Creating new database at {HEALTH_YAML_PATH}", fg="green")
         database = Database()
+    database.ensure_providers()
 
     queue: List[QueueTuple] = []
 
@@ -115,45 +284,134 @@ def main() -> None:
             continue
         queue.append(QueueTuple(resource.prefix, example, url))
 
+    now = datetime.datetime.now()
+    due = list(queue) if force else get_due(queue, database.providers, now)
+    due, skipped = get_skipped(queue, due, database.runs)
+    secho(f"{len(due):,}/{len(queue):,} providers are due to be checked")
+
+    checkpoint = BIOREGISTRY_MODULE.join("health", name=CHECKPOINT_NAME)
+    if not resume and checkpoint.is_file():
+        checkpoint.unlink()
     with logging_redirect_tqdm():
-        results = thread_map(_process, queue, desc="Checking providers", unit="prefix")
+        checked = get_results(due, checkpoint=checkpoint, **kwargs)
+    prefix_to_checked = {status.prefix: status for status in checked}
+    results = [
+        prefix_to_checked.get(element.prefix) or skipped[element.prefix] for element in queue
+    ]
 
-    total = len(results)
-    total_failed = sum(result.failed for result in results)
-    failure_percent = total_failed / total
+    summary = _summarize(results, total_skipped=len(skipped))
     secho(
-        f"{total_failed:,}/{total:,} ({failure_percent:.1%}) providers failed",
+        f"{summary.total_failed:,}/{summary.total_measured:,} ({summary.failure_percent:.1f}%)"
+        " providers failed",
         fg="red",
         bold=True,
     )
 
-    # TODO smooth delta against last N runs, since some things sporadically
-    #  come in and out
-    delta = (
-        _calculate_delta(results, max(database.runs, key=attrgetter("time")).results)
-        if database.runs
-        else None
-    )
+    previous = {prefix: history.copy(deep=True) for prefix, history in database.providers.items()}
+    database.update(checked, now)
+    prefixes = {element.prefix for element in queue}
+    database.providers = {
+        prefix: history for prefix, history in database.providers.items() if prefix in prefixes
+    }
     current_run = Run(
+        time=now,
         results=results,
-        summary=Summary(
-            total_measured=total,
-            total_failed=total_failed,
-            total_success=total - total_failed,
-            failure_percent=round(100 * failure_percent, 1),
-        ),
-        delta=delta,
+        summary=summary,
+        hosts=_summarize_hosts(results),
+        delta=_calculate_delta(database.providers, previous) if previous else None,
     )
     database.runs.append(current_run)
     database.runs = sorted(database.runs, key=attrgetter("time"), reverse=True)
 
     HEALTH_YAML_PATH.write_text(yaml.safe_dump(database.dict(exclude_none=True)))
     click.echo(f"Wrote to {HEALTH_YAML_PATH}")
-
-
-def _calculate_delta(current: List[ProviderStatus], previous: List[ProviderStatus]) -> Delta:
-    current_results = {status.prefix: status.failed for status in current}
-    previous_results = {status.prefix: status.failed for status in previous}
+    # the run is complete, so the next one starts from scratch
+    if checkpoint.is_file():
+        checkpoint.unlink()
+
+
+def get_due(
+    queue: Iterable[QueueTuple],
+    providers: Mapping[str, ProviderHistory],
+    now: datetime.datetime,
+    **kwargs,
+) -> List[QueueTuple]:
+    """Get the providers that should be checked.
+
+    :param queue: The prefixes, examples, and URLs that can be checked
+    :param providers: The histories of the providers that were checked before
+    :param now: The current time
+    :param kwargs: Keyword arguments for :meth:`ProviderHistory.is_due`, e.g.,
+        to change the minimum and maximum intervals
+    :returns: The providers that weren't checked before, whose URL changed since
+        their last check, or whose last check was at least their interval ago
+    """
+    rv = []
+    for element in queue:
+        history = providers.get(element.prefix)
+        if (
+            history is None
+            or history.url != element.url
+            or history.is_due(now, jitter=_get_jitter(element.prefix), **kwargs)
+        ):
+            rv.append(element)
+    return rv
+
+
+def get_skipped(
+    queue: Iterable[QueueTuple], due: Iterable[QueueTuple], runs: Iterable[Run]
+) -> Tuple[List[QueueTuple], Dict[str, ProviderStatus]]:
+    """Get the results of the last check of the providers that aren't due.
+
+    These are carried over into the current run, so each run has the results
+    of all providers.
+
+    :param queue: The prefixes, examples, and URLs that can be checked
+    :param due: The providers that are due to be checked
+    :param runs: The previous runs
+    :returns: The providers that have to be checked, which also includes the ones
+        without a previous result for their current URL, and a dictionary from the
+        prefixes of the others to their last result, marked as skipped
+    """
+    due = list(due)
+    due_prefixes = {element.prefix for element in due}
+    last_results = get_last_results(runs)
+    skipped: Dict[str, ProviderStatus] = {}
+    for element in queue:
+        if element.prefix in due_prefixes:
+            continue
+        last_result = last_results.get(element.prefix)
+        if last_result is None or last_result.url != element.url:
+            due.append(element)
+        else:
+            skipped[element.prefix] = last_result.copy(update={"skipped": True})
+    return due, skipped
+
+
+def get_last_results(runs: Iterable[Run]) -> Dict[str, ProviderStatus]:
+    """Get the result of the last check of each provider.
+
+    :param runs: The runs, in any order
+    :returns: A dictionary from prefixes to the results of their most recent
+        check, which might have been carried over into later runs
+    """
+    rv: Dict[str, ProviderStatus] = {}
+    for run in sorted(runs, key=attrgetter("time"), reverse=True):
+        for status in run.results:
+            rv.setdefault(status.prefix, status)
+    return rv
+
+
+def _get_jitter(prefix: str) -> float:
+    # this has to be the same in each run, so it can't use hash()
+    return JITTER * (zlib.crc32(prefix.encode("utf-8")) / 0xFFFFFFFF)
+
+
+def _calculate_delta(
+    current: Mapping[str, ProviderHistory], previous: Mapping[str, ProviderHistory]
+) -> Delta:
+    current_results = {prefix: history.is_failing() for prefix, history in current.items()}
+    previous_results = {prefix: history.is_failing() for prefix, history in previous.items()}
     new = set(current_results).difference(previous_results)
     forgotten = set(previous_results).difference(current_results)
     intersection_prefixes = set(current_results).intersection(previous_results)
@@ -185,49 +443,102 @@ def _calculate_delta(current: List[ProviderStatus], previous: List[ProviderStatu
     )
 
 
-def _process(element: QueueTuple) -> ProviderStatus:
-    prefix, example, url = element
+def get_results(queue: Iterable[QueueTuple], **kwargs) -> List[ProviderStatus]:
+    """Check the providers' URLs.
+
+    :param queue: The prefixes, examples, and URLs to check
+    :param kwargs: Keyword arguments for :func:`bioregistry.health.engine.check_urls`
+    :returns: The status of each provider, in the same order
+    """
+    queue = list(queue)
+    url_to_prefixes: DefaultDict[str, List[str]] = defaultdict(list)
+    for element in queue:
+        url_to_prefixes[element.url].append(element.prefix)
+
+    def _callback(url: str, result: CheckResult) -> None:
+        if result.failed:
+            _echo_failure(", ".join(url_to_prefixes[url]), url, result.exception)
+
+    url_to_result = check_urls(
+        url_to_prefixes,
+        callback=_callback,
+        desc="Checking providers",
+        unit="prefix",
+        **kwargs,
+    )
+    return [_get_status(element, url_to_result[element.url]) for element in queue]
 
-    status_code: Optional[int]
-    exception: Optional[str]
-    context: Optional[str]
 
-    try:
-        res = requests.head(url, timeout=10, allow_redirects=True)
-    except IOError as e:
-        status_code = None
-        failed = True
-        exception = e.__class__.__name__
-        context = str(e)
-    else:
-        status_code = res.status_code
-        failed = res.status_code != 200
-        exception = None
-        context = None
-
-    if failed:
-        text = (
-            f'[{datetime.datetime.now().strftime("%H:%M:%S")}] '
-            + click.style(prefix, fg="green")
-            + " at "
-            + click.style(url, fg="red")
-            + " failed to download"
-        )
-        if exception:
-            text += ": " + click.style(exception, fg="bright_black")
-        with tqdm.external_write_mode():
-            click.echo(text)
+def _echo_failure(prefix: str, url: str, exception: Optional[str]) -> None:
+    text = (
+        f'[{datetime.datetime.now().strftime("%H:%M:%S")}] '
+        + click.style(prefix, fg="green")
+        + " at "
+        + click.style(url, fg="red")
+        + " failed to download"
+    )
+    if exception:
+        text += ": " + click.style(exception, fg="bright_black")
+    click.echo(text)
+
 
+def _get_status(element: QueueTuple, result: CheckResult) -> ProviderStatus:
     return ProviderStatus(
-        prefix=prefix,
-        example=example,
-        url=url,
-        failed=failed,
-        status_code=status_code,
-        exception=exception,
-        context=context,
+        prefix=element.prefix,
+        example=element.example,
+        url=element.url,
+        failed=result.failed,
+        status_code=result.status_code,
+        exception=result.exception,
+        context=result.context,
+        latency=round(result.latency, 3),
     )
 
 
+def _summarize(results: List[ProviderStatus], total_skipped: Optional[int] = None) -> Summary:
+    total = len(results)
+    total_failed = sum(result.failed for result in results)
+    latencies = _get_latencies(results)
+    return Summary(
+        total_measured=total,
+        total_failed=total_failed,
+        total_success=total - total_failed,
+        failure_percent=round(100 * total_failed / total, 1) if total else 0.0,
+        latency_p50=_round(percentile(latencies, 50)),
+        latency_p95=_round(percentile(latencies, 95)),
+        total_skipped=total_skipped,
+    )
+
+
+def _summarize_hosts(results: List[ProviderStatus]) -> List[HostSummary]:
+    host_to_results: Dict[str, List[ProviderStatus]] = defaultdict(list)
+    for result in results:
+        host_to_results[urlsplit(result.url).netloc.lower()].append(result)
+    rv = []
+    for host, host_results in sorted(host_to_results.items()):
+        latencies = _get_latencies(host_results)
+        rv.append(
+            HostSummary(
+                host=host,
+                total_measured=len(host_results),
+                total_failed=sum(result.failed for result in host_results),
+                latency_p50=_round(percentile(latencies, 50)),
+                latency_p95=_round(percentile(latencies, 95)),
+            )
+        )
+    return rv
+
+
+def _get_latencies(results: Iterable[ProviderStatus]) -> List[float]:
+    # results carried over from an earlier check don't say anything about this run's latency
+    return [
+        result.latency for result in results if result.latency is not None and not result.skipped
+    ]
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
+
+
 if __name__ == "__main__":
     main()
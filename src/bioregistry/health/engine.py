@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+
+"""An :mod:`asyncio` engine for checking that many URLs can be accessed.
+
+The health checks request thousands of URLs, many of which are on a handful of
+hosts. Instead of giving each URL its own thread and connection, a :class:`Checker`:
+
+1. reuses connections with a single :class:`requests.Session`, whose requests
+   are run in a thread pool
+2. limits the number of requests that are sent to each host at the same time,
+   so no host gets all of them while others sit idle
+3. limits the rate of requests across all hosts
+4. retries connection errors and responses that say to try again later (e.g.,
+   429 and 503) with exponential backoff
+5. appends each result to a checkpoint file as it's done, so an interrupted run
+   can be resumed without checking the same URLs again. A checkpoint that was
+   started more than :data:`CHECKPOINT_MAX_AGE` ago is ignored, so old results
+   aren't reported as new ones.
+
+.. code-block:: python
+
+    from bioregistry.health.engine import check_urls
+
+    results = check_urls(
+        ["https://bioregistry.io", "https://example.org/nope"],
+        per_host=2,
+        rate=10.0,
+    )
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
+
+import click
+import requests
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+
+__all__ = [
+    "CheckResult",
+    "Checker",
+    "check_urls",
+    "checker_options",
+    "percentile",
+]
+
+logger = logging.getLogger(__name__)
+
+#: How long the results in a checkpoint can be resumed from, in seconds
+CHECKPOINT_MAX_AGE = 24 * 60 * 60
+
+#: Status codes that mean the request should be tried again later
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+#: The longest time to wait before retrying, even if the server asks for longer
+MAX_BACKOFF = 60.0
+
+
+class CheckResult(NamedTuple):
+    """The result of checking a URL."""
+
+    #: The status code of the last response, if there was one
+    status_code: Optional[int]
+    #: The name of the exception's class, if the last attempt raised one
+    exception: Optional[str]
+    #: The exception's message, if the last attempt raised one
+    context: Optional[str]
+    #: The time, in seconds, that the last attempt took
+    latency: float
+    #: The number of attempts
+    attempts: int = 1
+
+    @property
+    def failed(self) -> bool:
+        """Get if the URL could not be accessed."""
+        return self.status_code != 200
+
+
+class RateLimiter:
+    """Space out events so there are at most a given number per second."""
+
+    def __init__(self, rate: Optional[float] = None):
+        """Instantiate the rate limiter.
+
+        :param rate: The maximum number of events per second. If None, events aren't limited.
+        """
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        """Wait until the next event is allowed."""
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        # there's no await between reading and writing, so this can't race
+        start = max(now, self._next)
+        self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def _get_host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def _get_retry_after(response: requests.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:  # it can also be a date, which isn't worth parsing
+        return None
+
+
+class Checker:
+    """Check URLs concurrently, politely, and resumably."""
+
+    def __init__(
+        self,
+        *,
+        method: str = "HEAD",
+        timeout: float = 10.0,
+        concurrency: int = 32,
+        per_host: int = 2,
+        rate: Optional[float] = None,
+        retries: int = 2,
+        backoff: float = 1.0,
+        session: Optional[requests.Session] = None,
+    ):
+        """Instantiate the checker.
+
+        :param method: The HTTP method, e.g., ``HEAD`` to avoid downloading the
+            content or ``GET`` for hosts that don't implement ``HEAD`` correctly.
+            Redirects are always followed.
+        :param timeout: The timeout, in seconds, for each attempt
+        :param concurrency: The maximum number of requests at the same time
+        :param per_host: The maximum number of requests to the same host at the same time
+        :param rate: The maximum number of requests per second across all hosts.
+            If None, the rate isn't limited.
+        :param retries: The number of times a failed attempt is retried, if it
+            raised an exception or had a status code in :data:`RETRY_STATUS_CODES`
+        :param backoff: The time, in seconds, to wait before the first retry. It
+            doubles for each retry after that.
+        :param session: A session, which is used for all requests. If None, one is
+            made with a connection pool for each host that's large enough for ``per_host``.
+        """
+        self.method = method
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.rate_limiter = RateLimiter(rate)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=per_host)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self._executor = ThreadPoolExecutor(concurrency, thread_name_prefix="bioregistry-health")
+
+    def close(self) -> None:
+        """Shut down the thread pool and close the session's connections."""
+        self._executor.shutdown()
+        self.session.close()
+
+    def __enter__(self) -> "Checker":
+        """Use the checker in a context manager, which closes it on exit."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the checker."""
+        self.close()
+
+    def _request(self, url: str) -> Tuple[Optional[requests.Response], Optional[IOError], float]:
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                self.method, url, timeout=self.timeout, allow_redirects=True
+            )
+        except IOError as e:
+            return None, e, time.perf_counter() - start
+        return response, None, time.perf_counter() - start
+
+    async def check(
+        self,
+        url: str,
+        *,
+        global_semaphore: asyncio.Semaphore,
+        host_semaphore: asyncio.Semaphore,
+    ) -> CheckResult:
+        """Check a URL, retrying if needed.
+
+        :param url: The URL
+        :param global_semaphore: The semaphore that limits all requests
+        :param host_semaphore: The semaphore that limits requests to the URL's host
+        :returns: The result of the last attempt
+        """
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            # take the host's slot first, so waiting for a busy host doesn't
+            # keep requests to other hosts from being sent
+            async with host_semaphore:
+                await self.rate_limiter.wait()
+                async with global_semaphore:
+                    response, exception, latency = await loop.run_in_executor(
+                        self._executor, partial(self._request, url)
+                    )
+            attempt += 1
+            if response is not None:
+                result = CheckResult(response.status_code, None, None, latency, attempt)
+                retry = response.status_code in RETRY_STATUS_CODES
+                retry_after = _get_retry_after(response)
+            else:
+                result = CheckResult(
+                    None, exception.__class__.__name__, str(exception), latency, attempt
+                )
+                retry, retry_after = True, None
+            if not retry or attempt > self.retries:
+                return result
+            delay = self.backoff * 2 ** (attempt - 1)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            logger.debug("retrying %s in %.1fs after attempt %d", url, delay, attempt)
+            await asyncio.sleep(min(delay, MAX_BACKOFF))
+
+    async def iter_check(self, urls: Iterable[str]) -> AsyncIterator[Tuple[str, CheckResult]]:
+        """Check URLs and yield the results as they're done.
+
+        :param urls: URLs. Duplicates are only checked once.
+        :yields: Pairs of URLs and their results, in the order they're done
+        """
+        global_semaphore = asyncio.Semaphore(self.concurrency)
+        host_semaphores: DefaultDict[str, asyncio.Semaphore] = defaultdict(
+            partial(asyncio.Semaphore, self.per_host)
+        )
+
+        async def _check(url: str) -> Tuple[str, CheckResult]:
+            result = await self.check(
+                url,
+                global_semaphore=global_semaphore,
+                host_semaphore=host_semaphores[_get_host(url)],
+            )
+            return url, result
+
+        tasks = [asyncio.ensure_future(_check(url)) for url in dict.fromkeys(urls)]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def _read_checkpoint(path: Path) -> Tuple[Optional[float], Dict[str, CheckResult]]:
+    """Read when a checkpoint was started and its results."""
+    started = None
+    rv = {}
+    with path.open() as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:  # the last line might be incomplete if the run was killed
+                continue
+            if "started" in record:
+                started = record["started"]
+                continue
+            url = record.pop("url")
+            rv[url] = CheckResult(**record)
+    return started, rv
+
+
+def _write_record(file: TextIO, record: Mapping[str, Any]) -> None:
+    file.write(json.dumps(record) + "\n")
+    file.flush()
+
+
+def _open_checkpoint(path: Path) -> TextIO:
+    incomplete = False
+    new = not path.is_file() or not path.stat().st_size
+    if not new:
+        with path.open("rb") as binary_file:
+            binary_file.seek(-1, 2)
+            incomplete = binary_file.read(1) != b"\n"
+    file = path.open("a")
+    if new:
+        _write_record(file, {"started": time.time()})
+    # start on a new line if the last one was cut off
+    elif incomplete:
+        file.write("\n")
+    return file
+
+
+def check_urls(
+    urls: Iterable[str],
+    *,
+    checkpoint: Union[None, str, Path] = None,
+    max_age: float = CHECKPOINT_MAX_AGE,
+    callback: Optional[Callable[[str, CheckResult], None]] = None,
+    desc: str = "Checking URLs",
+    unit: str = "url",
+    **kwargs: Any,
+) -> Dict[str, CheckResult]:
+    """Check URLs with a :class:`Checker`.
+
+    :param urls: URLs. Duplicates are only checked once.
+    :param checkpoint: The path to a file where each result is appended as it's
+        done. If the file already exists, the URLs that it has results for aren't
+        checked again. It should be deleted after a complete run.
+    :param max_age: The number of seconds after a checkpoint was started that its
+        results can be resumed from. An older checkpoint is deleted.
+    :param callback: A function that's called with each URL and its new result
+    :param desc: The description for the progress bar
+    :param unit: The unit for the progress bar
+    :param kwargs: Keyword arguments for :class:`Checker`
+    :returns: A dictionary from each URL to its result
+    """
+    urls = list(dict.fromkeys(urls))
+    rv: Dict[str, CheckResult] = {}
+    if checkpoint is not None:
+        checkpoint = Path(checkpoint)
+        if checkpoint.is_file():
+            started, previous = _read_checkpoint(checkpoint)
+            if started is None or time.time() - started > max_age:
+                logger.warning("ignoring checkpoint from an old run: %s", checkpoint)
+                checkpoint.unlink()
+                previous = {}
+            rv.update((url, previous[url]) for url in urls if url in previous)
+            if rv:
+                logger.info("resuming with %d results from %s", len(rv), checkpoint)
+    remaining = [url for url in urls if url not in rv]
+
+    async def _main() -> None:
+        with Checker(**kwargs) as checker, tqdm(
+            total=len(urls), initial=len(rv), desc=desc, unit=unit
+        ) as progress:
+            file = _open_checkpoint(checkpoint) if checkpoint is not None else None
+            try:
+                async for url, result in checker.iter_check(remaining):
+                    rv[url] = result
+                    if file is not None:
+                        _write_record(file, {"url": url, **result._asdict()})
+                    if callback is not None:
+                        with tqdm.external_write_mode():
+                            callback(url, result)
+                    progress.update()
+            finally:
+                if file is not None:
+                    file.close()
+
+    if remaining:
+        asyncio.run(_main())
+    return rv
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Get a percentile with linear interpolation between the closest values.
+
+    :param values: Values, in any order
+    :param q: The percentile, between 0 and 100
+    :returns: The percentile, or None if there are no values
+
+    >>> percentile([1.0, 2.0, 3.0, 4.0], 50)
+    2.5
+    >>> percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95)
+    4.8
+    >>> percentile([], 50) is None
+    True
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    position = (len(values) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+def checker_options(func: Callable) -> Callable:
+    """Add the options for :class:`Checker` to a command.
+
+    :param func: A click command's function
+    :returns: The function, with options for the concurrency, per-host limit, rate
+        limit, retries, and timeout, and for resuming from a checkpoint
+    """
+    options: List[Callable[[Callable], Callable]] = [
+        click.option(
+            "--concurrency",
+            type=int,
+            default=32,
+            show_default=True,
+            help="The maximum number of requests at the same time",
+        ),
+        click.option(
+            "--per-host",
+            type=int,
+            default=2,
+            show_default=True,
+            help="The maximum number of requests to the same host at the same time",
+        ),
+        click.option(
+            "--rate",
+            type=float,
+            help="The maximum number of requests per second. Not limited by default.",
+        ),
+        click.option("--retries", type=int, default=2, show_default=True),
+        click.option("--timeout", type=float, default=10.0, show_default=True),
+        click.option(
+            "--resume",
+            is_flag=True,
+            help="Resume from the results of a run that was interrupted in the last day",
+        ),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""Serialize JSON with the fastest available backend.
+
+The backends are :mod:`orjson`, :mod:`msgspec`, and the standard library's
+:mod:`json`. The first one that's installed is used, unless one is chosen
+with the ``BIOREGISTRY_JSON_BACKEND`` environment variable (or the
+``json_backend`` key in the ``bioregistry`` section of the :mod:`pystow`
+configuration). All of them encode objects like :func:`json.dumps` with
+``ensure_ascii=False`` and ``default=extended_encoder``, so :mod:`pydantic`
+models, dataclasses, sets, and dates can be serialized. Models are converted
+with :func:`bioregistry.schema.utils.model_to_dict`, which is much faster than
+:meth:`pydantic.BaseModel.dict`.
+
+Indented output is the same for all backends, so the data files don't depend
+on which one is installed. Output that isn't indented is only the same up to
+whitespace: the standard library separates items with ``", "`` and keys from
+values with ``": "``, like :func:`json.dumps` does by default, but
+:mod:`orjson` and :mod:`msgspec` always write compact JSON. :mod:`msgspec`
+also encodes datetimes and dataclasses itself, so it writes UTC offsets in
+datetimes as ``Z`` instead of ``+00:00``.
+
+>>> from bioregistry.json_utils import dumps
+>>> dumps({"b": [1, 2], "a": "c"}, sort_keys=True, backend="json")
+b'{"a": "c", "b": [1, 2]}'
+>>> dumps({"b": [1, 2], "a": "c"}, sort_keys=True, backend="orjson")  # doctest: +SKIP
+b'{"a":"c","b":[1,2]}'
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+import pystow
+from pydantic import BaseModel
+
+from .schema.utils import model_to_dict
+from .utils import extended_encoder
+
+__all__ = [
+    "dumps",
+    "dump",
+    "get_backend",
+    "BACKENDS",
+]
+
+#: A function that takes an object, whether to indent, and whether to sort keys
+#: and returns the UTF-8 encoded JSON
+Serializer = Callable[[Any, bool, bool], bytes]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return model_to_dict(obj, exclude_none=True)
+    return extended_encoder(obj)
+
+
+def _dumps_json(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        default=_default,
+    ).encode("utf-8")
+
+
+def _get_orjson() -> Serializer:
+    import orjson
+
+    def _dumps_orjson(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+        # datetimes and dataclasses are passed to the default function, so they're
+        # encoded the same way as by the standard library
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+
+    return _dumps_orjson
+
+
+def _get_msgspec() -> Serializer:
+    import msgspec
+
+    encoders = {
+        sort_keys: msgspec.json.Encoder(enc_hook=_default, order="sorted" if sort_keys else None)
+        for sort_keys in (False, True)
+    }
+
+    def _dumps_msgspec(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+        rv = encoders[sort_keys].encode(obj)
+        if indent:
+            rv = msgspec.json.format(rv, indent=2)
+        return rv
+
+    return _dumps_msgspec
+
+
+#: Functions that import each backend and return its serializer, in order of preference
+BACKENDS: Dict[str, Callable[[], Serializer]] = {
+    "orjson": _get_orjson,
+    "msgspec": _get_msgspec,
+    "json": lambda: _dumps_json,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_serializer(backend: str) -> Serializer:
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown JSON backend {backend}. Use one of: {sorted(BACKENDS)}")
+    return BACKENDS[backend]()
+
+
+@lru_cache(maxsize=1)
+def get_backend() -> str:
+    """Get the name of the JSON backend that's configured, or else the first one that's installed."""
+    backend = pystow.get_config("bioregistry", "json_backend")
+    if backend is not None:
+        return backend
+    for backend in BACKENDS:
+        try:
+            _get_serializer(backend)
+        except ImportError:
+            continue
+        return backend
+    raise RuntimeError  # the standard library's json module can't be missing
+
+
+def dumps(
+    obj: Any, *, indent: bool = False, sort_keys: bool = False, backend: Optional[str] = None
+) -> bytes:
+    """Serialize an object as JSON.
+
+    :param obj: The object to serialize
+    :param indent: Should the JSON be indented with two spaces?
+    :param sort_keys: Should the keys of objects be sorted?
+    :param backend: The backend to use. Defaults to the one from :func:`get_backend`.
+    :returns: The UTF-8 encoded JSON
+    """
+    return _get_serializer(backend or get_backend())(obj, indent, sort_keys)
+
+
+def dump(
+    obj: Any,
+    path: Union[str, Path],
+    *,
+    indent: bool = True,
+    sort_keys: bool = True,
+    backend: Optional[str] = None,
+) -> None:
+    """Write an object as JSON to a file, indented and with sorted keys by default.
+
+    :param obj: The object to serialize
+    :param path: The path to the file
+    :param indent: Should the JSON be indented with two spaces?
+    :param sort_keys: Should the keys of objects be sorted?
+    :param backend: The backend to use. Defaults to the one from :func:`get_backend`.
+    """
+    Path(path).write_bytes(dumps(obj, indent=indent, sort_keys=sort_keys, backend=backend))
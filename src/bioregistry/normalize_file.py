@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+
+r"""Normalize the CURIEs and IRIs in a large CSV or TSV file.
+
+The file is read and written in chunks of rows, so memory use stays constant
+no matter how large the file is. Chunks can be normalized in several processes,
+in which case the results are still written in the same order as the input.
+
+.. code-block:: shell
+
+    $ bioregistry normalize-file input.tsv output.tsv --curie-column curie \
+        --iri-column xref --summary summary.json
+"""
+
+import csv
+import io
+import json
+import sys
+from collections import Counter
+from contextlib import nullcontext
+from pathlib import Path
+from typing import (
+    IO,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import click
+
+from .resource_manager import manager
+from .utils import curie_to_str, imap_ordered, iter_chunks
+
+__all__ = [
+    "NormalizationSummary",
+    "normalize_rows",
+    "normalize_file",
+]
+
+#: The key in :data:`NormalizationSummary.unknown_prefixes` used for IRIs that
+#: could not be parsed, since they have no prefix to report
+UNPARSABLE_IRI = "<IRI>"
+
+
+class NormalizationSummary:
+    """A summary of the problems encountered while normalizing rows."""
+
+    def __init__(self):
+        """Instantiate an empty summary."""
+        self.rows = 0
+        #: Counts of prefixes that could not be normalized
+        self.unknown_prefixes: Counter = Counter()
+        #: Counts of (normalized) prefixes whose identifiers did not match the pattern
+        self.invalid_identifiers: Counter = Counter()
+        #: The number of cells in CURIE columns that aren't CURIEs, since they have no colon
+        self.not_curies = 0
+
+    def update(self, other: "NormalizationSummary") -> None:
+        """Add the counts from another summary to this one."""
+        self.rows += other.rows
+        self.unknown_prefixes.update(other.unknown_prefixes)
+        self.invalid_identifiers.update(other.invalid_identifiers)
+        self.not_curies += other.not_curies
+
+    def to_dict(self):
+        """Get a JSON-serializable representation of the summary."""
+        return {
+            "rows": self.rows,
+            "unknown_prefixes": dict(self.unknown_prefixes.most_common()),
+            "invalid_identifiers": dict(self.invalid_identifiers.most_common()),
+            "not_curies": self.not_curies,
+        }
+
+
+#: The result of normalizing a single cell: the new value, the unknown prefix
+#: (if the prefix couldn't be normalized), the prefix whose pattern the
+#: identifier didn't match (if any), and whether the value isn't a CURIE at all
+_CellResult = Tuple[str, Optional[str], Optional[str], bool]
+
+
+def _normalize_curie(curie: str) -> _CellResult:
+    prefix, delimiter, _ = curie.partition(":")
+    if not delimiter:
+        return curie, None, None, True
+    norm_prefix, identifier = manager.parse_curie(curie)
+    if norm_prefix is None or identifier is None:
+        return curie, prefix, None, False
+    return _normalize_parsed(norm_prefix, identifier)
+
+
+def _normalize_iri(iri: str) -> _CellResult:
+    prefix, identifier = manager.converter.parse_uri(iri)
+    if prefix is None or identifier is None:
+        return iri, UNPARSABLE_IRI, None, False
+    prefix, identifier = manager.normalize_parsed_curie(prefix, identifier)
+    if prefix is None or identifier is None:
+        return iri, UNPARSABLE_IRI, None, False
+    return _normalize_parsed(prefix, identifier)
+
+
+def _normalize_parsed(prefix: str, identifier: str) -> _CellResult:
+    if manager.is_valid_identifier(prefix, identifier):
+        return curie_to_str(prefix, identifier), None, None, False
+    return curie_to_str(prefix, identifier), None, prefix, False
+
+
+def normalize_rows(
+    rows: Iterable[List[str]],
+    curie_columns: Sequence[int] = (),
+    iri_columns: Sequence[int] = (),
+) -> Tuple[List[List[str]], NormalizationSummary]:
+    """Normalize the CURIEs and IRIs in the given columns of each row.
+
+    :param rows: Rows of cells, which are modified in place
+    :param curie_columns: The indexes of the columns containing CURIEs. These are
+        replaced with normalized CURIEs.
+    :param iri_columns: The indexes of the columns containing IRIs. These are
+        replaced with normalized CURIEs.
+    :returns: A pair of the rows and a summary of the unknown prefixes, invalid
+        identifiers, and values in CURIE columns that aren't CURIEs. Cells that can't
+        be normalized are left as-is and empty cells are skipped.
+
+    >>> rows, summary = normalize_rows(
+    ...     [
+    ...         ["GO:0000001", "http://purl.obolibrary.org/obo/CHEBI_1234"],
+    ...         ["nope:1", ""],
+    ...         ["nope", ""],
+    ...     ],
+    ...     curie_columns=[0],
+    ...     iri_columns=[1],
+    ... )
+    >>> rows
+    [['go:0000001', 'chebi:1234'], ['nope:1', ''], ['nope', '']]
+    >>> summary.unknown_prefixes
+    Counter({'nope': 1})
+    >>> summary.not_curies
+    1
+    """
+    summary = NormalizationSummary()
+    # CURIEs are frequently repeated in a chunk, so they're only normalized once
+    curie_cache: Dict[str, _CellResult] = {}
+    iri_cache: Dict[str, _CellResult] = {}
+    rv = []
+    for row in rows:
+        summary.rows += 1
+        for columns, cache, func in (
+            (curie_columns, curie_cache, _normalize_curie),
+            (iri_columns, iri_cache, _normalize_iri),
+        ):
+            for column in columns:
+                value = row[column]
+                if not value:
+                    continue
+                result = cache.get(value)
+                if result is None:
+                    result = cache[value] = func(value)
+                row[column], unknown_prefix, invalid_prefix, not_curie = result
+                if not_curie:
+                    summary.not_curies += 1
+                if unknown_prefix is not None:
+                    summary.unknown_prefixes[unknown_prefix] += 1
+                if invalid_prefix is not None:
+                    summary.invalid_identifiers[invalid_prefix] += 1
+        rv.append(row)
+    return rv, summary
+
+
+def _normalize_chunk(
+    args: Tuple[List[List[str]], Sequence[int], Sequence[int]],
+) -> Tuple[List[List[str]], NormalizationSummary]:
+    rows, curie_columns, iri_columns = args
+    return normalize_rows(rows, curie_columns=curie_columns, iri_columns=iri_columns)
+
+
+def _get_column_indexes(header: Sequence[str], columns: Sequence[str]) -> List[int]:
+    rv = []
+    for column in columns:
+        if column in header:
+            rv.append(header.index(column))
+        elif column.isdigit() and int(column) < len(header):
+            rv.append(int(column))
+        else:
+            raise click.BadParameter(f"column not found in header: {column}")
+    return rv
+
+
+def _get_delimiter(path: str, delimiter: Optional[str]) -> str:
+    if delimiter is not None:
+        return delimiter
+    if path.endswith(".csv") or path.endswith(".csv.gz"):
+        return ","
+    return "\t"
+
+
+def _open(path: str, mode: str) -> ContextManager[IO]:
+    if path == "-":
+        # don't close the standard streams on exit
+        return nullcontext(sys.stdout if "w" in mode else sys.stdin)
+    if path.endswith(".gz"):
+        import gzip
+
+        return io.TextIOWrapper(gzip.GzipFile(path, mode + "b"), newline="")
+    return open(path, mode, newline="")
+
+
+def _write_summary(path: str, summary: NormalizationSummary) -> None:
+    Path(path).write_text(json.dumps(summary.to_dict(), indent=2) + "\n")
+
+
+def _echo_summary(summary: NormalizationSummary, limit: int = 10) -> None:
+    click.secho(f"Normalized {summary.rows:,} rows", fg="green", err=True)
+    for title, counter in (
+        ("unknown prefixes", summary.unknown_prefixes),
+        ("invalid identifiers", summary.invalid_identifiers),
+    ):
+        if not counter:
+            continue
+        click.secho(f"{sum(counter.values()):,} {title}:", fg="yellow", err=True)
+        for key, count in counter.most_common(limit):
+            click.echo(f"  {key}\t{count:,}", err=True)
+    if summary.not_curies:
+        click.secho(f"{summary.not_curies:,} values that aren't CURIEs", fg="yellow", err=True)
+
+
+@click.command(name="normalize-file")
+@click.argument("input_path", metavar="INPUT", type=click.Path(allow_dash=True))
+@click.argument("output_path", metavar="OUTPUT", type=click.Path(allow_dash=True))
+@click.option(
+    "-c", "--curie-column", "curie_columns", multiple=True, help="Name of a column with CURIEs"
+)
+@click.option("-i", "--iri-column", "iri_columns", multiple=True, help="Name of a column with IRIs")
+@click.option("--delimiter", help="Defaults to a comma for .csv files and a tab otherwise")
+@click.option("--chunksize", type=int, default=10_000, show_default=True)
+@click.option("--processes", type=int, default=1, show_default=True)
+@click.option("--summary", "summary_path", help="Path to write a JSON summary of problems")
+def normalize_file(
+    input_path: str,
+    output_path: str,
+    curie_columns: Sequence[str],
+    iri_columns: Sequence[str],
+    delimiter: Optional[str],
+    chunksize: int,
+    processes: int,
+    summary_path: Optional[str],
+):
+    """Normalize the CURIEs and IRIs in a CSV/TSV file, one chunk at a time."""
+    if not curie_columns and not iri_columns:
+        raise click.UsageError("at least one of --curie-column or --iri-column is required")
+
+    # Build the lookup tables before forking so workers can share them
+    manager.converter  # noqa:B018
+
+    with _open(input_path, "r") as in_file, _open(output_path, "w") as out_file:
+        reader = csv.reader(in_file, delimiter=_get_delimiter(input_path, delimiter))
+        writer = csv.writer(
+            out_file, delimiter=_get_delimiter(output_path, delimiter), lineterminator="\n"
+        )
+        header = next(reader, None)
+        if header is None:
+            raise click.ClickException(f"empty input: {input_path}")
+        writer.writerow(header)
+        summary = NormalizationSummary()
+        curie_indexes = _get_column_indexes(header, curie_columns)
+        iri_indexes = _get_column_indexes(header, iri_columns)
+        for rows, chunk_summary in imap_ordered(
+            _normalize_chunk,
+            ((chunk, curie_indexes, iri_indexes) for chunk in iter_chunks(reader, chunksize)),
+            processes=processes,
+        ):
+            writer.writerows(rows)
+            summary.update(chunk_summary)
+
+    if summary_path:
+        _write_summary(summary_path, summary)
+    _echo_summary(summary)
@@ -9,14 +9,17 @@ with the :func:`get_goa_example` function.
 
 import functools
 import logging
-import re
-from typing import Dict, Optional, Pattern, Union
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from tabulate import tabulate
 from tqdm.auto import tqdm
 
 import bioregistry
+from bioregistry import Resource, manager
+from bioregistry.schema.struct import _standardize_identifier
+from bioregistry.utils import curie_to_str
 
 __all__ = [
     "get_goa_example",
@@ -56,6 +59,52 @@ def _norm_column(df: pd.DataFrame, column: Union[int, str]) -> str:
     return column if isinstance(column, str) else df.columns[column]
 
 
+def _map_unique(series: pd.Series, func: Callable[[str], object]) -> pd.Series:
+    """Apply a function once to each distinct non-null value, then broadcast the results."""
+    codes, uniques = pd.factorize(series)
+    mapped = np.array([func(value) for value in uniques] + [None], dtype=object)
+    rv = mapped[codes]
+    # factorize gives null values the code -1, and these are kept as they were
+    isnull = codes == -1
+    rv[isnull] = series.to_numpy(dtype=object)[isnull]
+    return pd.Series(rv, index=series.index)
+
+
+def _empty_like(series: pd.Series) -> np.ndarray:
+    """Make an object array that has the null values of the series and None elsewhere."""
+    rv = series.to_numpy(dtype=object, copy=True)
+    rv[series.notna().to_numpy()] = None
+    return rv
+
+
+def _iter_prefix_groups(prefixes: pd.Series) -> Iterable[Tuple[str, np.ndarray]]:
+    """Iterate over each distinct non-null prefix and the positions of the rows it appears in."""
+    yield from prefixes.groupby(prefixes, sort=False).indices.items()
+
+
+def _iter_curie_groups(curies: pd.Series) -> Iterable[Tuple[Resource, np.ndarray, List[str]]]:
+    """Iterate over groups of CURIEs whose prefixes normalize to the same resource.
+
+    :param curies: A series of CURIEs, possibly with null values
+    :yields: A resource, the positions in the series of CURIEs with a prefix
+        that normalizes to the resource, and the standardized identifiers
+        from those CURIEs
+    """
+    offsets = np.flatnonzero(curies.notna().to_numpy())
+    parts = [curie.partition(":") for curie in curies.to_numpy(dtype=object)[offsets]]
+    prefixes = pd.Series([prefix if delimiter else None for prefix, delimiter, _ in parts])
+    for prefix, positions in _iter_prefix_groups(prefixes):
+        resource = manager.get_resource(prefix)
+        if resource is None:
+            continue
+        banana, peel = resource.get_banana(), resource.get_banana_peel()
+        identifiers = [
+            _standardize_identifier(parts[position][2], resource.prefix, banana, peel)
+            for position in positions
+        ]
+        yield resource, offsets[positions], identifiers
+
+
 def normalize_prefixes(
     df: pd.DataFrame, column: Union[int, str], *, target_column: Optional[str] = None
 ) -> None:
@@ -80,7 +129,7 @@ def normalize_prefixes(
     column = _norm_column(df, column)
     if target_column is None:
         target_column = column
-    df[target_column] = df[column].map(bioregistry.normalize_prefix, na_action="ignore")
+    df[target_column] = _map_unique(df[column], manager.normalize_prefix)
 
 
 def normalize_curies(
@@ -119,7 +168,11 @@ def normalize_curies(
     column = _norm_column(df, column)
     if target_column is None:
         target_column = column
-    df[target_column] = df[column].map(bioregistry.normalize_curie, na_action="ignore")
+    curies = df[column]
+    rv = _empty_like(curies)
+    for resource, positions, identifiers in _iter_curie_groups(curies):
+        rv[positions] = [curie_to_str(resource.prefix, identifier) for identifier in identifiers]
+    df[target_column] = pd.Series(rv, index=curies.index)
 
 
 def validate_prefixes(
@@ -150,7 +203,7 @@ def validate_prefixes(
         invalid_prefix_df = df[~idx]
     """
     column = _norm_column(df, column)
-    results = df[column].map(lambda x: bioregistry.normalize_prefix(x) == x, na_action="ignore")
+    results = _map_unique(df[column], lambda x: manager.normalize_prefix(x) == x)
     if target_column:
         df[target_column] = results
     return results
@@ -212,7 +265,12 @@ def validate_curies(
         invalid_go_df = df[~idx]
     """
     column = _norm_column(df, column)
-    results = df[column].map(bioregistry.is_valid_curie, na_action="ignore")
+    curies = df[column]
+    notna = curies.notna().to_numpy()
+    valid = manager.validate_curies(curies[notna].tolist()).valid
+    rv = curies.to_numpy(dtype=object, copy=True)
+    rv[notna] = np.frombuffer(valid, dtype=bool)
+    results = pd.Series(rv, index=curies.index).infer_objects()
     if target_column:
         df[target_column] = results
     return results
@@ -255,7 +313,8 @@ def validate_identifiers(
     :param target_column:
         If given, stores the results of validation in this column
     :param use_tqdm:
-        Should a progress bar be shown?
+        Should a progress bar be shown over the groups of rows with the same prefix,
+        if ``prefix_column`` is given?
     :returns:
         A pandas series corresponding to the validity of each row
     :raises PrefixLocationError:
@@ -290,27 +349,7 @@ def validate_identifiers(
             raise ValueError(f"No prefixes found in column {prefix_column}")
         if 1 == len(prefixes):
             return _help_validate_identifiers(df, column, list(prefixes)[0])
-        patterns: Dict[str, Optional[Pattern]] = {}
-        for prefix in df[prefix_column].unique():
-            if pd.isna(prefix):
-                continue
-            pattern = bioregistry.get_pattern(prefix)
-            patterns[prefix] = re.compile(pattern) if pattern else None
-
-        def _validate_lambda(_p: Optional[str], _i: str) -> Optional[bool]:
-            if _p is None:
-                return None
-            _pattern = patterns.get(_p)
-            if _pattern is None:
-                return None
-            return bool(_pattern.fullmatch(_i))
-
-        results = _multi_column_map(
-            df,
-            [prefix_column, column],
-            _validate_lambda,
-            use_tqdm=use_tqdm,
-        )
+        results = _validate_grouped_identifiers(df[prefix_column], df[column], use_tqdm=use_tqdm)
     if target_column:
         df[target_column] = results
     return results
@@ -322,16 +361,40 @@ def _help_validate_identifiers(df, column, prefix):
         raise ValueError(
             f"Can't validate identifiers for {prefix} because it is not in the Bioregistry"
         )
-    pattern = bioregistry.get_pattern(prefix)
+    pattern = manager.get_pattern_re(prefix)
     if pattern is None:
         raise ValueError(
             f"Can't validate identifiers for {prefix} because it has no pattern in the Bioregistry"
         )
-    pattern_re = re.compile(pattern)
-    return df[column].map(
-        lambda s: bool(pattern_re.fullmatch(s)),
-        na_action="ignore",
-    )
+    return df[column].map(lambda s: pattern.fullmatch(s) is not None, na_action="ignore")
+
+
+def _validate_grouped_identifiers(
+    prefixes: pd.Series, identifiers: pd.Series, *, use_tqdm: bool = False
+) -> pd.Series:
+    """Validate identifiers against the pattern for the prefix in the same row.
+
+    :param prefixes: A series of prefixes, possibly with null values
+    :param identifiers: A series of identifiers with the same index, possibly with null values
+    :param use_tqdm: Should a progress bar be shown over the groups of rows with the same prefix?
+    :returns: A series with the same index as the identifiers. Rows with a null prefix
+        or identifier, or whose prefix has no pattern, get None.
+
+    The identifiers for each prefix are matched at once with :meth:`pandas.Series.str.fullmatch`.
+    """
+    rv = np.full(len(identifiers), None, dtype=object)
+    notna = identifiers.notna().to_numpy()
+    groups = _iter_prefix_groups(prefixes)
+    if use_tqdm:
+        groups = tqdm(groups, unit="prefix", desc="Validating")
+    for prefix, positions in groups:
+        pattern = manager.get_pattern_re(prefix)
+        if pattern is None:
+            continue
+        positions = positions[notna[positions]]
+        group = identifiers.iloc[positions].astype(str)
+        rv[positions] = group.str.fullmatch(pattern).to_numpy(dtype=object)
+    return pd.Series(rv, index=identifiers.index)
 
 
 def identifiers_to_curies(
@@ -357,7 +420,7 @@ def identifiers_to_curies(
     :param target_column:
         If given, stores CURIEs in this column,
     :param use_tqdm:
-        Should a progress bar be shown?
+        Ignored, since rows are processed all at once
     :param normalize_prefixes_:
         Should the prefix column get auto-normalized if ``prefix_column`` is not None?
     :raises PrefixLocationError:
@@ -390,17 +453,20 @@ def identifiers_to_curies(
         if norm_prefix is None:
             raise ValueError
 
-        df.loc[target_column] = df[column].map(
-            functools.partial(bioregistry.curie_to_str, prefix=norm_prefix),
-            na_action="ignore",
-        )
+        identifiers = df[column]
+        rv = identifiers.to_numpy(dtype=object, copy=True)
+        notna = identifiers.notna().to_numpy()
+        rv[notna] = (f"{norm_prefix}:" + identifiers[notna].astype(str)).to_numpy()
+        df[target_column] = pd.Series(rv, index=identifiers.index)
     elif prefix_column is not None:
         prefix_column = _norm_column(df, prefix_column)
         if normalize_prefixes_:
             normalize_prefixes(df=df, column=prefix_column)
-        df[target_column] = _multi_column_map(
-            df, [prefix_column, column], bioregistry.curie_to_str, use_tqdm=use_tqdm
-        )
+        prefixes, identifiers = df[prefix_column], df[column]
+        rv = np.full(len(identifiers), None, dtype=object)
+        notna = (prefixes.notna() & identifiers.notna()).to_numpy()
+        rv[notna] = (prefixes[notna] + ":" + identifiers[notna].astype(str)).to_numpy()
+        df[target_column] = pd.Series(rv, index=identifiers.index)
 
 
 def identifiers_to_iris(
@@ -485,7 +551,12 @@ def curies_to_iris(
     .. seealso:: :func:`iris_to_curies`
     """
     column = _norm_column(df, column)
-    df[target_column or column] = df[column].map(bioregistry.get_iri, na_action="ignore")
+    curies = df[column]
+    rv = _empty_like(curies)
+    for resource, positions, identifiers in _iter_curie_groups(curies):
+        get_iri = manager.get_iri
+        rv[positions] = [get_iri(resource.prefix, identifier) for identifier in identifiers]
+    df[target_column or column] = pd.Series(rv, index=curies.index)
 
 
 def curies_to_identifiers(
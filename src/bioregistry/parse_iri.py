@@ -3,18 +3,22 @@
 """Functionality for parsing IRIs."""
 
 import warnings
-from typing import List, Mapping, Optional, Tuple, Union
+from typing import Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import curies
 
 from .resolve import get_default_converter, get_preferred_prefix, parse_curie
 from .resource_manager import prepare_prefix_list
 from .uri_format import get_prefix_map
-from .utils import curie_to_str
+from .utils import BoundedCache, URIPrefixTrie, curie_to_str, imap_ordered, iter_chunks
 
 __all__ = [
     "curie_from_iri",
     "parse_iri",
+    "parse_iris",
     "parse_obolibrary_purl",
     "ensure_prefix_list",
+    "ensure_prefix_trie",
 ]
 
 OLS_URL_PREFIX = "https://www.ebi.ac.uk/ols/ontologies/"
@@ -26,11 +30,16 @@ N2T_PREFIX = "https://n2t.net/"
 
 PrefixList = List[Tuple[str, str]]
 
+#: The converter used by :func:`parse_iris` in each worker process
+_WORKER_CONVERTER: Optional[curies.Converter] = None
+#: The tries built for the most recently used prefix lists, keyed by the lists' identities
+_PREFIX_TRIES = BoundedCache(maxsize=8)
+
 
 def curie_from_iri(
     iri: str,
     *,
-    prefix_map: Union[Mapping[str, str], PrefixList, None] = None,
+    prefix_map: Union[Mapping[str, str], PrefixList, URIPrefixTrie, None] = None,
     use_preferred: bool = False,
 ) -> Optional[str]:
     """Parse a compact identifier from an IRI using :func:`parse_iri` and reconstitute it.
@@ -93,16 +102,18 @@ def curie_from_iri(
 def parse_iri(
     iri: str,
     *,
-    prefix_map: Union[Mapping[str, str], PrefixList, None] = None,
+    prefix_map: Union[Mapping[str, str], PrefixList, URIPrefixTrie, None] = None,
 ) -> Union[Tuple[str, str], Tuple[None, None]]:
     """Parse a compact identifier from an IRI.
 
     :param iri: A valid IRI
     :param prefix_map:
-        If None, will use the default prefix map. If a mapping, will convert into a sorted
-        list using :func:`ensure_prefix_list`. If you plan
+        If None, will use the default prefix map. If a mapping, will convert into a
+        :class:`URIPrefixTrie` using :func:`ensure_prefix_trie`. If you plan
         to use this function in a loop, pre-compute this and pass it instead.
-        If a list of pairs is passed, will use it directly.
+        If a list of pairs is passed, will index it. The index for the most recently
+        used lists is reused, so don't modify a list after passing it. If a trie is
+        passed, will use it directly.
     :return: A pair of prefix/identifier, if can be parsed
 
     IRI from an OBO PURL:
@@ -156,10 +167,10 @@ def parse_iri(
     If you provide your own prefix map but want to do parsing in bulk,
     you should pre-process the prefix map with:
 
-    >>> from bioregistry import ensure_prefix_list
+    >>> from bioregistry import ensure_prefix_trie
     >>> prefix_map = {"chebi": "https://example.org/chebi:"}
-    >>> prefix_list = ensure_prefix_list(prefix_map)
-    >>> parse_iri("https://example.org/chebi:1234", prefix_map=prefix_list)
+    >>> prefix_trie = ensure_prefix_trie(prefix_map)
+    >>> parse_iri("https://example.org/chebi:1234", prefix_map=prefix_trie)
     ('chebi', '1234')
 
     Corner cases:
@@ -172,18 +183,113 @@ def parse_iri(
     if prefix_map is None:
         return get_default_converter().parse_uri(iri)
 
+    if isinstance(prefix_map, URIPrefixTrie):
+        return _parse_iri(iri, prefix_map)
+
     warnings.warn(
         "Parsing without a pre-compiled `curies.Converter` class is very slow. "
         "This functionality will be removed from the Bioregistry in a future version.",
     )
     # TODO remove this and update all relevant docstrings and README
     if isinstance(prefix_map, list):
-        return _parse_iri(iri, prefix_map)
-    prefix_list = ensure_prefix_list(prefix_map)
-    return _parse_iri(iri, prefix_list)
+        return _parse_iri(iri, _get_prefix_trie(prefix_map))
+    return _parse_iri(iri, ensure_prefix_trie(prefix_map))
+
+
+def _get_prefix_trie(prefix_list: PrefixList) -> URIPrefixTrie:
+    # The list's identity is used as the key, since hashing its contents takes as
+    # long as reading the whole list for every IRI. The cache keeps a reference to
+    # the list, so its identity can't be reused by another list while it's cached.
+    cached = _PREFIX_TRIES.lookup(id(prefix_list))
+    if cached is not None and cached[0] is prefix_list:
+        return cached[1]
+    prefix_trie = URIPrefixTrie(prefix_list)
+    _PREFIX_TRIES.set(id(prefix_list), (prefix_list, prefix_trie))
+    return prefix_trie
+
+
+def parse_iris(
+    iris: Iterable[str],
+    *,
+    processes: Optional[int] = None,
+    chunksize: int = 10_000,
+    converter: Optional[curies.Converter] = None,
+) -> Iterator[Union[Tuple[str, str], Tuple[None, None]]]:
+    """Parse compact identifiers from many IRIs in a process pool.
+
+    :param iris: An iterable of IRIs, which is consumed lazily, so it can be
+        a stream over a file that doesn't fit in memory
+    :param processes: The number of worker processes. If None, uses the number of CPUs.
+        If 1, parses in the current process.
+    :param chunksize: The number of IRIs sent to a worker at a time
+    :param converter: A converter to use instead of the default converter
+    :returns: An iterator over a pair of prefix/identifier (or a pair of Nones) for
+        each IRI, in the same order as the IRIs
+    :raises ValueError: If the number of processes is less than 1
+
+    The converter is only built once, in the current process, then shared with
+    the workers. When processes are forked (the default on Linux), the workers
+    inherit it without any copying or serialization, otherwise it's pickled once
+    per worker. Either way, this avoids each worker re-building it from the
+    registry, which takes much longer.
+
+    >>> list(parse_iris(
+    ...     [
+    ...         "http://purl.obolibrary.org/obo/DRON_00023232",
+    ...         "https://example.org/nope",
+    ...         "https://bioregistry.io/chebi:24867",
+    ...     ],
+    ...     processes=1,
+    ... ))
+    [('dron', '00023232'), (None, None), ('chebi', '24867')]
+    """
+    # checked before the generator is made, so the error is raised right away
+    if processes is not None and processes < 1:
+        raise ValueError(f"number of processes must be at least 1: {processes}")
+    if converter is None:
+        converter = get_default_converter()
+    if processes == 1:
+        # parse in the current process without setting the workers' converter
+        return _parse_iri_list(converter, iris)
+    return _parse_iris_pool(iris, processes=processes, chunksize=chunksize, converter=converter)
+
+
+def _parse_iris_pool(
+    iris: Iterable[str],
+    *,
+    processes: Optional[int],
+    chunksize: int,
+    converter: curies.Converter,
+) -> Iterator[Union[Tuple[str, str], Tuple[None, None]]]:
+    for chunk in imap_ordered(
+        _parse_iri_chunk,
+        iter_chunks(iris, chunksize),
+        processes=processes,
+        initializer=_set_worker_converter,
+        initargs=(converter,),
+    ):
+        yield from chunk
 
 
-def _parse_iri(iri: str, prefix_list: List[Tuple[str, str]]):
+def _set_worker_converter(converter: curies.Converter) -> None:
+    global _WORKER_CONVERTER
+    _WORKER_CONVERTER = converter
+
+
+def _parse_iri_chunk(iris: List[str]) -> List[Union[Tuple[str, str], Tuple[None, None]]]:
+    if _WORKER_CONVERTER is None:
+        raise RuntimeError("worker converter was not initialized")
+    return list(_parse_iri_list(_WORKER_CONVERTER, iris))
+
+
+def _parse_iri_list(
+    converter: curies.Converter, iris: Iterable[str]
+) -> Iterator[Union[Tuple[str, str], Tuple[None, None]]]:
+    parse_uri = converter.parse_uri
+    return (tuple(parse_uri(iri)) for iri in iris)  # type: ignore
+
+
+def _parse_iri(iri: str, prefix_trie: URIPrefixTrie):
     if iri.startswith(BIOREGISTRY_PREFIX):
         curie = iri[len(BIOREGISTRY_PREFIX) :]
         return parse_curie(curie)
@@ -201,10 +307,7 @@ def _parse_iri(iri: str, prefix_list: List[Tuple[str, str]]):
     if iri.startswith(N2T_PREFIX):
         curie = iri[len(N2T_PREFIX) :]
         return parse_curie(curie)
-    for prefix, prefix_url in prefix_list:
-        if iri.startswith(prefix_url):
-            return prefix, iri[len(prefix_url) :]
-    return None, None
+    return prefix_trie.parse_uri(iri)
 
 
 def ensure_prefix_list(
@@ -217,6 +320,16 @@ def ensure_prefix_list(
     return prepare_prefix_list(_prefix_map)
 
 
+def ensure_prefix_trie(prefix_map: Optional[Mapping[str, str]] = None, **kwargs) -> URIPrefixTrie:
+    """Ensure a prefix trie, using the given merge strategy with default.
+
+    :param prefix_map: A custom prefix map, whose entries take precedence over the default ones
+    :param kwargs: Keyword arguments passed to :func:`bioregistry.get_prefix_map`
+    :returns: A longest-prefix-match index for passing to :func:`parse_iri`
+    """
+    return URIPrefixTrie(ensure_prefix_list(prefix_map, **kwargs))
+
+
 def _safe_parse_curie(curie: str) -> Union[Tuple[str, str], Tuple[None, None]]:
     for sep in "_/:":
         prefix, identifier = parse_curie(curie, sep)
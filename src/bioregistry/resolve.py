@@ -384,10 +384,7 @@ def get_banana(prefix: str) -> Optional[str]:
     No banana, no namespace in LUI
     >>> assert get_banana('pdb') is None
     """
-    entry = get_resource(prefix)
-    if entry is None:
-        return None
-    return entry.get_banana()
+    return manager.get_banana(prefix)
 
 
 def get_default_format(prefix: str) -> Optional[str]:
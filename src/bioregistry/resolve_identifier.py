@@ -3,16 +3,17 @@
 """Resolvers for CURIE (e.g., pairs of prefix and identifier)."""
 
 import warnings
-from typing import Mapping, Optional, Sequence, Tuple
+from typing import Iterable, Mapping, Optional, Sequence, Tuple
 
 from .resolve import get_resource
-from .resource_manager import manager
+from .resource_manager import CurieValidationResults, manager
 
 __all__ = [
     "is_valid_curie",
     "is_standardizable_curie",
     "is_valid_identifier",
     "is_standardizable_identifier",
+    "validate_curies",
     "get_providers",
     "get_providers_list",
     "get_identifiers_org_iri",
@@ -177,6 +178,27 @@ def is_standardizable_identifier(prefix: str, identifier: str) -> bool:
     return manager.is_standardizable_identifier(prefix, identifier)
 
 
+def validate_curies(
+    curies: Iterable[str], *, standardizable: bool = False, reasons: bool = False
+) -> CurieValidationResults:
+    """Validate many CURIEs at once.
+
+    :param curies: An iterable of compact URIs
+    :param standardizable: If true, checks the CURIEs like :func:`is_standardizable_curie`.
+        Otherwise, checks the CURIEs like :func:`is_valid_curie`.
+    :param reasons: Should a reason code be given for each invalid CURIE?
+    :returns: A compact array of validation results in the same order as the
+        given CURIEs, and if requested, a list of reason codes
+
+    >>> results = validate_curies(["go:0000001", "xxx:yyy", "0000001"], reasons=True)
+    >>> list(results.valid)
+    [1, 0, 0]
+    >>> results.reasons
+    [None, 'unknown_prefix', 'missing_delimiter']
+    """
+    return manager.validate_curies(curies, standardizable=standardizable, reasons=reasons)
+
+
 def standardize_identifier(prefix: str, identifier: str) -> str:
     """Normalize an identifier."""
     resource = get_resource(prefix)
@@ -2,19 +2,28 @@
 
 """A class-based client to a metaregistry."""
 
+import hashlib
+import json
 import logging
+import os
+import pickle
+import platform
+import threading
 import typing
 from collections import Counter, defaultdict
-from functools import lru_cache
 from pathlib import Path
 from typing import (
     Any,
     Callable,
+    DefaultDict,
     Dict,
+    Hashable,
     Iterable,
     List,
     Mapping,
+    NamedTuple,
     Optional,
+    Pattern,
     Sequence,
     Set,
     Tuple,
@@ -23,8 +32,12 @@ from typing import (
 )
 
 import curies
+import pydantic
+import pystow
 
+from .compact import CompactManager, ResourceView
 from .constants import (
+    BIOREGISTRY_MODULE,
     BIOREGISTRY_PATH,
     BIOREGISTRY_REMOTE_URL,
     COLLECTIONS_PATH,
@@ -34,6 +47,7 @@ from .constants import (
     IDENTIFIERS_ORG_URL_PREFIX,
     LINK_PRIORITY,
     METAREGISTRY_PATH,
+    MISMATCH_PATH,
     SHIELDS_BASE,
 )
 from .license_standardizer import standardize_license
@@ -45,6 +59,7 @@ from .schema import (
     Resource,
     sanitize_model,
 )
+from .schema.struct import _standardize_identifier
 from .schema_utils import (
     _collections_from_path,
     _contexts_from_path,
@@ -53,15 +68,221 @@ from .schema_utils import (
     read_mismatches,
     write_registry,
 )
-from .utils import NormDict, _norm, curie_to_str
+from .shared_index import SharedIndex, write_shared_index
+from .utils import (
+    BoundedCache,
+    CacheInfo,
+    NormDict,
+    SearchIndex,
+    URIPrefixTrie,
+    _norm,
+    curie_to_str,
+    get_hexdigests,
+)
+from .version import VERSION
 
 __all__ = [
     "Manager",
     "manager",
+    "CurieValidationResults",
+    "CacheInfo",
+    "ProviderTable",
+    "MappingTable",
+    "ExternalMappings",
 ]
 
 logger = logging.getLogger(__name__)
 
+#: The data files read by a default :class:`Manager`, whose digests key its snapshot
+SNAPSHOT_DATA_PATHS = (
+    BIOREGISTRY_PATH,
+    METAREGISTRY_PATH,
+    COLLECTIONS_PATH,
+    CONTEXTS_PATH,
+    MISMATCH_PATH,
+)
+#: The source files that define the classes in a :class:`Manager`'s snapshot, whose
+#: digests key it, so changing the code that's pickled results in a new snapshot
+SNAPSHOT_SOURCE_PATHS = (
+    Path(__file__),
+    Path(__file__).parent.joinpath("schema", "struct.py"),
+    Path(__file__).parent.joinpath("utils.py"),
+)
+#: The version of the snapshot's format. Increment this when the attributes stored
+#: in a snapshot change, e.g., when one is added to :data:`SNAPSHOT_ATTRIBUTES`.
+SNAPSHOT_FORMAT_VERSION = 2
+#: The attributes of a :class:`Manager` that are stored in its snapshot. Everything
+#: else is derived from them lazily, so it's left out.
+SNAPSHOT_ATTRIBUTES = (
+    "base_url",
+    "registry",
+    "metaregistry",
+    "collections",
+    "contexts",
+    "mismatches",
+    "synonyms",
+    "canonical_for",
+    "provided_by",
+    "has_parts",
+    "_indexed",
+)
+#: A lock held while a lazy :class:`Manager` loads its data
+_LAZY_LOAD_LOCK = threading.Lock()
+#: The default number of entries in a :class:`Manager`'s cache of prefix maps,
+#: converters, and other lookups built from the whole registry
+DEFAULT_CACHE_MAXSIZE = 128
+
+#: The reason given for a CURIE that doesn't contain a colon delimiter
+REASON_MISSING_DELIMITER = "missing_delimiter"
+#: The reason given for a CURIE whose prefix can't be normalized
+REASON_UNKNOWN_PREFIX = "unknown_prefix"
+#: The reason given for a CURIE whose prefix can be normalized, but isn't the canonical one
+REASON_NONSTANDARD_PREFIX = "nonstandard_prefix"
+#: The reason given for a CURIE whose identifier doesn't match the prefix's pattern
+REASON_INVALID_IDENTIFIER = "invalid_identifier"
+
+
+class CurieValidationResults(NamedTuple):
+    """The results of validating many CURIEs with :meth:`Manager.validate_curies`."""
+
+    #: A compact array with one entry for each CURIE, which is 1 if it's valid and 0 if not
+    valid: bytearray
+    #: If requested, a list with one entry for each CURIE, which is None if it's valid
+    #: or a reason code (e.g., ``unknown_prefix``) if not
+    reasons: Optional[List[Optional[str]]]
+
+
+class ProviderTable(NamedTuple):
+    """URL templates for all of the providers of a resource, see :meth:`Manager.get_provider_table`."""
+
+    #: The canonical prefix
+    prefix: str
+    #: The banana, used for standardizing identifiers
+    banana: Optional[str]
+    #: The banana peel, used for standardizing identifiers
+    banana_peel: str
+    #: The banana and peel that get added to identifiers for Identifiers.org
+    #: URLs, or an empty string if there's no banana
+    miriam_banana: str
+    #: Triples of provider codes, whether the provider takes the MIRIAM-style
+    #: identifier (otherwise, it takes the identifier as given), and URL templates
+    #: split on the ``$1`` placeholder
+    providers: List[Tuple[str, bool, List[str]]]
+
+
+class ExternalMappings(NamedTuple):
+    """Mappings between the prefixes of two external registries, see :meth:`MappingTable.get_mappings`."""
+
+    #: A mapping from prefixes in the source registry to prefixes in the target registry
+    mappings: Dict[str, str]
+    #: Sorted prefixes in the source registry for resources not in the target registry
+    source_only: List[str]
+    #: Sorted prefixes in the target registry for resources not in the source registry
+    target_only: List[str]
+
+
+class MappingTable:
+    """A table of the prefixes of each resource in each external registry.
+
+    The table is stored by column, i.e., with a mapping from each metaprefix to
+    a mapping from Bioregistry prefixes to external prefixes, so any column or
+    pair of columns can be read without looking at the other resources.
+
+    >>> from bioregistry import manager
+    >>> table = manager.get_mapping_table()
+    >>> table.get_column("ontobee")["go"]
+    'GO'
+    >>> table.get_mappings("ontobee", "wikidata").mappings["GO"]
+    'P686'
+    """
+
+    def __init__(self, registry: Mapping[str, Resource]):
+        """Build the table.
+
+        :param registry: A registry, whose order is kept in each column
+        """
+        self.columns: Dict[str, Dict[str, str]] = {}
+        for prefix, resource in registry.items():
+            for metaprefix, external_prefix in resource.get_mappings().items():
+                self.columns.setdefault(metaprefix, {})[prefix] = external_prefix
+
+    def get_column(self, metaprefix: str) -> Dict[str, str]:
+        """Get a mapping from Bioregistry prefixes to prefixes in the external registry.
+
+        :param metaprefix: The metaprefix of the external registry
+        :returns: The mapping. It's shared, so it shouldn't be modified.
+        """
+        return self.columns.get(metaprefix, {})
+
+    def count(self) -> typing.Counter[str]:
+        """Count the mappings to each external registry."""
+        return Counter({metaprefix: len(column) for metaprefix, column in self.columns.items()})
+
+    def get_mappings(self, source: str, target: str) -> ExternalMappings:
+        """Get the mappings between the prefixes of two external registries.
+
+        :param source: The metaprefix of the source registry
+        :param target: The metaprefix of the target registry
+        :returns: The mappings between resources in both registries, and the prefixes of
+            resources that are only in one of them
+        """
+        source_column = self.get_column(source)
+        target_column = self.get_column(target)
+        mappings = {
+            source_column[prefix]: target_column[prefix]
+            for prefix in source_column
+            if prefix in target_column
+        }
+        return ExternalMappings(
+            mappings=mappings,
+            source_only=sorted(
+                {
+                    external_prefix
+                    for prefix, external_prefix in source_column.items()
+                    if prefix not in target_column
+                }
+            ),
+            target_only=sorted(
+                {
+                    external_prefix
+                    for prefix, external_prefix in target_column.items()
+                    if prefix not in source_column
+                }
+            ),
+        )
+
+
+#: Functions computing the attributes of a resource that are kept in the
+#: derived attribute index. See :meth:`Manager.get_derived_index_info`.
+DERIVED_ATTRIBUTE_GETTERS: Mapping[str, Callable[[Resource], Any]] = {
+    "pattern": Resource.get_pattern,
+    "uri_format": Resource.get_uri_format,
+    "uri_prefix": Resource.get_uri_prefix,
+    "banana": Resource.get_banana,
+    "preferred_prefix": Resource.get_preferred_prefix,
+    "synonyms": lambda resource: frozenset(resource.get_synonyms()),
+}
+
+
+#: The synonyms of a resource, and pairs of the names of the relation indexes it's
+#: in (e.g., ``has_parts``) with its keys in them
+IndexedKeys = Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+
+
+def _get_indexed_keys(resource: Resource) -> IndexedKeys:
+    """Get the keys that a resource is indexed under."""
+    synonyms = (resource.prefix, *(resource.synonyms or []))
+    relations = tuple(
+        (name, key)
+        for name, key in (
+            ("canonical_for", resource.has_canonical),
+            ("provided_by", resource.provides),
+            ("has_parts", resource.part_of),
+        )
+        if key
+    )
+    return synonyms, relations
+
 
 def _synonym_to_canonical(registry: Mapping[str, Resource]) -> NormDict:
     """Return a mapping from several variants of each synonym to the canonical namespace."""
@@ -85,6 +306,22 @@ def _synonym_to_canonical(registry: Mapping[str, Resource]) -> NormDict:
     return norm_synonym_to_key
 
 
+def _freeze(value: Any) -> Hashable:
+    """Convert a keyword argument into something hashable, for use in a cache key."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(v)) for key, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _get_cache_key(name: str, **kwargs: Any) -> Hashable:
+    """Get a key for :attr:`Manager._cache` from a method name and its arguments."""
+    return (name, *((key, _freeze(value)) for key, value in sorted(kwargs.items())))
+
+
 class Manager:
     """A manager for functionality related to a metaregistry."""
 
@@ -93,6 +330,16 @@ class Manager:
     collections: Dict[str, Collection]
     contexts: Dict[str, Context]
     mismatches: Mapping[str, Mapping[str, str]]
+    _loader: Callable[[], "Manager"]
+    #: The maximum number of entries in the cache used by :meth:`get_cache_info`.
+    #: Can be overridden when instantiating a manager.
+    cache_maxsize: Optional[int] = DEFAULT_CACHE_MAXSIZE
+    #: The memory-mapped index that prefixes, patterns, URI format strings, and
+    #: URIs are looked up in, if one is used. See :meth:`use_shared_index`.
+    shared_index: Optional[SharedIndex] = None
+    #: The compact manager that prefixes and resources' most used attributes are
+    #: looked up in, if one is used. See :meth:`use_compact_views`.
+    compact_manager: Optional[CompactManager] = None
 
     def __init__(
         self,
@@ -102,6 +349,7 @@ class Manager:
         contexts: Union[None, str, Path, Mapping[str, Context]] = None,
         mismatches: Optional[Mapping[str, Mapping[str, str]]] = None,
         base_url: Optional[str] = None,
+        cache_maxsize: Optional[int] = DEFAULT_CACHE_MAXSIZE,
     ):
         """Instantiate a registry manager.
 
@@ -111,7 +359,11 @@ class Manager:
         :param contexts: A custom contexts dictionary. If none, defaults to the Bioregistry's contexts.
         :param mismatches: A custom mismatches dictionary. If none, defaults to the Bioregistry's mismatches.
         :param base_url: The base URL.
+        :param cache_maxsize: The maximum number of prefix maps, converters, and
+            other lookups built from the whole registry to keep cached. If None,
+            the cache is unbounded.
         """
+        self.cache_maxsize = cache_maxsize
         self.base_url = (base_url or BIOREGISTRY_REMOTE_URL).rstrip()
 
         if registry is None:
@@ -120,7 +372,6 @@ class Manager:
             self.registry = dict(_registry_from_path(registry))
         else:
             self.registry = dict(registry)
-        self.synonyms = _synonym_to_canonical(self.registry)
 
         if metaregistry is None:
             self.metaregistry = dict(_read_metaregistry(METAREGISTRY_PATH))
@@ -145,28 +396,150 @@ class Manager:
 
         self.mismatches = dict(read_mismatches() if mismatches is None else mismatches)
 
-        canonical_for = defaultdict(list)
-        provided_by = defaultdict(list)
-        has_parts = defaultdict(list)
+        self._build_indexes()
+        self._init_caches()
+
+    def _build_indexes(self) -> None:
+        """Build the synonym and relation indexes from the registry."""
+        self.synonyms = _synonym_to_canonical(self.registry)
+        relations: Dict[str, DefaultDict[str, List[str]]] = {
+            name: defaultdict(list) for name in ("canonical_for", "provided_by", "has_parts")
+        }
+        #: The synonyms and relation keys that each prefix was indexed under, so
+        #: exactly those can be removed even if the resource is changed in place
+        self._indexed: Dict[str, IndexedKeys] = {}
         for prefix, resource in self.registry.items():
-            if resource.has_canonical:
-                canonical_for[resource.has_canonical].append(prefix)
-            if resource.provides:
-                provided_by[resource.provides].append(prefix)
-            if resource.part_of:
-                has_parts[resource.part_of].append(prefix)
-        self.canonical_for = dict(canonical_for)
-        self.provided_by = dict(provided_by)
-        self.has_parts = dict(has_parts)
-
-        self._converter = None
+            self._indexed[prefix] = indexed = _get_indexed_keys(resource)
+            for name, key in indexed[1]:
+                relations[name][key].append(prefix)
+        self.canonical_for = dict(relations["canonical_for"])
+        self.provided_by = dict(relations["provided_by"])
+        self.has_parts = dict(relations["has_parts"])
+
+    def _init_caches(self) -> None:
+        """Initialize the caches of lookups derived from the data."""
+        self._cache = BoundedCache(maxsize=self.cache_maxsize)
+        # kept outside of the bounded cache, so it's never evicted
+        self._content_hash: Optional[str] = None
+        self._pattern_re_index: Dict[
+            Tuple[str, Optional[bool]], Tuple[Resource, Optional[Pattern[str]]]
+        ] = {}
+        self._derived_index: Dict[Tuple[str, str], Tuple[Resource, Any]] = {}
+        self._provider_tables: Dict[str, Tuple[Resource, ProviderTable]] = {}
+        self._derived_index_hits = 0
+        self._derived_index_misses = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state for pickling, which leaves out caches."""
+        return {key: getattr(self, key) for key in SNAPSHOT_ATTRIBUTES}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state from unpickling."""
+        self.__dict__.update(state)
+        # NormDict's constructor doesn't go through its normalizing __setitem__
+        self.synonyms = NormDict(state["synonyms"])
+        self._init_caches()
+
+    @classmethod
+    def lazy(cls, loader: Optional[Callable[[], "Manager"]] = None) -> "Manager":
+        """Get a manager that doesn't load its data until it's first used.
+
+        :param loader: A function that returns the manager whose data is used.
+            Defaults to :meth:`from_snapshot`.
+        :returns: A manager that calls the loader the first time one of its
+            data attributes (e.g., :data:`registry`) is accessed
+
+        This is how the module-level :data:`bioregistry.manager` is constructed,
+        so importing the Bioregistry doesn't read any data files.
+        """
+        rv = cls.__new__(cls)
+        rv._loader = loader or cls.from_snapshot
+        rv._init_caches()
+        return rv
+
+    def __getattr__(self, name: str) -> Any:
+        """Load the data for a lazy manager the first time it's needed."""
+        # This is only called when normal attribute lookup fails, so it doesn't
+        # cost anything once the data is loaded
+        if name not in SNAPSHOT_ATTRIBUTES or "_loader" not in self.__dict__:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        with _LAZY_LOAD_LOCK:
+            # another thread might have loaded the data while this one waited
+            if "_loader" in self.__dict__:
+                self.__setstate__(self._loader().__getstate__())
+                del self.__dict__["_loader"]
+        return object.__getattribute__(self, name)
+
+    @classmethod
+    def from_snapshot(cls, *, force: bool = False) -> "Manager":
+        """Get a default manager, loading it from a snapshot on disk if one is available.
+
+        :param force: Should the manager be constructed from the data files even
+            if a snapshot is available?
+        :returns: A manager equivalent to ``Manager()``. If there was no up-to-date
+            snapshot, one is written so the next call can load it.
+
+        The snapshot is a pickle of the constructed manager, stored in the
+        ``~/.data/bioregistry/snapshots`` directory. Its name includes a digest of
+        the data files (see :data:`SNAPSHOT_DATA_PATHS`) and of the source files that
+        define the pickled classes (see :data:`SNAPSHOT_SOURCE_PATHS`), the snapshot's
+        format version, the Bioregistry version, and the Python and Pydantic versions,
+        so editing the data or the code or upgrading results in a new snapshot being
+        built. Loading a snapshot takes a few tens of milliseconds instead of the
+        second or so it takes to parse the data files.
+
+        Snapshots can be turned off by setting the ``BIOREGISTRY_SNAPSHOT``
+        environment variable (or the ``snapshot`` key in the ``bioregistry``
+        section of the :mod:`pystow` configuration) to ``false``.
+        """
+        if not _use_snapshot():
+            return cls()
+        path = _get_snapshot_path()
+        if path.is_file() and not force:
+            try:
+                with path.open("rb") as file:
+                    rv = pickle.load(file)  # noqa:S301
+            except Exception as e:
+                logger.warning("could not load snapshot at %s: %s", path, e)
+            else:
+                if isinstance(rv, cls):
+                    return rv
+        rv = cls()
+        try:
+            _write_snapshot(rv, path)
+        except OSError as e:
+            logger.warning("could not write snapshot to %s: %s", path, e)
+        return rv
 
     @property
     def converter(self) -> curies.Converter:
         """Get the default converter."""
-        if self._converter is None:
-            self._converter = curies.Converter(records=self.get_curies_records())
-        return self._converter
+        return self.get_converter()
+
+    def get_content_hash(self) -> str:
+        """Get a digest of the manager's data, which changes whenever the data does.
+
+        :returns: A SHA-256 hex digest of the registry, metaregistry, collections,
+            contexts, mismatches, and base URL. It's computed once and kept until
+            :meth:`clear_caches`, :meth:`upsert_resource`, or :meth:`remove_resource`
+            is called, so call :meth:`clear_caches` after modifying resources in place.
+
+        This is the same across processes and machines for the same data, so it
+        can be used for building ETags for the web application.
+        """
+        if self._content_hash is None:
+            self._content_hash = self._get_content_hash()
+        return self._content_hash
+
+    def _get_content_hash(self) -> str:
+        digest = hashlib.sha256(self.base_url.encode())
+        for name in ("registry", "metaregistry", "collections", "contexts"):
+            for key, model in sorted(getattr(self, name).items()):
+                digest.update(f"\n{name}\t{key}\t".encode())
+                digest.update(model.json(exclude_none=True, sort_keys=True).encode())
+        digest.update(b"\nmismatches\t")
+        digest.update(json.dumps(self.mismatches, sort_keys=True).encode())
+        return digest.hexdigest()
 
     def write_registry(self):
         """Write the registry."""
@@ -220,8 +593,95 @@ class Manager:
             will usually take precedence: MIRIAM, OBO Foundry / OLS, Custom except
             in a few cases, such as NCBITaxon.
         """
+        if self.shared_index is not None:
+            return self.shared_index.normalize_prefix(prefix)
+        if self.compact_manager is not None:
+            return self.compact_manager.normalize_prefix(prefix)
         return self.synonyms.get(prefix)
 
+    def parse_uri(self, uri: str) -> Union[Tuple[str, str], Tuple[None, None]]:
+        """Split a URI into a canonical prefix and identifier using the longest matching URI prefix.
+
+        :param uri: A URI
+        :returns: A pair of the prefix and identifier, like :meth:`curies.Converter.parse_uri`
+            with :data:`converter`, or a pair of Nones if the URI can't be parsed
+
+        >>> from bioregistry import manager
+        >>> manager.parse_uri("http://purl.obolibrary.org/obo/GO_0000001")
+        ('go', '0000001')
+        """
+        if self.shared_index is not None:
+            return self.shared_index.parse_uri(uri)
+        prefix, identifier = self.converter.parse_uri(uri)
+        if prefix is None or identifier is None:
+            return None, None
+        return prefix, identifier
+
+    def write_shared_index(self, path: Union[str, Path]) -> None:
+        """Write a memory-mapped index of the lookups needed for resolution to a file.
+
+        :param path: The path to the file, which can be used with :meth:`use_shared_index`.
+            It's replaced atomically, so processes using an older version aren't affected.
+
+        See :mod:`bioregistry.shared_index` for more information.
+        """
+        write_shared_index(self, path)
+
+    def use_shared_index(self, index: Union[None, str, Path, SharedIndex]) -> None:
+        """Look up prefixes, patterns, URI format strings, and URIs in a shared index.
+
+        :param index: A shared index or the path to one written with
+            :meth:`write_shared_index`. If None, stops using the shared index.
+
+        The index is memory-mapped, so when many worker processes use the same file,
+        they share its memory. Lookups with :meth:`normalize_prefix`, :meth:`parse_uri`,
+        :meth:`get_pattern`, :meth:`get_pattern_re`, and :meth:`get_uri_format`
+        (without a priority) don't touch :data:`registry`, so a lazy manager (see
+        :meth:`lazy`) doesn't load its data until another method needs it.
+
+        Modifying the registry with :meth:`upsert_resource`, :meth:`remove_resource`,
+        or :meth:`clear_caches` stops using the shared index, since it would be outdated.
+        """
+        if isinstance(index, (str, Path)):
+            index = SharedIndex(index)
+        self.shared_index = index
+
+    def use_compact_views(self, compact_manager: Union[bool, CompactManager] = True) -> None:
+        """Look up prefixes and the most used attributes of resources in compact views.
+
+        :param compact_manager: A compact manager, e.g., one that was pickled
+            after getting it with :meth:`compact`. If true, gets one from this
+            manager. If false, stops using compact views.
+
+        Lookups with :meth:`normalize_prefix`, :meth:`normalize_parsed_curie` (and
+        so :meth:`parse_curie` and :meth:`normalize_curie`), :meth:`get_name`,
+        :meth:`get_preferred_prefix`, :meth:`get_banana`, :meth:`get_pattern`,
+        :meth:`get_pattern_re`, :meth:`get_example`, :meth:`is_deprecated`,
+        :meth:`is_valid_identifier`, and :meth:`get_uri_format` and
+        :meth:`get_uri_prefix` (without a priority) read a
+        :class:`bioregistry.compact.ResourceView` instead of a full resource,
+        and give the same results. If a lazy manager (see :meth:`lazy`) is given
+        a compact manager that was loaded from a pickle, these lookups don't load
+        :data:`registry`, so a worker process that only resolves CURIEs only
+        holds the compact views in memory.
+
+        Like with :meth:`use_shared_index`, modifying the registry with
+        :meth:`upsert_resource`, :meth:`remove_resource`, or :meth:`clear_caches`
+        stops using compact views, since they would be outdated.
+
+        >>> from bioregistry import Manager
+        >>> manager = Manager()
+        >>> manager.use_compact_views()
+        >>> manager.normalize_curie("GO:GO:0000001")
+        'go:0000001'
+        """
+        if isinstance(compact_manager, CompactManager):
+            self.compact_manager = compact_manager
+        elif compact_manager:
+            self.compact_manager = self.compact()
+        else:
+            self.compact_manager = None
+
     def get_resource(self, prefix: str) -> Optional[Resource]:
         """Get the Bioregistry entry for the given prefix.
 
@@ -260,19 +720,45 @@ class Manager:
         :return: A normalized prefix/identifier pair, conforming to Bioregistry standards. This means no redundant
             prefixes or bananas, all lowercase.
         """
+        if self.compact_manager is not None:
+            return self.compact_manager.normalize_parsed_curie(prefix, identifier)
         norm_prefix = self.normalize_prefix(prefix)
         if not norm_prefix:
             return None, None
         resource = self.registry[norm_prefix]
-        norm_identifier = resource.standardize_identifier(identifier)
+        norm_identifier = _standardize_identifier(
+            identifier,
+            prefix=resource.prefix,
+            banana=self._get_derived(resource, "banana"),
+            peel=resource.get_banana_peel(),
+        )
         return norm_prefix, norm_identifier
 
-    @lru_cache(maxsize=None)  # noqa:B019
+    def get_mapping_table(self) -> MappingTable:
+        """Get a table of the prefixes of each resource in each external registry.
+
+        :returns: The table, which is built on first use and kept in the cache (see
+            :meth:`get_cache_info`)
+        """
+        return self._cache.get(("mapping_table",), lambda: MappingTable(self.registry))
+
     def get_registry_map(self, metaprefix: str) -> Dict[str, str]:
         """Get a mapping from the Bioregistry prefixes to prefixes in another registry."""
-        return dict(self._iter_registry_map(metaprefix))
+        if metaprefix == "obofoundry":
+            # these use the OBO Foundry's preferred prefixes instead of the mappings,
+            # see Resource.get_mapped_prefix
+            return self._cache.get(
+                _get_cache_key("registry_map", metaprefix=metaprefix),
+                lambda: dict(self._iter_mapped_prefixes(metaprefix)),
+            )
+        return self.get_mapping_table().get_column(metaprefix)
+
+    def _iter_mapped_prefixes(self, metaprefix: str) -> Iterable[Tuple[str, str]]:
+        for prefix, resource in self.registry.items():
+            mapped_prefix = resource.get_mapped_prefix(metaprefix)
+            if mapped_prefix is not None:
+                yield prefix, mapped_prefix
 
-    @lru_cache(maxsize=None)  # noqa:B019
     def get_registry_invmap(self, metaprefix: str, normalize: bool = False) -> Dict[str, str]:
         """Get a mapping from prefixes in another registry to Bioregistry prefixes.
 
@@ -287,6 +773,12 @@ class Manager:
         >>> obofoundry_to_bioregistry["geo"]
         'geogeo'
         """
+        return self._cache.get(
+            _get_cache_key("registry_invmap", metaprefix=metaprefix, normalize=normalize),
+            lambda: self._get_registry_invmap(metaprefix, normalize=normalize),
+        )
+
+    def _get_registry_invmap(self, metaprefix: str, normalize: bool) -> Dict[str, str]:
         if normalize:
             return {
                 _norm(external_prefix): prefix
@@ -298,10 +790,7 @@ class Manager:
         }
 
     def _iter_registry_map(self, metaprefix: str) -> Iterable[Tuple[str, str]]:
-        for prefix, resource in self.registry.items():
-            mapped_prefix = resource.get_mapped_prefix(metaprefix)
-            if mapped_prefix is not None:
-                yield prefix, mapped_prefix
+        return self.get_registry_map(metaprefix).items()
 
     def get_mapped_prefix(self, prefix: str, metaprefix: str) -> Optional[str]:
         """Get the prefix mapped into another registry."""
@@ -328,20 +817,32 @@ class Manager:
 
     def get_uri_format(self, prefix, priority: Optional[Sequence[str]] = None) -> Optional[str]:
         """Get the URI format string for the given prefix, if it's available."""
+        if priority is None and self.shared_index is not None:
+            return self.shared_index.get_uri_format(prefix)
+        if priority is None and self.compact_manager is not None:
+            return self.compact_manager.get_uri_format(prefix)
         entry = self.get_resource(prefix)
         if entry is None:
             return None
+        if priority is None:
+            return self._get_derived(entry, "uri_format")
         return entry.get_uri_format(priority=priority)
 
     def get_uri_prefix(self, prefix, priority: Optional[Sequence[str]] = None) -> Optional[str]:
         """Get a well-formed URI prefix, if available."""
+        if priority is None and self.compact_manager is not None:
+            return self.compact_manager.get_uri_prefix(prefix)
         entry = self.get_resource(prefix)
         if entry is None:
             return None
+        if priority is None:
+            return self._get_derived(entry, "uri_prefix")
         return entry.get_uri_prefix(priority=priority)
 
     def get_name(self, prefix: str) -> Optional[str]:
         """Get the name for the given prefix, it it's available."""
+        if self.compact_manager is not None:
+            return self.compact_manager.get_name(prefix)
         entry = self.get_resource(prefix)
         if entry is None:
             return None
@@ -363,24 +864,288 @@ class Manager:
 
     def get_preferred_prefix(self, prefix: str) -> Optional[str]:
         """Get the preferred prefix (e.g., with stylization) if it exists."""
+        if self.compact_manager is not None:
+            return self.compact_manager.get_preferred_prefix(prefix)
+        entry = self.get_resource(prefix)
+        if entry is None:
+            return None
+        return self._get_derived(entry, "preferred_prefix")
+
+    def get_banana(self, prefix: str) -> Optional[str]:
+        """Get the banana (i.e., the redundant prefix before an identifier) if it exists."""
+        if self.compact_manager is not None:
+            return self.compact_manager.get_banana(prefix)
         entry = self.get_resource(prefix)
         if entry is None:
             return None
-        return entry.get_preferred_prefix()
+        return self._get_derived(entry, "banana")
 
     def get_pattern(self, prefix: str) -> Optional[str]:
         """Get the pattern for the given prefix, if it's available."""
+        if self.shared_index is not None:
+            return self.shared_index.get_pattern(prefix)
+        if self.compact_manager is not None:
+            return self.compact_manager.get_pattern(prefix)
         entry = self.get_resource(prefix)
         if entry is None:
             return None
-        return entry.get_pattern()
+        return self._get_derived(entry, "pattern")
+
+    def get_pattern_re(self, prefix: str) -> Optional[Pattern[str]]:
+        """Get the compiled pattern for the given prefix, if it's available.
+
+        :param prefix: The prefix to look up, which is normalized with :func:`normalize_prefix`
+        :returns: The compiled pattern for the prefix, if it is available. Compiled patterns
+            are kept in an index on the manager, so repeated lookups are cheap.
+
+        >>> from bioregistry import manager
+        >>> manager.get_pattern_re("go").fullmatch("0000001")
+        <re.Match object; span=(0, 7), match='0000001'>
+        """
+        if self.shared_index is not None:
+            return self.shared_index.get_pattern_re(prefix)
+        if self.compact_manager is not None:
+            return self.compact_manager.get_pattern_re(prefix)
+        entry = self.get_resource(prefix)
+        if entry is None:
+            return None
+        return self._get_pattern_re(entry)
+
+    def get_pattern_re_with_banana(
+        self, prefix: str, strict: bool = True
+    ) -> Optional[Pattern[str]]:
+        """Get the compiled pattern for the given prefix including a banana, if it's available.
+
+        :param prefix: The prefix to look up, which is normalized with :func:`normalize_prefix`
+        :param strict: If True (default), and a banana exists for the prefix,
+            the banana is required in the pattern. If False, the pattern
+            will match the banana if present but will also match the identifier
+            without the banana.
+        :returns: The compiled pattern for the prefix, if it is available.
+
+        >>> from bioregistry import manager
+        >>> manager.get_pattern_re_with_banana("chebi").fullmatch("1234")
+
+        >>> manager.get_pattern_re_with_banana("chebi", strict=False).fullmatch("1234")
+        <re.Match object; span=(0, 4), match='1234'>
+        """
+        entry = self.get_resource(prefix)
+        if entry is None:
+            return None
+        return self._get_pattern_re(entry, banana=strict)
+
+    def _get_pattern_re(
+        self, resource: Resource, banana: Optional[bool] = None
+    ) -> Optional[Pattern[str]]:
+        """Get a compiled pattern from the index, building it if necessary.
+
+        :param resource: The resource whose pattern should be compiled
+        :param banana: If None, gets the pattern without a banana. If true,
+            gets the pattern that requires the banana. If false, gets the
+            pattern where the banana is optional.
+        :returns: The compiled pattern, if the resource has one
+
+        Entries are keyed on the prefix and checked against the identity of the
+        resource they were built from, so replacing, adding, or removing resources
+        in :data:`registry` is picked up automatically. Use :meth:`clear_pattern_index`
+        after modifying a resource in place.
+        """
+        key = resource.prefix, banana
+        cached = self._pattern_re_index.get(key)
+        if cached is not None and cached[0] is resource:
+            return cached[1]
+        if banana is None:
+            pattern = resource.get_pattern_re()
+        else:
+            pattern = resource.get_pattern_re_with_banana(strict=banana)
+        self._pattern_re_index[key] = resource, pattern
+        return pattern
+
+    def clear_pattern_index(self) -> None:
+        """Clear the index of compiled patterns, e.g., after modifying resources in place."""
+        self._pattern_re_index.clear()
+
+    def _get_derived(self, resource: Resource, name: str) -> Any:
+        """Get an attribute of a resource from the derived attribute index, computing it if necessary.
+
+        :param resource: The resource
+        :param name: The name of the attribute, a key in :data:`DERIVED_ATTRIBUTE_GETTERS`
+        :returns: The value of the attribute
+
+        Like with :meth:`_get_pattern_re`, entries are checked against the identity
+        of the resource they were computed from, so replacing, adding, or removing
+        resources in :data:`registry` is picked up automatically. Use
+        :meth:`clear_derived_index` after modifying a resource in place.
+        """
+        key = resource.prefix, name
+        cached = self._derived_index.get(key)
+        if cached is not None and cached[0] is resource:
+            self._derived_index_hits += 1
+            return cached[1]
+        self._derived_index_misses += 1
+        value = DERIVED_ATTRIBUTE_GETTERS[name](resource)
+        self._derived_index[key] = resource, value
+        return value
+
+    def warm_derived_index(self) -> None:
+        """Compute all derived attributes for all resources up-front.
+
+        This is useful before forking worker processes or serving web requests,
+        so the first lookups for each prefix don't have to compute them.
+        """
+        for resource in self.registry.values():
+            for name in DERIVED_ATTRIBUTE_GETTERS:
+                self._get_derived(resource, name)
+            self._get_pattern_re(resource)
+
+    def clear_derived_index(self, prefix: Optional[str] = None) -> None:
+        """Clear the derived attribute and compiled pattern indexes.
+
+        :param prefix: If given, only clears the entries for this (canonical)
+            prefix, e.g., after modifying its resource in place. Otherwise, clears
+            all entries.
+        """
+        if prefix is None:
+            self._derived_index.clear()
+            self._pattern_re_index.clear()
+            self._provider_tables.clear()
+            return
+        for derived_key in [key for key in self._derived_index if key[0] == prefix]:
+            del self._derived_index[derived_key]
+        for pattern_key in [key for key in self._pattern_re_index if key[0] == prefix]:
+            del self._pattern_re_index[pattern_key]
+        self._provider_tables.pop(prefix, None)
+
+    def get_derived_index_info(self) -> CacheInfo:
+        """Get the hits, misses, and size of the derived attribute index.
+
+        :returns: The statistics of the index. Its size is the number of
+            (prefix, attribute) pairs that have been looked up since it was last cleared.
+
+        >>> from bioregistry import Manager
+        >>> manager = Manager()
+        >>> manager.get_banana("go")
+        'GO'
+        >>> manager.get_banana("GO")
+        'GO'
+        >>> manager.get_derived_index_info()
+        CacheInfo(hits=1, misses=1, currsize=1)
+        """
+        return CacheInfo(
+            hits=self._derived_index_hits,
+            misses=self._derived_index_misses,
+            currsize=len(self._derived_index),
+        )
+
+    def clear_caches(self) -> None:
+        """Clear all caches and rebuild the synonym index, e.g., after modifying the registry.
+
+        This clears the cache of prefix maps, converters, and other lookups built
+        from the whole registry (see :meth:`get_cache_info`) as well as the derived
+        attribute index (see :meth:`clear_derived_index`). The statistics are kept.
+        """
+        self.shared_index = None
+        self.compact_manager = None
+        self._build_indexes()
+        self._cache.clear()
+        self._content_hash = None
+        self.clear_derived_index()
+
+    def upsert_resource(self, resource: Resource) -> None:
+        """Add a resource, or replace the one with the same prefix, and update the indexes in place.
+
+        :param resource: The resource to add
+        :raises KeyError: If one of the resource's synonyms is already a synonym
+            for another resource. In this case, nothing is changed.
+
+        The synonym and relation indexes are patched using only the old and new
+        versions of the resource, so this takes time proportional to the number
+        of synonyms rather than the size of the registry. The cached prefix maps
+        and converters (see :meth:`get_cache_info`) are dropped and rebuilt the
+        next time they're used.
+
+        >>> from bioregistry import Manager, Resource
+        >>> manager = Manager()
+        >>> manager.upsert_resource(Resource(prefix="nopenope", synonyms=["NOPE"]))
+        >>> manager.normalize_prefix("nope")
+        'nopenope'
+        """
+        prefix = resource.prefix
+        for synonym in (prefix, *(resource.synonyms or [])):
+            other = self.synonyms.get(synonym)
+            if other is not None and other != prefix:
+                raise KeyError(f"[{prefix}] synonym {synonym} is already used by {other}")
+        if prefix in self.registry:
+            self._remove_from_indexes(prefix)
+        self.registry[prefix] = resource
+        self._indexed[prefix] = indexed = _get_indexed_keys(resource)
+        synonyms, relations = indexed
+        for synonym in synonyms:
+            self.synonyms[synonym] = prefix
+        for name, key in relations:
+            getattr(self, name).setdefault(key, []).append(prefix)
+        self._cache.clear()
+        self._content_hash = None
+        self.shared_index = None
+        self.compact_manager = None
+
+    def remove_resource(self, prefix: str) -> Resource:
+        """Remove a resource and update the indexes in place.
+
+        :param prefix: The canonical prefix of the resource to remove
+        :returns: The removed resource
+        :raises KeyError: If there's no resource with the given prefix
+
+        Like :meth:`upsert_resource`, this takes time proportional to the number
+        of synonyms of the resource rather than the size of the registry.
+        """
+        resource = self.registry.pop(prefix, None)
+        if resource is None:
+            raise KeyError(f"there's no resource with the prefix {prefix}")
+        self._remove_from_indexes(prefix)
+        self._cache.clear()
+        self._content_hash = None
+        self.shared_index = None
+        self.compact_manager = None
+        return resource
+
+    def _remove_from_indexes(self, prefix: str) -> None:
+        # the keys recorded when the prefix was indexed are used instead of the
+        # resource's current ones, since the resource might have been changed in place
+        synonyms, relations = self._indexed.pop(prefix)
+        for synonym in synonyms:
+            if self.synonyms.get(synonym) == prefix:
+                del self.synonyms[synonym]
+        for name, key in relations:
+            index = getattr(self, name)
+            index[key].remove(prefix)
+            if not index[key]:
+                del index[key]
+        self.clear_derived_index(prefix)
+
+    def get_cache_info(self) -> CacheInfo:
+        """Get the hits, misses, and size of the cache of lookups built from the whole registry.
+
+        :returns: The statistics of the cache
+
+        This cache holds prefix maps, pattern maps, registry maps, converters, and
+        URI prefix indexes. Its size is bounded by :data:`cache_maxsize`.
+
+        >>> from bioregistry import Manager
+        >>> manager = Manager()
+        >>> _ = manager.get_registry_map("obofoundry")
+        >>> _ = manager.get_registry_map("obofoundry")
+        >>> manager.get_cache_info()
+        CacheInfo(hits=1, misses=1, currsize=1)
+        """
+        return self._cache.info()
 
     def get_synonyms(self, prefix: str) -> Optional[Set[str]]:
         """Get the synonyms for a given prefix, if available."""
         entry = self.get_resource(prefix)
         if entry is None:
             return None
-        return entry.get_synonyms()
+        return set(self._get_derived(entry, "synonyms"))
 
     def get_keywords(self, prefix: str) -> Optional[List[str]]:
         """Get keywords associated with a given prefix, if available."""
@@ -391,6 +1156,8 @@ class Manager:
 
     def get_example(self, prefix: str) -> Optional[str]:
         """Get an example identifier, if it's available."""
+        if self.compact_manager is not None:
+            return self.compact_manager.get_example(prefix)
         entry = self.get_resource(prefix)
         if entry is None:
             return None
@@ -405,6 +1172,8 @@ class Manager:
 
     def is_deprecated(self, prefix: str) -> bool:
         """Return if the given prefix corresponds to a deprecated resource."""
+        if self.compact_manager is not None:
+            return self.compact_manager.is_deprecated(prefix)
         entry = self.get_resource(prefix)
         if entry is None:
             return False
@@ -427,8 +1196,33 @@ class Manager:
             the same URI prefix?
         :param remapping: A mapping from prefixes to preferred prefixes.
         :param blacklist: Prefixes to skip
-        :return: A mapping from prefixes to regular expression pattern strings.
+        :return: A mapping from prefixes to regular expression pattern strings. It's
+            cached, so it shouldn't be modified.
         """
+        return self._cache.get(
+            _get_cache_key(
+                "pattern_map",
+                prefix_priority=prefix_priority,
+                include_synonyms=include_synonyms,
+                remapping=remapping,
+                blacklist=blacklist,
+            ),
+            lambda: self._get_pattern_map(
+                prefix_priority=prefix_priority,
+                include_synonyms=include_synonyms,
+                remapping=remapping,
+                blacklist=blacklist,
+            ),
+        )
+
+    def _get_pattern_map(
+        self,
+        *,
+        prefix_priority: Optional[Sequence[str]] = None,
+        include_synonyms: bool = False,
+        remapping: Optional[Mapping[str, str]] = None,
+        blacklist: Optional[typing.Collection[str]] = None,
+    ) -> Mapping[str, str]:
         it = self._iter_pattern_map(
             include_synonyms=include_synonyms, prefix_priority=prefix_priority, blacklist=blacklist
         )
@@ -457,8 +1251,15 @@ class Manager:
                     yield synonym, pattern
 
     def get_converter(self, **kwargs) -> curies.Converter:
-        """Get a converter from this manager."""
-        return curies.Converter(records=self.get_curies_records(**kwargs))
+        """Get a converter from this manager.
+
+        :param kwargs: Keyword arguments passed to :meth:`get_curies_records`
+        :returns: A converter. It's cached, so it shouldn't be modified.
+        """
+        return self._cache.get(
+            _get_cache_key("converter", **kwargs),
+            lambda: curies.Converter(records=self.get_curies_records(**kwargs)),
+        )
 
     def get_curies_records(
         self,
@@ -507,7 +1308,13 @@ class Manager:
     def get_reverse_prefix_map(
         self, include_prefixes: bool = False, strict: bool = False
     ) -> Mapping[str, str]:
-        """Get a reverse prefix map, pointing to canonical prefixes."""
+        """Get a reverse prefix map, pointing to canonical prefixes. It's cached, so it shouldn't be modified."""
+        return self._cache.get(
+            _get_cache_key("reverse_prefix_map", include_prefixes=include_prefixes, strict=strict),
+            lambda: self._get_reverse_prefix_map(include_prefixes=include_prefixes, strict=strict),
+        )
+
+    def _get_reverse_prefix_map(self, include_prefixes: bool, strict: bool) -> Mapping[str, str]:
         from .record_accumulator import _iterate_prefix_prefix
 
         rv: Dict[str, str] = {
@@ -538,6 +1345,57 @@ class Manager:
 
         return rv
 
+    def get_uri_prefix_trie(
+        self, include_prefixes: bool = False, strict: bool = False
+    ) -> URIPrefixTrie:
+        """Get a longest-prefix-match index over the reverse prefix map.
+
+        :param include_prefixes: See :meth:`get_reverse_prefix_map`
+        :param strict: See :meth:`get_reverse_prefix_map`
+        :returns: An index from URI prefixes to canonical prefixes, which is built
+            on first use and reused afterwards
+
+        >>> from bioregistry import manager
+        >>> trie = manager.get_uri_prefix_trie()
+        >>> trie.parse_uri("https://www.alzforum.org/mutations/1234")
+        ('alzforum.mutation', '1234')
+        """
+        return self._cache.get(
+            _get_cache_key("uri_prefix_trie", include_prefixes=include_prefixes, strict=strict),
+            lambda: URIPrefixTrie(
+                (prefix, uri_prefix)
+                for uri_prefix, prefix in self.get_reverse_prefix_map(
+                    include_prefixes=include_prefixes, strict=strict
+                ).items()
+            ),
+        )
+
+    def get_search_index(self) -> SearchIndex:
+        """Get an index for searching prefixes by their synonyms, names, and keywords.
+
+        :returns: An index whose values are pairs of prefixes and the text that
+            matched, or an empty string if it's the prefix itself. Synonyms are
+            ranked before names, which are ranked before keywords.
+
+        >>> from bioregistry import manager
+        >>> manager.get_search_index().search("chebi", limit=2)
+        [('chebi', ''), ('chebi', 'chebiid')]
+        """
+        return self._cache.get(("search_index",), self._build_search_index)
+
+    def _build_search_index(self) -> SearchIndex:
+        entries: List[Tuple[str, int, Tuple[str, str]]] = [
+            (synonym, 0, (prefix, synonym if _norm(prefix) != synonym else ""))
+            for synonym, prefix in self.synonyms.items()
+        ]
+        for prefix, resource in self.registry.items():
+            name = resource.get_name()
+            if name:
+                entries.append((name, 1, (prefix, name)))
+            for keyword in resource.get_keywords():
+                entries.append((keyword, 2, (prefix, keyword)))
+        return SearchIndex(entries)
+
     def get_prefix_map(
         self,
         *,
@@ -559,8 +1417,36 @@ class Manager:
             the same URI prefix?
         :param remapping: A mapping from Bioregistry prefixes to preferred prefixes.
         :param blacklist: Prefixes to skip
-        :return: A mapping from prefixes to URI prefixes.
+        :return: A mapping from prefixes to URI prefixes. It's cached, so it
+            shouldn't be modified.
         """
+        return self._cache.get(
+            _get_cache_key(
+                "prefix_map",
+                uri_prefix_priority=uri_prefix_priority,
+                prefix_priority=prefix_priority,
+                include_synonyms=include_synonyms,
+                remapping=remapping,
+                blacklist=blacklist,
+            ),
+            lambda: self._get_prefix_map(
+                uri_prefix_priority=uri_prefix_priority,
+                prefix_priority=prefix_priority,
+                include_synonyms=include_synonyms,
+                remapping=remapping,
+                blacklist=blacklist,
+            ),
+        )
+
+    def _get_prefix_map(
+        self,
+        *,
+        uri_prefix_priority: Optional[Sequence[str]] = None,
+        prefix_priority: Optional[Sequence[str]] = None,
+        include_synonyms: bool = False,
+        remapping: Optional[Mapping[str, str]] = None,
+        blacklist: Optional[typing.Collection[str]] = None,
+    ) -> Mapping[str, str]:
         records = self.get_curies_records(
             prefix_priority=prefix_priority,
             uri_prefix_priority=uri_prefix_priority,
@@ -603,6 +1489,43 @@ class Manager:
         p = p.replace(".", "\\.")
         return f"^{p}:{pattern.lstrip('^')}"
 
+    def get_resource_view(self, prefix: str) -> Optional[ResourceView]:
+        """Get a compact, read-only view of the resource for the given prefix.
+
+        :param prefix: The prefix to look up, which is normalized with :func:`normalize_prefix`
+        :returns: A view of the fields needed to resolve the prefix and its identifiers,
+            resolved the same way as in :meth:`rasterized_resource`
+
+        >>> from bioregistry import manager
+        >>> manager.get_resource_view("GO").preferred_prefix
+        'GO'
+        """
+        entry = self.get_resource(prefix)
+        if entry is None:
+            return None
+        return ResourceView.from_resource(entry)
+
+    def compact(self) -> CompactManager:
+        """Get a compact manager for resolving prefixes and CURIEs.
+
+        :returns: A manager holding only a :class:`bioregistry.compact.ResourceView`
+            of each resource and the synonym index. Its lookups give the same results
+            as this manager's, but it takes a fraction of the memory, so it's useful
+            for worker processes that only need to resolve CURIEs.
+
+        >>> from bioregistry import manager
+        >>> compact_manager = manager.compact()
+        >>> compact_manager.normalize_curie("GO:GO:0000001")
+        'go:0000001'
+        """
+        return CompactManager(
+            {
+                prefix: ResourceView.from_resource(resource)
+                for prefix, resource in self.registry.items()
+            },
+            self.synonyms,
+        )
+
     def rasterize(self):
         """Build a dictionary representing the fully constituted registry."""
         return {
@@ -992,29 +1915,131 @@ class Manager:
             "scholia": self.get_scholia_iri,
         }
 
-    def get_providers_list(self, prefix: str, identifier: str) -> Sequence[Tuple[str, str]]:
-        """Get all providers for the CURIE."""
-        rv = []
-        for metaprefix, get_url in self.get_provider_functions().items():
-            link = get_url(prefix, identifier)
-            if link is not None:
-                rv.append((metaprefix, link))
+    def get_provider_table(self, prefix: str) -> Optional[ProviderTable]:
+        """Get the URL templates for all providers for the given prefix.
+
+        :param prefix: The prefix, which is normalized with :meth:`normalize_prefix`
+        :returns: The templates used by :meth:`get_providers_list`, in the same order as
+            the functions from :meth:`get_provider_functions` followed by the extra
+            providers. These are built the first time they're needed for each prefix,
+            and checked against the identity of the resource like :meth:`_get_derived`.
 
+        >>> from bioregistry import manager
+        >>> table = manager.get_provider_table("chebi")
+        >>> table.providers[0]
+        ('default', False, ['https://www.ebi.ac.uk/chebi/searchId.do?chebiId=CHEBI:', ''])
+        """
         resource = self.get_resource(prefix)
         if resource is None:
-            raise KeyError
-        for provider in resource.get_extra_providers():
-            rv.append((provider.code, provider.resolve(identifier)))
+            return None
+        return self._get_provider_table(resource)
+
+    def _get_provider_table(self, resource: Resource) -> ProviderTable:
+        cached = self._provider_tables.get(resource.prefix)
+        if cached is not None and cached[0] is resource:
+            return cached[1]
+        rv = self._build_provider_table(resource)
+        self._provider_tables[resource.prefix] = resource, rv
+        return rv
+
+    def _build_provider_table(self, resource: Resource) -> ProviderTable:
+        providers: List[Tuple[str, bool, List[str]]] = []
+
+        default_format = resource.get_default_format()
+        if default_format is not None:
+            providers.append(("default", False, default_format.split("$1")))
+
+        banana = self._get_derived(resource, "banana")
+        miriam_banana = f"{banana}{resource.get_banana_peel()}" if banana else ""
+        miriam_prefix = resource.get_miriam_prefix()
+        if miriam_prefix is not None:
+            # see Resource.get_miriam_curie(). If the banana peel has been annotated
+            # explicitly, it's redundant and the Identifiers.org prefix isn't used
+            if banana and resource.banana_peel is None:
+                miriam_uri_prefix = IDENTIFIERS_ORG_URL_PREFIX
+            else:
+                miriam_uri_prefix = f"{IDENTIFIERS_ORG_URL_PREFIX}{miriam_prefix}:"
+            providers.append(("miriam", True, [miriam_uri_prefix, ""]))
+
+        obofoundry_format = self._get_resolver_uri_format("obofoundry", resource)
+        if obofoundry_format is not None:
+            providers.append(("obofoundry", False, obofoundry_format.split("$1")))
+
+        ols_prefix = resource.get_mapped_prefix("ols")
+        if ols_prefix is not None and obofoundry_format is not None:
+            ols_format = (
+                f"https://www.ebi.ac.uk/ols/ontologies/{ols_prefix}/terms?iri={obofoundry_format}"
+            )
+            providers.append(("ols", False, ols_format.split("$1")))
+
+        n2t_format = self._get_resolver_uri_format("n2t", resource)
+        if n2t_format is not None:
+            providers.append(("n2t", False, n2t_format.split("$1")))
+
+        bioportal_prefix = resource.get_mapped_prefix("bioportal")
+        if bioportal_prefix is not None and obofoundry_format is not None:
+            bioportal_format = (
+                f"https://bioportal.bioontology.org/ontologies/{bioportal_prefix}"
+                f"/?p=classes&conceptid={obofoundry_format}"
+            )
+            providers.append(("bioportal", False, bioportal_format.split("$1")))
+
+        extra_providers = resource.get_extra_providers()
+        for provider in extra_providers:
+            if provider.code == "scholia":
+                providers.append(("scholia", False, provider.uri_format.split("$1")))
+                break
+        for provider in extra_providers:
+            providers.append((provider.code, False, provider.uri_format.split("$1")))
+
+        return ProviderTable(
+            prefix=resource.prefix,
+            banana=banana,
+            banana_peel=resource.get_banana_peel(),
+            miriam_banana=miriam_banana,
+            providers=providers,
+        )
 
-        if not rv:
-            return rv
+    def _get_resolver_uri_format(self, metaprefix: str, resource: Resource) -> Optional[str]:
+        """Get the URI format string for a resource in the resolver, as used by :meth:`get_formatted_iri`."""
+        mapped_prefix = resource.get_mapped_prefix(metaprefix)
+        registry = self.metaregistry.get(metaprefix)
+        if registry is None or mapped_prefix is None:
+            return None
+        return registry.get_resolver_uri_format(mapped_prefix)
 
-        bioregistry_link = self.get_bioregistry_iri(prefix, identifier)
-        if not bioregistry_link:
-            return rv
+    def get_providers_list(self, prefix: str, identifier: str) -> Sequence[Tuple[str, str]]:
+        """Get all providers for the CURIE.
 
+        :param prefix: the prefix in the CURIE
+        :param identifier: the identifier in the CURIE
+        :returns: A list of pairs of provider codes and IRIs. This is built from
+            templates that are prepared once per prefix (see :meth:`get_provider_table`).
+        :raises KeyError: If the prefix can't be normalized
+        """
+        resource = self.get_resource(prefix)
+        if resource is None:
+            raise KeyError
+        table = self._get_provider_table(resource)
+        if not table.providers:
+            return []
+        norm_identifier = _standardize_identifier(
+            identifier, prefix=table.prefix, banana=table.banana, peel=table.banana_peel
+        )
+        if table.miriam_banana and not norm_identifier.startswith(table.miriam_banana):
+            miriam_identifier = f"{table.miriam_banana}{norm_identifier}"
+        else:
+            miriam_identifier = norm_identifier
+
+        rv = [
+            (metaprefix, (miriam_identifier if miriam else identifier).join(parts))
+            for metaprefix, miriam, parts in table.providers
+        ]
         # if a default URL is available, it goes first. otherwise the bioregistry URL goes first.
-        rv.insert(1 if rv[0][0] == "default" else 0, ("bioregistry", bioregistry_link))
+        rv.insert(
+            1 if rv[0][0] == "default" else 0,
+            ("bioregistry", f"{self.base_url}/{table.prefix}:{norm_identifier}"),
+        )
         return rv
 
     def get_providers(self, prefix: str, identifier: str) -> Dict[str, str]:
@@ -1148,11 +2173,7 @@ class Manager:
 
     def count_mappings(self, include_bioregistry: bool = True) -> typing.Counter[str]:
         """Count the mappings for each registry."""
-        rv = Counter(
-            metaprefix
-            for resource in self.registry.values()
-            for metaprefix in resource.get_mappings()
-        )
+        rv = self.get_mapping_table().count()
         if include_bioregistry:
             rv["bioregistry"] = len(self.registry)
         return rv
@@ -1188,10 +2209,18 @@ class Manager:
         >>> manager.is_valid_identifier("xxx", "yyy")
         False
         """
+        if self.compact_manager is not None:
+            return self.compact_manager.is_valid_identifier(prefix, identifier)
         resource = self.registry.get(prefix)
         if resource is None:
             return False
-        return resource.is_valid_identifier(identifier)
+        return self._is_valid_identifier(resource, identifier)
+
+    def _is_valid_identifier(self, resource: Resource, identifier: str) -> bool:
+        pattern = self._get_pattern_re(resource)
+        if pattern is None:
+            return True
+        return pattern.fullmatch(identifier) is not None
 
     def is_standardizable_identifier(self, prefix: str, identifier: str) -> bool:
         """Check if the identifier is standardizable.
@@ -1226,7 +2255,7 @@ class Manager:
         resource = self.get_resource(prefix)
         if resource is None:
             return False
-        return resource.is_standardizable_identifier(identifier)
+        return self._is_valid_identifier(resource, resource.standardize_identifier(identifier))
 
     def is_valid_curie(self, curie: str) -> bool:
         """Check if a CURIE is standardized and valid.
@@ -1314,6 +2343,81 @@ class Manager:
             return False
         return self.is_standardizable_identifier(prefix, identifier)
 
+    def validate_curies(
+        self,
+        curies: Iterable[str],
+        *,
+        standardizable: bool = False,
+        reasons: bool = False,
+    ) -> CurieValidationResults:
+        """Validate many CURIEs at once.
+
+        :param curies: An iterable of compact URIs. This is consumed
+            into a list if it isn't already a sequence.
+        :param standardizable: If true, checks the CURIEs like :meth:`is_standardizable_curie`.
+            Otherwise, checks the CURIEs like :meth:`is_valid_curie`.
+        :param reasons: Should a reason code be given for each invalid CURIE?
+        :returns: A compact array of validation results in the same order as the
+            given CURIEs, and if requested, a list of reason codes
+
+        The CURIEs are grouped by their prefixes such that prefix normalization,
+        pattern lookup, and banana lookup are done once per distinct prefix rather
+        than once per CURIE.
+
+        >>> from bioregistry import manager
+        >>> results = manager.validate_curies(["go:0000001", "GO:0000001", "go:0001"], reasons=True)
+        >>> list(results.valid)
+        [1, 0, 0]
+        >>> results.reasons
+        [None, 'nonstandard_prefix', 'invalid_identifier']
+        >>> list(manager.validate_curies(["go:0000001", "GO:GO:0000001"], standardizable=True).valid)
+        [1, 1]
+        """
+        if not isinstance(curies, Sequence):
+            curies = list(curies)
+        valid = bytearray(len(curies))
+        rv_reasons: Optional[List[Optional[str]]] = [None] * len(curies) if reasons else None
+
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for i, curie in enumerate(curies):
+            prefix, delimiter, _ = curie.partition(":")
+            if delimiter:
+                groups[prefix].append(i)
+            elif rv_reasons is not None:
+                rv_reasons[i] = REASON_MISSING_DELIMITER
+
+        for prefix, indexes in groups.items():
+            resource = self.get_resource(prefix) if standardizable else self.registry.get(prefix)
+            if resource is None:
+                if rv_reasons is not None:
+                    if standardizable or self.normalize_prefix(prefix) is None:
+                        reason = REASON_UNKNOWN_PREFIX
+                    else:
+                        reason = REASON_NONSTANDARD_PREFIX
+                    for i in indexes:
+                        rv_reasons[i] = reason
+                continue
+
+            pattern = self._get_pattern_re(resource)
+            if pattern is None:
+                for i in indexes:
+                    valid[i] = 1
+                continue
+
+            fullmatch = pattern.fullmatch
+            offset = len(prefix) + 1
+            banana, peel = resource.get_banana(), resource.get_banana_peel()
+            for i in indexes:
+                identifier = curies[i][offset:]
+                if standardizable:
+                    identifier = _standardize_identifier(identifier, resource.prefix, banana, peel)
+                if fullmatch(identifier) is not None:
+                    valid[i] = 1
+                elif rv_reasons is not None:
+                    rv_reasons[i] = REASON_INVALID_IDENTIFIER
+
+        return CurieValidationResults(valid, rv_reasons)
+
     def get_context(self, key: str) -> Optional[Context]:
         """Get a prescriptive context.
 
@@ -1366,6 +2470,43 @@ class Manager:
         )
 
 
+def _use_snapshot() -> bool:
+    value = pystow.get_config("bioregistry", "snapshot")
+    return value is None or str(value).lower() not in {"false", "0", "no"}
+
+
+def _get_snapshot_path() -> Path:
+    hexdigests = get_hexdigests(alg="sha256", paths=SNAPSHOT_DATA_PATHS + SNAPSHOT_SOURCE_PATHS)
+    key = hashlib.sha256(
+        "\n".join(
+            (
+                str(SNAPSHOT_FORMAT_VERSION),
+                VERSION,
+                platform.python_version(),
+                pydantic.VERSION,
+                *(hexdigests[path] for path in sorted(hexdigests)),
+            )
+        ).encode("utf8")
+    ).hexdigest()
+    return BIOREGISTRY_MODULE.join("snapshots", name=f"manager-{key[:16]}.pkl")
+
+
+def _write_snapshot(manager: Manager, path: Path) -> None:
+    # write to a temporary file then swap it in, so concurrent processes never
+    # see a partially written snapshot
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as file:
+        pickle.dump(manager, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    for stale_path in path.parent.glob("manager-*.pkl"):
+        if stale_path == path:
+            continue
+        try:
+            stale_path.unlink()
+        except FileNotFoundError:  # removed by another process
+            pass
+
+
 def prepare_prefix_list(prefix_map: Mapping[str, str]) -> List[Tuple[str, str]]:
     """Prepare a priority prefix list from a prefix map."""
     rv = []
@@ -1416,4 +2557,4 @@ def _read_contributors(
 
 
 #: The default manager for the Bioregistry
-manager = Manager()
+manager = Manager.lazy()
@@ -19,6 +19,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Pattern,
     Sequence,
     Set,
     Tuple,
@@ -565,7 +566,8 @@ class Resource(BaseModel):
 
     def get_external(self, metaprefix) -> Mapping[str, Any]:
         """Get an external registry."""
-        return self.dict().get(metaprefix) or dict()
+        # only the requested field is copied, since copying the whole resource is slow
+        return self.dict(include={metaprefix}).get(metaprefix) or dict()
 
     def get_mapped_prefix(self, metaprefix: str) -> Optional[str]:
         """Get the prefix for the given external.
@@ -590,7 +592,7 @@ class Resource(BaseModel):
 
     def get_prefix_key(self, key: str, metaprefixes: Union[str, Sequence[str]]):
         """Get a key enriched by the given external resources' data."""
-        rv = self.dict().get(key)
+        rv = self.dict(include={key}).get(key)
         if rv is not None:
             return rv
         if isinstance(metaprefixes, str):
@@ -810,13 +812,12 @@ class Resource(BaseModel):
             return None
         return _clean_pattern(rv)
 
-    def get_pattern_re(self):
+    def get_pattern_re(self) -> Optional[Pattern[str]]:
         """Get the compiled pattern for the given prefix, if it's available."""
         pattern = self.get_pattern()
         if pattern is None:
             return None
-        # FIXME cache this
-        return re.compile(pattern)
+        return _compile_pattern(pattern)
 
     def get_pattern_with_banana(self, strict: bool = True) -> Optional[str]:
         r"""Get the pattern for the prefix including a banana if available.
@@ -857,7 +858,7 @@ class Resource(BaseModel):
             prepattern = f"({prepattern})?"
         return "^" + prepattern + pattern.lstrip("^")
 
-    def get_pattern_re_with_banana(self, strict: bool = True):
+    def get_pattern_re_with_banana(self, strict: bool = True) -> Optional[Pattern[str]]:
         """Get the compiled pattern for the prefix including a banana if available.
 
         .. warning::
@@ -890,7 +891,7 @@ class Resource(BaseModel):
         p = self.get_pattern_with_banana(strict=strict)
         if p is None:
             return None
-        return re.compile(p)
+        return _compile_pattern(p)
 
     def get_namespace_in_lui(self) -> Optional[bool]:
         """Check if the namespace should appear in the LUI."""
@@ -1674,15 +1675,9 @@ class Resource(BaseModel):
         >>> get_resource("pdb").standardize_identifier('00000020')
         '00000020'
         """
-        banana = self.get_banana()
-        peel = self.get_banana_peel()
-        prebanana = f"{banana}{peel}".casefold()
-        icf = identifier.casefold()
-        if banana and icf.startswith(prebanana):
-            return identifier[len(prebanana) :]
-        elif icf.startswith(f"{self.prefix.casefold()}{peel}"):
-            return identifier[len(self.prefix) + len(peel) :]
-        return identifier
+        return _standardize_identifier(
+            identifier, self.prefix, self.get_banana(), self.get_banana_peel()
+        )
 
     def get_miriam_curie(self, identifier: str) -> Optional[str]:
         """Get the MIRIAM-flavored CURIE."""
@@ -2502,6 +2497,40 @@ def _clean_pattern(rv: str) -> str:
     return rv
 
 
+def _standardize_identifier(identifier: str, prefix: str, banana: Optional[str], peel: str) -> str:
+    """Remove a banana or redundant prefix from an identifier.
+
+    :param identifier: The local unique identifier
+    :param prefix: The prefix of the resource
+    :param banana: The resource's banana, if it has one (see :meth:`Resource.get_banana`)
+    :param peel: The delimiter after the banana (see :meth:`Resource.get_banana_peel`)
+    :returns: The identifier, without the banana or redundant prefix
+
+    This is split out from :meth:`Resource.standardize_identifier` so the banana
+    and peel can be looked up once when standardizing many identifiers.
+    """
+    prebanana = f"{banana}{peel}".casefold()
+    icf = identifier.casefold()
+    if banana and icf.startswith(prebanana):
+        return identifier[len(prebanana) :]
+    elif icf.startswith(f"{prefix.casefold()}{peel}"):
+        return identifier[len(prefix) + len(peel) :]
+    return identifier
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile a regular expression string, reusing previously compiled ones.
+
+    :param pattern: A regular expression string
+    :returns: The compiled regular expression
+
+    The :mod:`re` module's own cache is too small to hold all of the
+    patterns in the Bioregistry, so it thrashes during bulk validation.
+    """
+    return re.compile(pattern)
+
+
 def _allowed_uri_format(rv: str) -> bool:
     """Check that a URI format doesn't have another resolver in it."""
     return (
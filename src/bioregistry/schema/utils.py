@@ -2,17 +2,54 @@
 
 """Utilities for Bioregistry data structures."""
 
-from typing import Any, Mapping
+from typing import Any, Dict, Mapping
 
 from pydantic import BaseModel
 
 __all__ = [
+    "model_to_dict",
     "sanitize_dict",
     "sanitize_model",
     "sanitize_mapping",
 ]
 
 
+def model_to_dict(base_model: BaseModel, exclude_none: bool = False) -> Dict[str, Any]:
+    """Convert a Pydantic model to a dictionary, like :meth:`pydantic.BaseModel.dict`.
+
+    This gives the same result as :meth:`pydantic.BaseModel.dict` (without
+    arguments other than ``exclude_none``), but it is several times faster
+    because it reads the fields' values directly instead of validating which
+    fields to include and exclude at each level.
+
+    :param base_model: A Pydantic model
+    :param exclude_none: Should fields whose values are None be left out? Like in
+        :meth:`pydantic.BaseModel.dict`, this applies to the fields of nested
+        models, but not to the values of nested dictionaries or lists.
+    :returns: A dictionary whose nested models are also converted to dictionaries
+
+    >>> from bioregistry import get_resource
+    >>> model_to_dict(get_resource("go")) == get_resource("go").dict()
+    True
+    """
+    exclude = base_model.__exclude_fields__ or {}
+    return {
+        key: _get_value(value, exclude_none)
+        for key, value in base_model.__dict__.items()
+        if exclude.get(key) is not True and not (exclude_none and value is None)
+    }
+
+
+def _get_value(value: Any, exclude_none: bool) -> Any:
+    if isinstance(value, BaseModel):
+        return model_to_dict(value, exclude_none=exclude_none)
+    if isinstance(value, dict):
+        return {key: _get_value(v, exclude_none) for key, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return value.__class__(_get_value(v, exclude_none) for v in value)
+    return value
+
+
 def sanitize_dict(d):
     """Remove all keys that have none values from a dict."""
     rv = {}
@@ -27,7 +64,7 @@ def sanitize_dict(d):
 
 def sanitize_model(base_model: BaseModel) -> Mapping[str, Any]:
     """Sanitize a single Pydantic model."""
-    return sanitize_dict(base_model.dict())
+    return sanitize_dict(model_to_dict(base_model))
 
 
 def sanitize_mapping(mapping: Mapping[str, BaseModel]) -> Mapping[str, Mapping[str, Any]]:
@@ -10,6 +10,7 @@ from operator import attrgetter
 from pathlib import Path
 from typing import List, Mapping, Optional, Set, Union
 
+from . import json_utils
 from .constants import (
     BIOREGISTRY_PATH,
     COLLECTIONS_PATH,
@@ -18,7 +19,6 @@ from .constants import (
     MISMATCH_PATH,
 )
 from .schema import Collection, Context, Registry, Resource
-from .utils import extended_encoder
 
 logger = logging.getLogger(__name__)
 
@@ -121,52 +121,25 @@ def write_collections(collections: Mapping[str, Collection]) -> None:
     values = [v for _, v in sorted(collections.items())]
     for collection in values:
         collection.resources = sorted(set(collection.resources))
-    with open(COLLECTIONS_PATH, encoding="utf-8", mode="w") as file:
-        json.dump(
-            {"collections": values},
-            file,
-            indent=2,
-            sort_keys=True,
-            ensure_ascii=False,
-            default=extended_encoder,
-        )
+    json_utils.dump({"collections": values}, COLLECTIONS_PATH)
 
 
 def write_registry(registry: Mapping[str, Resource], *, path: Optional[Path] = None) -> None:
     """Write to the Bioregistry."""
     if path is None:
         path = BIOREGISTRY_PATH
-    with path.open(mode="w", encoding="utf-8") as file:
-        json.dump(
-            registry, file, indent=2, sort_keys=True, ensure_ascii=False, default=extended_encoder
-        )
+    json_utils.dump(registry, path)
 
 
 def write_metaregistry(metaregistry: Mapping[str, Registry]) -> None:
     """Write to the metaregistry."""
     values = [v for _, v in sorted(metaregistry.items())]
-    with open(METAREGISTRY_PATH, mode="w", encoding="utf-8") as file:
-        json.dump(
-            {"metaregistry": values},
-            fp=file,
-            indent=2,
-            sort_keys=True,
-            ensure_ascii=False,
-            default=extended_encoder,
-        )
+    json_utils.dump({"metaregistry": values}, METAREGISTRY_PATH)
 
 
 def write_contexts(contexts: Mapping[str, Context]) -> None:
     """Write to contexts."""
-    with open(CONTEXTS_PATH, mode="w", encoding="utf-8") as file:
-        json.dump(
-            contexts,
-            fp=file,
-            indent=2,
-            sort_keys=True,
-            ensure_ascii=False,
-            default=extended_encoder,
-        )
+    json_utils.dump(contexts, CONTEXTS_PATH)
 
 
 def read_prefix_contributions(registry: Mapping[str, Resource]) -> Mapping[str, Set[str]]:
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+"""A read-only, memory-mapped index for sharing lookups between worker processes.
+
+When the web application runs in many worker processes, each one holds its own
+copy of the registry, the synonym index, and the URI prefix index. A shared
+index puts the lookups that resolution needs into a single file:
+
+1. normalized synonyms to canonical prefixes (see :meth:`bioregistry.Manager.normalize_prefix`)
+2. URI prefixes to canonical prefixes (see :meth:`bioregistry.Manager.parse_uri`)
+3. canonical prefixes to patterns and URI format strings
+
+The file is memory-mapped and searched in place, so its pages are shared
+between all processes through the operating system's page cache instead of
+being copied into each one.
+
+.. code-block:: python
+
+    from bioregistry import Manager
+
+    # once, e.g., before starting the workers
+    Manager.from_snapshot().write_shared_index("bioregistry.idx")
+
+    # in each worker
+    manager = Manager.lazy()
+    manager.use_shared_index("bioregistry.idx")
+
+    # these are answered from the shared index, without loading the registry
+    manager.normalize_prefix("GO")
+    manager.parse_uri("http://purl.obolibrary.org/obo/GO_0000001")
+
+The file has a header followed by three tables of fixed-size records and the
+UTF-8 encoded strings they point to. The tables of synonyms and URI prefixes
+are sorted by their keys' bytes, so they're searched with a binary search.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from .schema.struct import _compile_pattern
+from .utils import _norm
+
+if TYPE_CHECKING:
+    from .resource_manager import Manager
+
+__all__ = [
+    "SharedIndex",
+    "write_shared_index",
+]
+
+#: The first bytes of a shared index file, which include the version of the format
+MAGIC = b"BRIDX001"
+#: The header has the magic bytes, the number of records in each table, the
+#: offset of each table, and the offset of the strings
+HEADER = struct.Struct("<8s7I")
+#: A string's offset and length, followed by a string's offset and length for
+#: the pattern and URI format of the prefix (or :data:`MISSING` if it has none)
+PREFIX_RECORD = struct.Struct("<6I")
+#: A key's offset and length, followed by the index of its prefix's record
+KEY_RECORD = struct.Struct("<3I")
+#: The offset used for missing strings
+MISSING = 0xFFFFFFFF
+
+
+def write_shared_index(manager: "Manager", path: Union[str, Path]) -> None:
+    """Write a shared index for a manager.
+
+    :param manager: The manager whose lookups are written
+    :param path: The path to the index file. It's replaced atomically, so
+        processes that already mapped an old version of the file keep using it.
+    """
+    prefixes = sorted(manager.registry)
+    prefix_to_index = {prefix: index for index, prefix in enumerate(prefixes)}
+    synonyms = _encode_keys(manager.synonyms.items(), prefix_to_index)
+    uri_prefixes = _encode_keys(manager.converter.reverse_prefix_map.items(), prefix_to_index)
+
+    strings = bytearray()
+    string_offsets: Dict[bytes, int] = {}
+
+    def _add_string(value: Union[None, str, bytes]) -> Tuple[int, int]:
+        if value is None:
+            return MISSING, 0
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        offset = string_offsets.get(value)
+        if offset is None:
+            offset = string_offsets[value] = len(strings)
+            strings.extend(value)
+        return offset, len(value)
+
+    prefix_table = bytearray()
+    for prefix in prefixes:
+        resource = manager.registry[prefix]
+        prefix_table.extend(
+            PREFIX_RECORD.pack(
+                *_add_string(prefix),
+                *_add_string(resource.get_pattern()),
+                *_add_string(resource.get_uri_format()),
+            )
+        )
+    key_tables = []
+    for pairs in (synonyms, uri_prefixes):
+        table = bytearray()
+        for key, index in pairs:
+            table.extend(KEY_RECORD.pack(*_add_string(key), index))
+        key_tables.append(table)
+    synonym_table, uri_prefix_table = key_tables
+
+    prefix_offset = HEADER.size
+    synonym_offset = prefix_offset + len(prefix_table)
+    uri_prefix_offset = synonym_offset + len(synonym_table)
+    strings_offset = uri_prefix_offset + len(uri_prefix_table)
+    header = HEADER.pack(
+        MAGIC,
+        len(prefixes),
+        len(synonyms),
+        len(uri_prefixes),
+        prefix_offset,
+        synonym_offset,
+        uri_prefix_offset,
+        strings_offset,
+    )
+
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, delete=False) as file:
+        for part in (header, prefix_table, synonym_table, uri_prefix_table, strings):
+            file.write(part)
+    # temporary files are only readable by their owner
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, path)
+
+
+def _encode_keys(
+    pairs: Iterable[Tuple[str, str]], prefix_to_index: Mapping[str, int]
+) -> List[Tuple[bytes, int]]:
+    return sorted(
+        (key.encode("utf-8"), prefix_to_index[prefix])
+        for key, prefix in pairs
+        if prefix in prefix_to_index
+    )
+
+
+class SharedIndex:
+    """A memory-mapped index of the lookups needed for resolution, written by :func:`write_shared_index`."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open a shared index.
+
+        :param path: The path to a file written by :func:`write_shared_index`
+        :raises ValueError: If the file isn't a shared index
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap.size() < HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"not a shared index: {self.path}")
+        (
+            magic,
+            self._n_prefixes,
+            self._n_synonyms,
+            self._n_uri_prefixes,
+            self._prefix_offset,
+            self._synonym_offset,
+            self._uri_prefix_offset,
+            self._strings_offset,
+        ) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"not a shared index: {self.path}")
+
+    def __len__(self) -> int:
+        """Get the number of prefixes."""
+        return self._n_prefixes
+
+    def close(self) -> None:
+        """Close the memory map."""
+        self._mmap.close()
+
+    def __enter__(self) -> "SharedIndex":
+        """Use the index in a context manager, which closes it on exit."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the index."""
+        self.close()
+
+    def __getstate__(self) -> Dict[str, str]:
+        """Get the state for pickling, which is only the path since the map can't be pickled."""
+        return {"path": self.path.as_posix()}
+
+    def __setstate__(self, state: Dict[str, str]) -> None:
+        """Open the index again after unpickling."""
+        self.__init__(state["path"])  # type: ignore
+
+    def _get_bytes(self, offset: int, length: int) -> bytes:
+        start = self._strings_offset + offset
+        return self._mmap[start : start + length]
+
+    def _get_string(self, offset: int, length: int) -> Optional[str]:
+        if offset == MISSING:
+            return None
+        return self._get_bytes(offset, length).decode("utf-8")
+
+    def _get_key(self, table_offset: int, position: int) -> Tuple[bytes, int]:
+        offset, length, index = KEY_RECORD.unpack_from(
+            self._mmap, table_offset + position * KEY_RECORD.size
+        )
+        return self._get_bytes(offset, length), index
+
+    def _bisect_right(self, table_offset: int, size: int, key: bytes) -> int:
+        """Get the position after the last record whose key is less than or equal to the given key."""
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            if key < self._get_key(table_offset, middle)[0]:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _get_prefix_record(self, index: int) -> Tuple[int, int, int, int, int, int]:
+        return PREFIX_RECORD.unpack_from(
+            self._mmap, self._prefix_offset + index * PREFIX_RECORD.size
+        )
+
+    def _get_prefix(self, index: int) -> str:
+        offset, length, *_ = self._get_prefix_record(index)
+        return self._get_bytes(offset, length).decode("utf-8")
+
+    def _get_prefix_index(self, prefix: str) -> Optional[int]:
+        key = _norm(prefix).encode("utf-8")
+        position = self._bisect_right(self._synonym_offset, self._n_synonyms, key) - 1
+        if position < 0:
+            return None
+        found, index = self._get_key(self._synonym_offset, position)
+        if found != key:
+            return None
+        return index
+
+    def normalize_prefix(self, prefix: str) -> Optional[str]:
+        """Get the canonical prefix for a prefix or synonym, if it's registered.
+
+        :param prefix: The prefix to normalize
+        :returns: The canonical prefix, like :meth:`bioregistry.Manager.normalize_prefix`
+        """
+        index = self._get_prefix_index(prefix)
+        if index is None:
+            return None
+        return self._get_prefix(index)
+
+    def get_pattern(self, prefix: str) -> Optional[str]:
+        """Get the pattern for the given prefix, which is normalized first, if it's available."""
+        index = self._get_prefix_index(prefix)
+        if index is None:
+            return None
+        _, _, offset, length, _, _ = self._get_prefix_record(index)
+        return self._get_string(offset, length)
+
+    def get_pattern_re(self, prefix: str) -> Optional[Pattern[str]]:
+        """Get the compiled pattern for the given prefix, if it's available."""
+        pattern = self.get_pattern(prefix)
+        if pattern is None:
+            return None
+        return _compile_pattern(pattern)
+
+    def get_uri_format(self, prefix: str) -> Optional[str]:
+        """Get the URI format string for the given prefix, which is normalized first, if it's available."""
+        index = self._get_prefix_index(prefix)
+        if index is None:
+            return None
+        _, _, _, _, offset, length = self._get_prefix_record(index)
+        return self._get_string(offset, length)
+
+    def parse_uri(self, uri: str) -> Union[Tuple[str, str], Tuple[None, None]]:
+        """Split a URI into the prefix and identifier using the longest matching URI prefix.
+
+        :param uri: A URI
+        :returns: A pair of the canonical prefix and identifier, like
+            :meth:`curies.Converter.parse_uri` with the manager's converter
+        """
+        query = uri.encode("utf-8")
+        while True:
+            position = self._bisect_right(self._uri_prefix_offset, self._n_uri_prefixes, query) - 1
+            if position < 0:
+                return None, None
+            key, index = self._get_key(self._uri_prefix_offset, position)
+            if query.startswith(key):
+                return self._get_prefix(index), uri[len(key.decode("utf-8")) :]
+            # The longest URI prefix that matches, if there is one, is also a prefix
+            # of the part shared by the URI and the closest smaller key, so search again
+            # with that part. It's always shorter, so this ends.
+            shared = os.path.commonprefix([query, key])
+            if not shared:
+                return None, None
+            query = shared
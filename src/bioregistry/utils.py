@@ -1,20 +1,31 @@
 """Utilities."""
 
+import heapq
 import itertools as itt
 import logging
-from collections import ChainMap, defaultdict
+import os
+import threading
+from collections import ChainMap, OrderedDict, defaultdict, deque
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     DefaultDict,
+    Deque,
     Dict,
+    Hashable,
     Iterable,
+    Iterator,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
+    Set,
+    Tuple,
+    TypeVar,
     Union,
     cast,
 )
@@ -34,6 +45,9 @@ from .constants import (
 
 logger = logging.getLogger(__name__)
 
+X = TypeVar("X")
+Y = TypeVar("Y")
+
 #: Wikidata SPARQL endpoint. See https://www.wikidata.org/wiki/Wikidata:SPARQL_query_service#Interfacing
 WIKIDATA_ENDPOINT = "https://query.wikidata.org/bigdata/namespace/wdq/sparql"
 
@@ -120,6 +134,10 @@ class NormDict(dict):
         """Check if an item is in the dictionary after lexically normalizing it."""
         return super().__contains__(_norm(item))
 
+    def __delitem__(self, key: str) -> None:
+        """Delete an item from the dictionary after lexically normalizing it."""
+        super().__delitem__(_norm(key))
+
     def get(self, key: str, default=None) -> str:
         """Get an item from the dictionary after lexically normalizing it."""
         return super().get(_norm(key), default)
@@ -141,22 +159,336 @@ def norm(s: str) -> str:
     return rv
 
 
+class URIPrefixTrie:
+    """A character trie for finding the longest URI prefix that matches a URI.
+
+    Parsing a URI with this index takes time proportional to the length of the
+    matching URI prefix, rather than to the number of URI prefixes.
+
+    >>> trie = URIPrefixTrie(
+    ...     [
+    ...         ("obo", "http://purl.obolibrary.org/obo/"),
+    ...         ("go", "http://purl.obolibrary.org/obo/GO_"),
+    ...     ]
+    ... )
+    >>> trie.parse_uri("http://purl.obolibrary.org/obo/GO_0000001")
+    ('go', '0000001')
+    >>> trie.parse_uri("http://purl.obolibrary.org/obo/CHEBI_1234")
+    ('obo', 'CHEBI_1234')
+    >>> trie.parse_uri("https://example.org/nope")
+    (None, None)
+    """
+
+    def __init__(self, pairs: Iterable[Tuple[str, str]] = ()):
+        """Instantiate the trie.
+
+        :param pairs: Pairs of prefixes and URI prefixes. If a URI prefix appears
+            more than once, the first prefix is kept.
+        """
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+        for prefix, uri_prefix in pairs:
+            self.add(prefix, uri_prefix)
+
+    def __len__(self) -> int:
+        """Count the URI prefixes in the trie."""
+        return self._size
+
+    def add(self, prefix: str, uri_prefix: str) -> None:
+        """Add a URI prefix, unless it's already in the trie."""
+        node = self._root
+        for character in uri_prefix:
+            node = node.setdefault(character, {})
+        # the empty string can't collide with a key for a single character
+        if "" not in node:
+            node[""] = prefix
+            self._size += 1
+
+    def parse_uri(self, uri: str) -> Union[Tuple[str, str], Tuple[None, None]]:
+        """Split a URI into the prefix and identifier using the longest matching URI prefix."""
+        node = self._root
+        prefix: Optional[str] = None
+        end = 0
+        for index, character in enumerate(uri):
+            child = node.get(character)
+            if child is None:
+                break
+            node = child
+            if "" in node:
+                prefix, end = node[""], index + 1
+        if prefix is None:
+            return None, None
+        return prefix, uri[end:]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about a cache, like the ones from :func:`functools.lru_cache`."""
+
+    #: The number of lookups answered from the cache
+    hits: int
+    #: The number of lookups that had to be computed
+    misses: int
+    #: The number of entries in the cache
+    currsize: int
+
+
+class BoundedCache:
+    """A least-recently-used cache whose entries are computed on demand.
+
+    Unlike :func:`functools.lru_cache`, this belongs to a single object (so it's
+    garbage collected with it) and can be cleared explicitly.
+
+    >>> cache = BoundedCache(maxsize=2)
+    >>> cache.get("a", lambda: 1)
+    1
+    >>> cache.get("a", lambda: 2)
+    1
+    >>> cache.get("b", lambda: 3), cache.get("c", lambda: 4)
+    (3, 4)
+    >>> "a" in cache
+    False
+    >>> cache.info()
+    CacheInfo(hits=1, misses=3, currsize=2)
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        """Instantiate the cache.
+
+        :param maxsize: The maximum number of entries. When it's exceeded, the least
+            recently used entry is evicted. If None, the cache is unbounded.
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if the key is in the cache, without counting it as a lookup."""
+        return key in self._data
+
+    def __len__(self) -> int:
+        """Count the entries in the cache."""
+        return len(self._data)
+
+    def get(self, key: Hashable, func: Callable[[], X]) -> X:
+        """Get the value for the key, computing it with the function if it's not cached."""
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+        # compute outside of the lock, since it might need the cache itself
+        value = func()
+        self.set(key, value)
+        return value
+
+    def lookup(self, key: Hashable) -> Optional[Any]:
+        """Get the value for the key, or None if it's not cached."""
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Add a value to the cache, evicting the least recently used one if it's full."""
+        with self._lock:
+            self._data[key] = value
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache. The statistics are kept."""
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        """Get the hits, misses, and size of the cache."""
+        return CacheInfo(hits=self._hits, misses=self._misses, currsize=len(self._data))
+
+
+class SearchIndex:
+    """An n-gram index for finding the strings that contain a query.
+
+    Strings and queries are normalized with :func:`_norm`. Results are ranked
+    first by whether the string is an exact match, starts with the query, or
+    only contains it, then by the priority given to each string, then by value.
+
+    >>> index = SearchIndex(
+    ...     [
+    ...         ("chebi", 0, "chebi"),
+    ...         ("GO CHEBI", 0, "gochebi"),
+    ...         ("Chemical Entities of Biological Interest", 1, "ChEBI name"),
+    ...     ]
+    ... )
+    >>> index.search("CHE")
+    ['chebi', 'ChEBI name', 'gochebi']
+    >>> index.search("cheb", limit=1)
+    ['chebi']
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, int, Any]], size: int = 3):
+        """Instantiate the index.
+
+        :param entries: Triples of strings to search, their priorities (lower
+            is better), and the values returned when they match
+        :param size: The length of n-grams in the index. Queries shorter than
+            this are looked up directly, so every shorter n-gram is indexed too.
+        """
+        self.size = size
+        # Short queries (e.g., the first keystrokes of an autocomplete) match many
+        # strings, so their rankings are kept. Only the ones that are indexed are
+        # kept, so there are at most as many as there are short n-grams.
+        self._short_rankings: Dict[str, List[Any]] = {}
+        self._entries: List[Tuple[str, int, Any]] = []
+        self._postings: DefaultDict[str, Set[int]] = defaultdict(set)
+        for text, priority, value in entries:
+            norm_text = _norm(text)
+            if not norm_text:
+                continue
+            entry_id = len(self._entries)
+            self._entries.append((norm_text, priority, value))
+            for n in range(1, size + 1):
+                for start in range(len(norm_text) - n + 1):
+                    self._postings[norm_text[start : start + n]].add(entry_id)
+
+    def __len__(self) -> int:
+        """Count the strings in the index."""
+        return len(self._entries)
+
+    def _get_candidates(self, norm_query: str) -> Set[int]:
+        if len(norm_query) <= self.size:
+            return self._postings.get(norm_query, set())
+        postings = sorted(
+            (
+                self._postings.get(norm_query[start : start + self.size], set())
+                for start in range(len(norm_query) - self.size + 1)
+            ),
+            key=len,
+        )
+        return set.intersection(*postings)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Any]:
+        """Get the values for the strings that contain the query, in order of relevance.
+
+        :param query: The query, which is normalized
+        :param limit: The maximum number of results. If none, returns all results.
+        :returns: The values of the matching strings. If a value matches several
+            times, it's only returned once and ranked by its best match.
+        """
+        norm_query = _norm(query)
+        if not norm_query:
+            return []
+        if len(norm_query) < self.size:
+            if norm_query not in self._postings:
+                return []
+            ranking = self._short_rankings.get(norm_query)
+            if ranking is None:
+                ranking = self._short_rankings[norm_query] = self._search(norm_query)
+            return ranking[:limit]
+        return self._search(norm_query, limit=limit)
+
+    def _search(self, norm_query: str, limit: Optional[int] = None) -> List[Any]:
+        # the best match and priority for each value
+        best: Dict[Any, Tuple[int, int]] = {}
+        for entry_id in self._get_candidates(norm_query):
+            norm_text, priority, value = self._entries[entry_id]
+            if norm_text == norm_query:
+                match = 0
+            elif norm_text.startswith(norm_query):
+                match = 1
+            elif norm_query in norm_text:
+                match = 2
+            else:  # the n-grams all matched, but not contiguously
+                continue
+            if value not in best or (match, priority) < best[value]:
+                best[value] = match, priority
+        ranked = ((match, priority, value) for value, (match, priority) in best.items())
+        if limit is None:
+            return [value for _, _, value in sorted(ranked)]
+        return [value for _, _, value in heapq.nsmallest(limit, ranked)]
+
+
 def curie_to_str(prefix: str, identifier: str) -> str:
     """Combine a prefix and identifier into a CURIE string."""
     return f"{prefix}:{identifier}"
 
 
-def get_hexdigests(alg: str = "sha256") -> Mapping[str, str]:
-    """Get hex digests."""
-    return {
-        path.as_posix(): _get_hexdigest(path, alg=alg)
-        for path in (
+def iter_chunks(iterable: Iterable[X], chunksize: int) -> Iterator[List[X]]:
+    """Iterate over lists of (at most) the given size, consuming the iterable lazily."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itt.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imap_ordered(
+    func: Callable[[X], Y],
+    iterable: Iterable[X],
+    *,
+    processes: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> Iterator[Y]:
+    """Apply the function to each element in a process pool and yield the results in order.
+
+    :param func: A picklable function
+    :param iterable: The elements, which are consumed lazily
+    :param processes: The number of processes. If 1, runs in the current process
+        (after calling the initializer). If None, uses the number of CPUs.
+    :param initializer: A function to run once in each worker
+    :param initargs: The arguments for the initializer. When processes are
+        forked, these are inherited by the workers rather than pickled.
+    :yields: The results of the function, in the same order as the elements
+
+    Unlike :meth:`multiprocessing.pool.Pool.imap`, which reads ahead through the
+    whole iterable, only a few elements per process are pending at a time, so
+    memory use doesn't grow with the size of the input.
+    """
+    if processes == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(func, iterable)
+        return
+
+    import multiprocessing
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    with multiprocessing.Pool(processes, initializer=initializer, initargs=initargs) as pool:
+        window = 2 * processes
+        pending: Deque = deque()
+        for element in iterable:
+            pending.append(pool.apply_async(func, (element,)))
+            if len(pending) >= window:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def get_hexdigests(
+    alg: str = "sha256", paths: Optional[Iterable[Union[str, Path]]] = None
+) -> Mapping[str, str]:
+    """Get hex digests.
+
+    :param alg: The hashing algorithm
+    :param paths: The files to hash. If none given, uses the Bioregistry and its YAML exports.
+    :returns: A mapping from paths to digests
+    """
+    if paths is None:
+        paths = (
             BIOREGISTRY_PATH,
             REGISTRY_YAML_PATH,
             METAREGISTRY_YAML_PATH,
             COLLECTIONS_YAML_PATH,
         )
-    }
+    return {Path(path).as_posix(): _get_hexdigest(path, alg=alg) for path in paths}
 
 
 def _get_hexdigest(path: Union[str, Path], alg: str = "sha256") -> str:
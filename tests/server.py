@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+"""A test case that runs a local HTTP server in a thread."""
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar, Type
+
+__all__ = [
+    "ServerTestCase",
+]
+
+
+class ServerTestCase(unittest.TestCase):
+    """A test case that serves requests with a local HTTP server while each test runs."""
+
+    #: The request handler, set by subclasses
+    handler: ClassVar[Type[BaseHTTPRequestHandler]]
+
+    def setUp(self) -> None:
+        """Start a local HTTP server in a thread."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler)
+        self.server.daemon_threads = True
+        self.set_up_server()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def set_up_server(self) -> None:
+        """Set attributes on the server that the handler uses, before it starts."""
+
+    def tearDown(self) -> None:
+        """Stop the local HTTP server."""
+        self.server.shutdown()
+        self.server.server_close()
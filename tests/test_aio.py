@@ -0,0 +1,161 @@
+"""Tests for the asyncio interface."""
+
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, List, Tuple
+
+from bioregistry import manager
+from bioregistry.aio import AsyncManager
+from bioregistry.app.impl import get_app
+
+CURIES = [
+    "GO:0000001",
+    "go:0000001",
+    "chebi:24867",
+    "CHEBI:24867",
+    "pubmed:1234",
+    "nope:nope",
+    "nope",
+    "",
+]
+
+
+async def _aiter(items: Iterable[str]) -> AsyncIterator[str]:
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+async def _post(app, path: str, data) -> Tuple[int, List]:
+    """Send a POST request directly to an ASGI application."""
+    body = json.dumps(data).encode("utf-8")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("utf-8")),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    messages = []
+
+    async def _receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def _send(message):
+        messages.append(message)
+
+    await app(scope, _receive, _send)
+    status = messages[0]["status"]
+    content = b"".join(message.get("body", b"") for message in messages[1:])
+    return status, json.loads(content)
+
+
+class TestAsyncManager(unittest.TestCase):
+    """Tests for the asyncio interface."""
+
+    def setUp(self) -> None:
+        """Set up the test case with many CURIEs."""
+        self.curies = CURIES * 25
+        self.pairs = [manager.parse_curie(curie) for curie in self.curies]
+        self.iris = [manager.get_iri(curie) for curie in self.curies]
+
+    def test_bulk(self):
+        """Test bulk parsing and resolution gives the same results as the manager."""
+        async_manager = AsyncManager(chunksize=7, concurrency=2)
+        self.assertEqual(self.pairs, asyncio.run(async_manager.parse_curies(self.curies)))
+        self.assertEqual(self.iris, asyncio.run(async_manager.get_iris(self.curies)))
+        self.assertEqual([], asyncio.run(async_manager.get_iris([])))
+
+    def test_async_iterable(self):
+        """Test bulk parsing from an async iterable."""
+
+        async def _main():
+            async_manager = AsyncManager(chunksize=7)
+            return [pair async for pair in async_manager.iter_parse_curies(_aiter(self.curies))]
+
+        self.assertEqual(self.pairs, asyncio.run(_main()))
+
+    def test_executor(self):
+        """Test bulk parsing in a given executor, which only runs one chunk at a time."""
+        with ThreadPoolExecutor(1) as executor:
+            async_manager = AsyncManager(executor=executor, chunksize=10)
+            self.assertEqual(self.iris, asyncio.run(async_manager.get_iris(self.curies)))
+
+    def test_processes(self):
+        """Test bulk parsing in a process pool."""
+
+        async def _main():
+            async with AsyncManager(processes=2, chunksize=20) as async_manager:
+                return await async_manager.parse_curies(self.curies)
+
+        self.assertEqual(self.pairs, asyncio.run(_main()))
+        with self.assertRaises(ValueError):
+            AsyncManager(executor=ThreadPoolExecutor(1), processes=2)
+
+    def test_lookups(self):
+        """Test lookups and offloaded methods."""
+
+        async def _main():
+            async_manager = AsyncManager(chunksize=100)
+            await async_manager.warm()
+            converter = await async_manager.get_converter()
+            resources = [pair async for pair in async_manager.iter_resources()]
+            return converter, resources
+
+        converter, resources = asyncio.run(_main())
+        self.assertIs(manager.converter, converter)
+        self.assertEqual(list(manager.registry.items()), resources)
+        async_manager = AsyncManager()
+        self.assertEqual("go", async_manager.normalize_prefix("GO"))
+        self.assertIs(manager.get_resource("go"), async_manager.get_resource("GO"))
+        self.assertEqual(("go", "0000001"), async_manager.parse_curie("GO:0000001"))
+        self.assertEqual(manager.get_iri("GO:0000001"), async_manager.get_iri("GO:0000001"))
+
+
+class TestAsyncAPI(unittest.TestCase):
+    """Tests for the async endpoints."""
+
+    def setUp(self) -> None:
+        """Set up the test case with an app."""
+        self.fast_api = get_app()
+
+    def test_parse(self):
+        """Test the bulk parsing endpoint."""
+        status, data = asyncio.run(_post(self.fast_api, "/api/bulk/parse", {"curies": CURIES}))
+        self.assertEqual(200, status)
+        self.assertEqual(
+            [
+                {"curie": curie, "prefix": prefix, "identifier": identifier}
+                for curie, (prefix, identifier) in zip(
+                    CURIES, (manager.parse_curie(curie) for curie in CURIES)
+                )
+            ],
+            data,
+        )
+
+    def test_iri(self):
+        """Test the bulk resolution endpoint."""
+        status, data = asyncio.run(_post(self.fast_api, "/api/bulk/iri", {"curies": CURIES}))
+        self.assertEqual(200, status)
+        self.assertEqual(
+            [{"curie": curie, "iri": manager.get_iri(curie)} for curie in CURIES],
+            data,
+        )
+
+    def test_invalid(self):
+        """Test that a request without CURIEs is rejected."""
+        status, _ = asyncio.run(_post(self.fast_api, "/api/bulk/iri", {"nope": []}))
+        self.assertEqual(422, status)
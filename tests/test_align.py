@@ -0,0 +1,88 @@
+"""Tests for aligning several external registries at once."""
+
+import time
+import unittest
+
+from bioregistry.align import Aligner, align_all, get_timing_table
+from bioregistry.resource_manager import Manager
+
+NEW_PREFIX = "zzzalignedprefix"
+
+
+def _get_slow(force_download: bool = False):
+    time.sleep(0.2)
+    return {NEW_PREFIX: {"name": "Slow"}}
+
+
+def _get_fast(force_download: bool = False):
+    return {NEW_PREFIX.upper(): {"name": "Fast"}}
+
+
+def _get_broken(force_download: bool = False):
+    raise IOError("could not download")
+
+
+class _TestAligner(Aligner):
+    curation_header = ("name",)
+    curated = []
+
+    def write_curation_table(self) -> None:
+        """Remember that the curation table was written instead of writing it."""
+        self.curated.append(self.key)
+
+
+class _SlowAligner(_TestAligner):
+    key = "miriam"
+    getter = _get_slow
+    include_new = True
+
+
+class _FastAligner(_TestAligner):
+    key = "n2t"
+    getter = _get_fast
+
+
+class _BrokenAligner(_TestAligner):
+    key = "go"
+    getter = _get_broken
+
+
+class TestAlignAll(unittest.TestCase):
+    """Tests for aligning several external registries at once."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a manager that isn't written."""
+        self.manager = Manager()
+        _TestAligner.curated.clear()
+
+    def _align_all(self, processes: bool):
+        timings = align_all(
+            [_SlowAligner, _BrokenAligner, _FastAligner],
+            dry=True,
+            manager=self.manager,
+            processes=processes,
+            workers=3,
+        )
+        self.assertEqual(["miriam", "go", "n2t"], [timing.key for timing in timings])
+        self.assertEqual([1, 0, 1], [timing.records for timing in timings])
+        self.assertEqual([None, "could not download", None], [timing.error for timing in timings])
+        self.assertGreaterEqual(timings[0].get_seconds, 0.2)
+        self.assertEqual(["miriam", "n2t"], _TestAligner.curated)
+        self.assertIn("could not download", get_timing_table(timings))
+
+        # the fast source is applied after the slow one, so it can
+        # match the prefix that the slow one added
+        resource = self.manager.registry[NEW_PREFIX]
+        self.assertEqual(
+            {"miriam": NEW_PREFIX, "n2t": NEW_PREFIX.upper()},
+            resource.mappings,
+        )
+        self.assertEqual(NEW_PREFIX, self.manager.normalize_prefix(NEW_PREFIX.upper()))
+
+    def test_threads(self):
+        """Test getting sources in threads."""
+        self._align_all(processes=False)
+
+    def test_processes(self):
+        """Test getting sources in processes."""
+        self._align_all(processes=True)
@@ -0,0 +1,162 @@
+"""Tests for downloading external registries only when they've changed, against a local HTTP server."""
+
+import hashlib
+import json
+import tempfile
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import requests
+
+from bioregistry.external.fetch import fetch, get_metadata_path
+from tests.server import ServerTestCase
+
+LAST_MODIFIED = "Wed, 01 Feb 2023 00:00:00 GMT"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve the same content with and without validators."""
+
+    def do_GET(self):  # noqa:N802
+        """Respond to a GET request."""
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        content = server.content
+        etag = '"{}"'.format(hashlib.md5(content).hexdigest())  # noqa:S324
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/validators" and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        if self.path == "/validators":
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        """Don't log requests."""
+
+
+class TestFetch(ServerTestCase):
+    """Tests for downloading external registries only when they've changed."""
+
+    handler = _Handler
+
+    def set_up_server(self) -> None:
+        """Set up the content that the server responds with."""
+        self.server.requests = []
+        self.server.content = json.dumps({"a": {"name": "A"}, "b": {"name": "B"}}).encode("utf-8")
+
+    def setUp(self) -> None:
+        """Start a local HTTP server in a thread and make a directory for downloads."""
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("raw.json")
+        self.processed_path = Path(self.directory.name).joinpath("processed.json")
+
+    def tearDown(self) -> None:
+        """Stop the local HTTP server and remove the downloads."""
+        super().tearDown()
+        self.directory.cleanup()
+
+    def test_validators(self):
+        """Test that a server with validators is asked if the content changed."""
+        url = f"{self.base}/validators"
+        source = fetch(url, self.path)
+        self.assertTrue(source.changed)
+        self.assertEqual(self.server.content, self.path.read_bytes())
+        self.assertEqual(LAST_MODIFIED, source.metadata.last_modified)
+        self.assertTrue(get_metadata_path(self.path).is_file())
+        self.assertEqual("raw.meta.json", get_metadata_path(self.path).name)
+
+        source = fetch(url, self.path)
+        self.assertFalse(source.changed)
+        headers = self.server.requests[-1][1]
+        self.assertEqual(source.metadata.etag, headers["If-None-Match"])
+        self.assertEqual(LAST_MODIFIED, headers["If-Modified-Since"])
+
+        # a forced request is unconditional, but the content is still compared
+        source = fetch(url, self.path, force=True)
+        self.assertFalse(source.changed)
+        self.assertNotIn("If-None-Match", self.server.requests[-1][1])
+
+        self.server.content = b'{"a": {"name": "A2"}}'
+        source = fetch(url, self.path)
+        self.assertTrue(source.changed)
+        self.assertEqual(self.server.content, self.path.read_bytes())
+
+    def test_content_hash(self):
+        """Test that the content's hash tells if it changed when the server has no validators."""
+        url = f"{self.base}/plain"
+        self.assertTrue(fetch(url, self.path).changed)
+        # rewriting the file, e.g., to sort it, doesn't count as a change
+        self.path.write_text("rewritten")
+        source = fetch(url, self.path)
+        self.assertFalse(source.changed)
+        self.assertNotIn("If-None-Match", self.server.requests[-1][1])
+        self.assertEqual("rewritten", self.path.read_text())
+        # a different URL is a different source
+        self.assertTrue(fetch(f"{self.base}/validators", self.path).changed)
+
+    def test_error(self):
+        """Test that an error response raises an error and keeps the old file."""
+        self.path.write_text("old")
+        with self.assertRaises(requests.HTTPError):
+            fetch(f"{self.base}/missing", self.path)
+        self.assertEqual("old", self.path.read_text())
+        self.assertEqual([self.path], list(self.path.parent.iterdir()))
+
+    def test_processed(self):
+        """Test skipping processing when the content and code didn't change."""
+        url = f"{self.base}/validators"
+        code_path = Path(self.directory.name).joinpath("code.py")
+        code_path.write_text("version 1")
+
+        source = fetch(url, self.path, processed_by=[code_path])
+        self.assertFalse(source.is_processed(self.processed_path))
+        self.processed_path.write_text("{}")
+        source.mark_processed()
+        self.assertTrue(
+            fetch(url, self.path, processed_by=[code_path]).is_processed(self.processed_path)
+        )
+
+        code_path.write_text("version 2")
+        source = fetch(url, self.path, processed_by=[code_path])
+        self.assertFalse(source.changed)
+        self.assertFalse(source.is_processed(self.processed_path))
+        source.mark_processed()
+
+        self.server.content = b'{"a": {"name": "A2"}}'
+        self.assertFalse(
+            fetch(url, self.path, processed_by=[code_path]).is_processed(self.processed_path)
+        )
+
+    def test_records(self):
+        """Test that only changed records are processed."""
+        cache_path = Path(self.directory.name).joinpath("records.json")
+        calls = []
+
+        def _process(record):
+            calls.append(record["name"])
+            return {"name": record.pop("name").lower()}
+
+        def _get():
+            source = fetch(f"{self.base}/plain", self.path)
+            return source.process_records(
+                json.loads(self.path.read_text()), _process, cache_path=cache_path
+            )
+
+        self.assertEqual({"a": {"name": "a"}, "b": {"name": "b"}}, _get())
+        self.assertEqual(["A", "B"], calls)
+        self.server.content = json.dumps(
+            {"a": {"name": "A"}, "b": {"name": "B2"}, "c": {"name": "C"}}
+        ).encode("utf-8")
+        self.assertEqual({"a": {"name": "a"}, "b": {"name": "b2"}, "c": {"name": "c"}}, _get())
+        self.assertEqual(["A", "B", "B2", "C"], calls)
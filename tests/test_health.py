@@ -0,0 +1,327 @@
+"""Tests for the health check engine, against a local HTTP server."""
+
+import datetime
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Optional
+
+from bioregistry.health.check_providers import (
+    HISTORY_SIZE,
+    MAX_INTERVAL,
+    MIN_INTERVAL,
+    Database,
+    ProviderHistory,
+    ProviderStatus,
+    QueueTuple,
+    Run,
+    _calculate_delta,
+    _summarize,
+    _summarize_hosts,
+    get_due,
+    get_results,
+    get_skipped,
+)
+from bioregistry.health.engine import check_urls
+from tests.server import ServerTestCase
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve paths that succeed, fail, fail once, or are slow."""
+
+    def do_HEAD(self):  # noqa:N802
+        """Respond to a HEAD request."""
+        server = self.server
+        with server.lock:
+            server.hits[self.path] += 1
+            hits = server.hits[self.path]
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.05)
+                self.send_response(200)
+            elif self.path == "/missing":
+                self.send_response(404)
+            elif self.path == "/flaky":
+                self.send_response(200 if hits > 1 else 503)
+            elif self.path == "/unavailable":
+                self.send_response(503)
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    do_GET = do_HEAD  # noqa:N815
+
+    def log_message(self, *args):
+        """Don't log requests."""
+
+
+class TestEngine(ServerTestCase):
+    """Tests for the health check engine."""
+
+    handler = _Handler
+
+    def set_up_server(self) -> None:
+        """Set up the counters that the server keeps."""
+        self.server.lock = threading.Lock()
+        self.server.hits = Counter()
+        self.server.active = 0
+        self.server.max_active = 0
+
+    def test_results(self):
+        """Test successful, failed, and retried checks."""
+        urls = [f"{self.base}/{path}" for path in ["ok", "missing", "flaky", "unavailable"]]
+        rv = check_urls(urls, retries=1, backoff=0.01)
+        self.assertEqual(set(urls), set(rv))
+        ok, missing, flaky, unavailable = (rv[url] for url in urls)
+        self.assertFalse(ok.failed)
+        self.assertEqual((200, 1), (ok.status_code, ok.attempts))
+        self.assertGreater(ok.latency, 0.0)
+        # 404 isn't retried
+        self.assertTrue(missing.failed)
+        self.assertEqual((404, 1), (missing.status_code, missing.attempts))
+        self.assertFalse(flaky.failed)
+        self.assertEqual((200, 2), (flaky.status_code, flaky.attempts))
+        self.assertTrue(unavailable.failed)
+        self.assertEqual((503, 2), (unavailable.status_code, unavailable.attempts))
+
+    def test_connection_error(self):
+        """Test that a connection error is recorded."""
+        url = "http://127.0.0.1:1/nope"
+        result = check_urls([url], retries=0, timeout=1.0)[url]
+        self.assertTrue(result.failed)
+        self.assertIsNone(result.status_code)
+        self.assertEqual("ConnectionError", result.exception)
+
+    def test_per_host(self):
+        """Test that the requests to a host at the same time are limited."""
+        urls = [f"{self.base}/slow{i}" for i in range(12)]
+        rv = check_urls(urls, concurrency=8, per_host=2)
+        self.assertTrue(all(not result.failed for result in rv.values()))
+        self.assertLessEqual(self.server.max_active, 2)
+        self.assertEqual(12, sum(self.server.hits.values()))
+
+    def test_rate(self):
+        """Test that the rate of requests is limited."""
+        urls = [f"{self.base}/ok{i}" for i in range(6)]
+        start = time.perf_counter()
+        check_urls(urls, per_host=6, rate=50.0)
+        # the first request is sent immediately, then one every 20 ms
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+
+    def test_resume(self):
+        """Test that results in a checkpoint aren't checked again."""
+        urls = [f"{self.base}/ok{i}" for i in range(5)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("checkpoint.jsonl")
+            first = check_urls(urls[:3], checkpoint=path)
+            # a line from a run that was killed while writing
+            with path.open("a") as file:
+                file.write('{"url": "http')
+            second = check_urls(urls, checkpoint=path)
+        self.assertEqual(first, {url: second[url] for url in urls[:3]})
+        self.assertEqual(5, len(second))
+        self.assertEqual(Counter({f"/ok{i}": 1 for i in range(5)}), self.server.hits)
+
+    def test_resume_old(self):
+        """Test that results in a checkpoint from an old run are checked again."""
+        urls = [f"{self.base}/ok{i}" for i in range(3)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("checkpoint.jsonl")
+            check_urls(urls, checkpoint=path)
+            check_urls(urls, checkpoint=path, max_age=0.0)
+            # a checkpoint without a start time is also from an old run
+            path.write_text("".join(path.read_text().splitlines(keepends=True)[1:]))
+            check_urls(urls, checkpoint=path)
+        self.assertEqual(Counter({f"/ok{i}": 3 for i in range(3)}), self.server.hits)
+
+    def test_providers(self):
+        """Test checking providers and summarizing the results."""
+        queue = [
+            QueueTuple("a", "1", f"{self.base}/ok"),
+            QueueTuple("b", "1", f"{self.base}/ok"),
+            QueueTuple("c", "1", f"{self.base}/missing"),
+            QueueTuple("d", "1", "http://127.0.0.1:1/nope"),
+        ]
+        results = get_results(queue, retries=0, timeout=1.0)
+        self.assertEqual(["a", "b", "c", "d"], [result.prefix for result in results])
+        self.assertEqual([False, False, True, True], [result.failed for result in results])
+        self.assertEqual(1, self.server.hits["/ok"])
+
+        summary = _summarize(results)
+        self.assertEqual(
+            (4, 2, 50.0), (summary.total_measured, summary.total_failed, summary.failure_percent)
+        )
+        self.assertLessEqual(summary.latency_p50, summary.latency_p95)
+        hosts = _summarize_hosts(results)
+        self.assertEqual(
+            ["127.0.0.1:1", self.base[len("http://") :]], [host.host for host in hosts]
+        )
+        self.assertEqual([1, 3], [host.total_measured for host in hosts])
+
+        # old runs without latencies can still be loaded
+        database = Database(
+            runs=[{"results": [], "summary": summary.dict(exclude={"latency_p50", "latency_p95"})}]
+        )
+        self.assertIsNone(database.runs[0].summary.latency_p50)
+
+
+def _status(prefix: str, failed: bool, url: Optional[str] = None) -> ProviderStatus:
+    return ProviderStatus(
+        prefix=prefix,
+        example="1",
+        url=url or f"https://example.org/{prefix}/1",
+        status_code=None if failed else 200,
+        failed=failed,
+        exception=None,
+        context=None,
+    )
+
+
+class TestSchedule(unittest.TestCase):
+    """Tests for scheduling provider checks."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a start time."""
+        self.start = datetime.datetime(2023, 1, 1)
+
+    def test_interval(self):
+        """Test that stable providers are checked less often."""
+        history = ProviderHistory(url="https://example.org/a/1", last_checked=self.start)
+        for failed, days in [(False, 1), (False, 2), (False, 4), (False, 8), (True, 1), (True, 2)]:
+            history.add(_status("a", failed), self.start)
+            self.assertEqual(datetime.timedelta(days=days), history.get_interval())
+        for _ in range(HISTORY_SIZE):
+            history.add(_status("a", False), self.start)
+        self.assertEqual(HISTORY_SIZE, len(history.failed))
+        self.assertEqual(MAX_INTERVAL, history.get_interval())
+        self.assertFalse(history.is_due(self.start + MAX_INTERVAL / 2))
+        self.assertTrue(history.is_due(self.start + MAX_INTERVAL))
+
+        # a new URL starts over
+        history.add(_status("a", False, url="https://example.com/a/1"), self.start)
+        self.assertEqual([False], history.failed)
+
+    def test_due(self):
+        """Test getting the providers that are due."""
+        database = Database()
+        database.update([_status("a", False), _status("b", False)], self.start)
+        queue = [
+            QueueTuple("a", "1", "https://example.org/a/1"),
+            QueueTuple("b", "1", "https://example.org/b/2"),
+            QueueTuple("c", "1", "https://example.org/c/1"),
+        ]
+        due = get_due(queue, database.providers, self.start + datetime.timedelta(hours=1))
+        # b's URL changed and c is new
+        self.assertEqual(["b", "c"], [element.prefix for element in due])
+        due = get_due(queue, database.providers, self.start + MIN_INTERVAL)
+        self.assertEqual(["a", "b", "c"], [element.prefix for element in due])
+
+    def test_skipped(self):
+        """Test that providers that aren't due keep the result of their last check."""
+        results = [_status("a", False), _status("b", True), _status("c", False)]
+        results[0].latency = 1.0
+        runs = [Run(time=self.start, results=results, summary=_summarize(results))]
+        queue = [
+            QueueTuple("a", "1", "https://example.org/a/1"),
+            QueueTuple("b", "1", "https://example.org/b/1"),
+            QueueTuple("c", "1", "https://example.org/c/2"),
+            QueueTuple("d", "1", "https://example.org/d/1"),
+        ]
+        # c's URL changed and d is new, so they're checked even though they're not due
+        due, skipped = get_skipped(queue, queue[1:2], runs)
+        self.assertEqual(["b", "c", "d"], [element.prefix for element in due])
+        self.assertEqual(["a"], list(skipped))
+        self.assertTrue(skipped["a"].skipped)
+        self.assertFalse(skipped["a"].failed)
+
+        # the summary counts all providers, but not the latencies of the old checks
+        summary = _summarize([skipped["a"], _status("b", True)], total_skipped=1)
+        self.assertEqual(
+            (2, 1, 1), (summary.total_measured, summary.total_failed, summary.total_skipped)
+        )
+        self.assertIsNone(summary.latency_p50)
+
+        # a carried over result isn't counted as a check of the provider
+        runs.append(
+            Run(
+                time=self.start + MIN_INTERVAL,
+                results=[skipped["a"]],
+                summary=_summarize([skipped["a"]]),
+            )
+        )
+        database = Database(runs=runs)
+        database.ensure_providers()
+        self.assertEqual([False], database.providers["a"].failed)
+        self.assertEqual(self.start, database.providers["a"].last_checked)
+
+    def test_traffic(self):
+        """Test that daily runs check stable providers much less often than every day."""
+        database = Database()
+        queue = [QueueTuple(f"p{i}", "1", f"https://example.org/p{i}/1") for i in range(100)]
+        checks = 0
+        for day in range(90):
+            now = self.start + datetime.timedelta(days=day)
+            due = get_due(queue, database.providers, now)
+            checks += len(due)
+            database.update([_status(element.prefix, False) for element in due], now)
+        self.assertLess(checks, 90 * 100 / 8)
+
+    def test_delta(self):
+        """Test that a single failure doesn't make a provider fall."""
+        database = Database()
+        for failed in [False, False, False]:
+            database.update([_status("a", False), _status("b", failed)], self.start)
+
+        previous = {
+            prefix: history.copy(deep=True) for prefix, history in database.providers.items()
+        }
+        database.update([_status("a", True), _status("b", True)], self.start)
+        delta = _calculate_delta(database.providers, previous)
+        self.assertEqual([], delta.fallen)
+        self.assertEqual(2, delta.alive)
+
+        previous = {
+            prefix: history.copy(deep=True) for prefix, history in database.providers.items()
+        }
+        database.update([_status("b", True), _status("c", True)], self.start)
+        delta = _calculate_delta(database.providers, previous)
+        self.assertEqual(["b"], delta.fallen)
+        self.assertEqual(["c"], delta.new)
+        self.assertEqual(1, delta.alive)
+
+        previous = {
+            prefix: history.copy(deep=True) for prefix, history in database.providers.items()
+        }
+        database.update([_status("b", False), _status("b", False)], self.start)
+        delta = _calculate_delta(database.providers, previous)
+        self.assertEqual(["b"], delta.revived)
+
+    def test_ensure_providers(self):
+        """Test that the providers' histories are filled in from old runs."""
+        runs = []
+        for day, failed in enumerate([False, True, True]):
+            results = [_status("a", failed)]
+            runs.append(
+                Run(
+                    time=self.start + datetime.timedelta(days=day),
+                    results=results,
+                    summary=_summarize(results),
+                )
+            )
+        database = Database(runs=runs[::-1])
+        database.ensure_providers()
+        self.assertEqual([False, True, True], database.providers["a"].failed)
+        self.assertEqual(
+            self.start + datetime.timedelta(days=2), database.providers["a"].last_checked
+        )
+        self.assertTrue(database.providers["a"].is_failing())
@@ -0,0 +1,81 @@
+"""Tests for the JSON serialization backends."""
+
+import datetime
+import json
+import unittest
+from dataclasses import dataclass
+from typing import Set
+
+from bioregistry import json_utils, manager
+from bioregistry.schema.utils import model_to_dict
+from bioregistry.utils import extended_encoder
+
+
+@dataclass
+class _Point:
+    x: int
+    date: datetime.date
+    tags: Set[str]
+
+
+class TestJSON(unittest.TestCase):
+    """Tests for the JSON serialization backends."""
+
+    def setUp(self) -> None:
+        """Set up the backends that are installed."""
+        self.backends = []
+        for backend in json_utils.BACKENDS:
+            try:
+                json_utils.dumps(None, backend=backend)
+            except ImportError:
+                continue
+            self.backends.append(backend)
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend gives an error."""
+        with self.assertRaises(ValueError):
+            json_utils.dumps(None, backend="nope")
+
+    def test_model_to_dict(self):
+        """Test converting models gives the same result as pydantic."""
+        for registry in [manager.registry, manager.metaregistry, manager.collections]:
+            for key, model in registry.items():
+                for exclude_none in (False, True):
+                    with self.subTest(key=key, exclude_none=exclude_none):
+                        self.assertEqual(
+                            model.dict(exclude_none=exclude_none),
+                            model_to_dict(model, exclude_none=exclude_none),
+                        )
+
+    def test_backends(self):
+        """Test that all backends give the same JSON as the standard library."""
+        data = {
+            "registry": manager.registry,
+            "collections": list(manager.collections.values()),
+            "numbers": [1, 2.5, None, True],
+            "text": "Ünïcödé\n",
+            "dates": [
+                datetime.date(2023, 1, 1),
+                datetime.datetime(2023, 1, 1, 12, 30, 0, 5),
+                datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+            ],
+            "dataclass": _Point(1, datetime.date(2023, 1, 1), {"a"}),
+        }
+        for indent in (False, True):
+            expected = json.dumps(
+                data,
+                indent=2 if indent else None,
+                sort_keys=True,
+                ensure_ascii=False,
+                default=extended_encoder,
+            ).encode("utf-8")
+            self.assertEqual(
+                expected, json_utils.dumps(data, indent=indent, sort_keys=True, backend="json")
+            )
+            for backend in self.backends:
+                with self.subTest(backend=backend, indent=indent):
+                    actual = json_utils.dumps(data, indent=indent, sort_keys=True, backend=backend)
+                    if indent:
+                        self.assertEqual(expected, actual)
+                    else:
+                        self.assertEqual(json.loads(expected), json.loads(actual))
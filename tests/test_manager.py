@@ -2,11 +2,22 @@
 
 """Tests for managers."""
 
+import pickle
+import subprocess
+import sys
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 import bioregistry
-from bioregistry import Manager
+from bioregistry import Manager, Resource
 from bioregistry.export.rdf_export import get_full_rdf
+from bioregistry.resource_manager import (
+    SNAPSHOT_FORMAT_VERSION,
+    ExternalMappings,
+    _get_snapshot_path,
+)
 
 
 class TestResourceManager(unittest.TestCase):
@@ -215,6 +226,468 @@ class TestResourceManager(unittest.TestCase):
             with self.subTest(curie=curie):
                 self.assertFalse(self.manager.is_standardizable_curie(curie))
 
+    def test_pattern_index(self):
+        """Test the manager's index of compiled patterns."""
+        pattern = self.manager.get_pattern_re("go")
+        self.assertIsNotNone(pattern)
+        self.assertIs(pattern, self.manager.get_pattern_re("GO"))
+        self.assertIsNone(self.manager.get_pattern_re("xxx"))
+
+        strict = self.manager.get_pattern_re_with_banana("go")
+        self.assertIsNone(strict.fullmatch("0000001"))
+        self.assertIsNotNone(strict.fullmatch("GO:0000001"))
+        loose = self.manager.get_pattern_re_with_banana("go", strict=False)
+        self.assertIsNotNone(loose.fullmatch("0000001"))
+        self.assertIsNotNone(loose.fullmatch("GO:0000001"))
+
+        # replacing a resource in the registry invalidates its entry in the index
+        resource = Resource(prefix="go", name="Gene Ontology", pattern="^\\d{8}$")
+        self.manager.registry["go"] = resource
+        self.assertTrue(self.manager.is_valid_identifier("go", "00000001"))
+        self.assertFalse(self.manager.is_valid_identifier("go", "0000001"))
+
+        # modifying a resource in place requires explicitly clearing the index
+        resource.pattern = "^\\d{7}$"
+        self.manager.clear_pattern_index()
+        self.assertTrue(self.manager.is_valid_identifier("go", "0000001"))
+
+    def test_validate_curies(self):
+        """Test validating many CURIEs at once gives the same results as one at a time."""
+        curies = [
+            "go:0000001",
+            "go:000001",
+            "GO:0000001",
+            "GO_0000001",
+            "go:GO:0000001",
+            "GO:GO:0000001",
+            "go:go:000001",
+            "xxx:yyy",
+            "chebi:1234",
+            "chebi:CHEBI:1234",
+        ]
+        for standardizable, func in [
+            (False, self.manager.is_valid_curie),
+            (True, self.manager.is_standardizable_curie),
+        ]:
+            with self.subTest(standardizable=standardizable):
+                results = self.manager.validate_curies(
+                    iter(curies), standardizable=standardizable, reasons=True
+                )
+                self.assertEqual([func(curie) for curie in curies], list(map(bool, results.valid)))
+                self.assertEqual(
+                    [bool(valid) for valid in results.valid],
+                    [reason is None for reason in results.reasons],
+                )
+        results = self.manager.validate_curies(curies)
+        self.assertIsNone(results.reasons)
+
+    def test_derived_index(self):
+        """Test the derived attribute index is used and invalidated."""
+        self.assertEqual((0, 0, 0), tuple(self.manager.get_derived_index_info()))
+        self.assertEqual("GO", self.manager.get_banana("go"))
+        self.assertEqual("GO", self.manager.get_banana("GO"))
+        self.assertEqual("go:0000001", self.manager.normalize_curie("go:GO:0000001"))
+        self.assertEqual((2, 1, 1), tuple(self.manager.get_derived_index_info()))
+        self.assertIn("gobp", self.manager.get_synonyms("go"))
+
+        # modifying a resource in place needs an explicit invalidation
+        self.manager.registry["go"].banana = "GOGO"
+        self.assertEqual("GO", self.manager.get_banana("go"))
+        self.manager.clear_derived_index("go")
+        self.assertEqual("GOGO", self.manager.get_banana("go"))
+
+        # replacing a resource is picked up automatically
+        self.manager.registry["go"] = Resource(prefix="go", name="Gene Ontology", banana="GOO")
+        self.assertEqual("GOO", self.manager.get_banana("go"))
+        self.assertEqual("go:0000001", self.manager.normalize_curie("go:GOO:0000001"))
+
+        self.manager.clear_derived_index()
+        self.assertEqual(0, self.manager.get_derived_index_info().currsize)
+        self.manager.warm_derived_index()
+        hits = self.manager.get_derived_index_info().hits
+        self.assertEqual("GOO", self.manager.get_banana("go"))
+        self.assertEqual(hits + 1, self.manager.get_derived_index_info().hits)
+
+    def test_cache(self):
+        """Test the cache of lookups built from the whole registry is bounded and invalidated."""
+        manager = Manager(
+            registry=self.manager.registry,
+            metaregistry=self.manager.metaregistry,
+            collections=self.manager.collections,
+            contexts=self.manager.contexts,
+            mismatches=self.manager.mismatches,
+            cache_maxsize=2,
+        )
+        self.assertIs(manager.converter, manager.get_converter())
+        self.assertIs(manager.get_prefix_map(), manager.get_prefix_map())
+        self.assertEqual((2, 2, 2), tuple(manager.get_cache_info()))
+        # the converter is evicted since it's the least recently used
+        manager.get_registry_map("obofoundry")
+        self.assertEqual(2, manager.get_cache_info().currsize)
+        misses = manager.get_cache_info().misses
+        manager.get_converter()
+        self.assertEqual(misses + 1, manager.get_cache_info().misses)
+        self.assertEqual(
+            manager.get_pattern_map(blacklist=["go"]), manager.get_pattern_map(blacklist={"go"})
+        )
+        self.assertNotIn("go", manager.get_pattern_map(blacklist=["go"]))
+        self.assertIs(
+            manager.get_pattern_map(remapping={"go": "GO"}),
+            manager.get_pattern_map(remapping={"go": "GO"}),
+        )
+
+        # adding a resource needs an explicit invalidation
+        manager.get_prefix_map()
+        manager.registry = dict(manager.registry)
+        manager.registry["nopenope"] = Resource(
+            prefix="nopenope", synonyms=["nope"], uri_format="https://example.org/nope/$1"
+        )
+        self.assertIsNone(manager.normalize_prefix("nope"))
+        self.assertNotIn("nopenope", manager.get_prefix_map())
+        manager.clear_caches()
+        self.assertEqual(0, manager.get_cache_info().currsize)
+        self.assertEqual("nopenope", manager.normalize_prefix("nope"))
+        self.assertEqual("https://example.org/nope/", manager.get_prefix_map()["nopenope"])
+        self.assertEqual("nopenope", manager.converter.parse_uri("https://example.org/nope/1")[0])
+
+    def assert_consistent(self, manager: Manager, check_converter: bool = False) -> None:
+        """Assert that a manager's indexes are the same as the ones from building it from scratch.
+
+        :param manager: The manager to check
+        :param check_converter: Should the converters be compared? This is slow, since
+            building a converter takes several seconds.
+        """
+        fresh = Manager(
+            registry=manager.registry,
+            metaregistry=manager.metaregistry,
+            collections=manager.collections,
+            contexts=manager.contexts,
+            mismatches=manager.mismatches,
+        )
+        self.assertEqual(fresh.synonyms, manager.synonyms)
+        for name in ("canonical_for", "provided_by", "has_parts"):
+            self.assertEqual(
+                {key: sorted(values) for key, values in getattr(fresh, name).items()},
+                {key: sorted(values) for key, values in getattr(manager, name).items()},
+                msg=name,
+            )
+        self.assertEqual(fresh.get_pattern_map(), manager.get_pattern_map())
+        self.assertEqual(
+            fresh.get_registry_invmap("obofoundry"), manager.get_registry_invmap("obofoundry")
+        )
+        if check_converter:
+            self.assertEqual(fresh.converter.prefix_map, manager.converter.prefix_map)
+        for prefix in fresh.registry:
+            self.assertEqual(fresh.get_uri_format(prefix), manager.get_uri_format(prefix))
+            self.assertEqual(fresh.get_banana(prefix), manager.get_banana(prefix))
+
+    def test_incremental_updates(self):
+        """Test adding, modifying, and removing resources gives the same indexes as a rebuild."""
+        manager = Manager(
+            registry=self.manager.registry,
+            metaregistry=self.manager.metaregistry,
+            collections=self.manager.collections,
+            contexts=self.manager.contexts,
+            mismatches=self.manager.mismatches,
+        )
+        # warm up the caches, so they have to be invalidated
+        manager.warm_derived_index()
+        manager.get_pattern_map()
+        manager.get_registry_invmap("obofoundry")
+
+        manager.upsert_resource(
+            Resource(
+                prefix="nopenope",
+                synonyms=["nope"],
+                uri_format="https://example.org/nope/$1",
+                part_of="go",
+                mappings={"obofoundry": "NOPE"},
+            )
+        )
+        self.assertEqual("nopenope", manager.normalize_prefix("NOPE"))
+        self.assertIn("nopenope", manager.has_parts["go"])
+        self.assert_consistent(manager)
+
+        # the prefix is excluded from copies, so it has to be set again
+        go = manager.registry["go"].copy(
+            update={"prefix": "go", "synonyms": ["gogo"], "banana": "GOGO"}
+        )
+        manager.upsert_resource(go)
+        self.assertIsNone(manager.normalize_prefix("gobp"))
+        self.assertEqual("go", manager.normalize_prefix("gogo"))
+        self.assertEqual("go:1", manager.normalize_curie("go:GOGO:1"))
+        self.assert_consistent(manager)
+
+        with self.assertRaises(KeyError):
+            manager.upsert_resource(Resource(prefix="nopenope2", synonyms=["gogo"]))
+        self.assertNotIn("nopenope2", manager.registry)
+
+        self.assertEqual("nopenope", manager.remove_resource("nopenope").prefix)
+        self.assertIsNone(manager.normalize_prefix("nope"))
+        self.assertNotIn("nopenope", manager.has_parts.get("go", []))
+        self.assert_consistent(manager, check_converter=True)
+        with self.assertRaises(KeyError):
+            manager.remove_resource("nopenope")
+
+    def test_update_in_place(self):
+        """Test upserting a resource that was changed in place removes its old index entries."""
+        registry = {
+            resource.prefix: resource
+            for resource in [
+                Resource(prefix="nopea", synonyms=["nopeasyn"]),
+                Resource(prefix="nopeb", has_canonical="nopea", part_of="nopea"),
+                Resource(prefix="nopec"),
+            ]
+        }
+        manager = Manager(
+            registry=registry,
+            metaregistry=self.manager.metaregistry,
+            collections={},
+            contexts={},
+            mismatches={},
+        )
+        self.assertEqual("nopea", manager.normalize_prefix("nopeasyn"))
+        self.assertEqual(["nopeb"], manager.canonical_for["nopea"])
+
+        resource = manager.registry["nopea"]
+        resource.synonyms = ["nopeasyn2"]
+        manager.upsert_resource(resource)
+        self.assertIsNone(manager.normalize_prefix("nopeasyn"))
+        self.assertEqual("nopea", manager.normalize_prefix("nopeasyn2"))
+
+        resource = manager.registry["nopeb"]
+        resource.has_canonical = "nopec"
+        resource.part_of = None
+        manager.upsert_resource(resource)
+        self.assertEqual({"nopec": ["nopeb"]}, manager.canonical_for)
+        self.assertEqual({}, manager.has_parts)
+
+        resource.has_canonical = None
+        self.assertIs(resource, manager.remove_resource("nopeb"))
+        self.assertEqual({}, manager.canonical_for)
+        self.assertIsNone(manager.normalize_prefix("nopeb"))
+
+    def test_mapping_table(self):
+        """Test the mapping table gives the same mappings as the resources."""
+        table = self.manager.get_mapping_table()
+        for metaprefix in self.manager.metaregistry:
+            expected = {
+                prefix: resource.get_mapped_prefix(metaprefix)
+                for prefix, resource in self.manager.registry.items()
+                if resource.get_mapped_prefix(metaprefix) is not None
+            }
+            self.assertEqual(expected, self.manager.get_registry_map(metaprefix))
+            self.assertEqual(
+                sum(
+                    metaprefix in resource.get_mappings()
+                    for resource in self.manager.registry.values()
+                ),
+                table.count()[metaprefix],
+            )
+
+        external_mappings = table.get_mappings("obofoundry", "miriam")
+        for resource in self.manager.registry.values():
+            mappings = resource.get_mappings()
+            if "obofoundry" in mappings and "miriam" in mappings:
+                self.assertEqual(
+                    mappings["miriam"], external_mappings.mappings[mappings["obofoundry"]]
+                )
+            elif "obofoundry" in mappings:
+                self.assertIn(mappings["obofoundry"], external_mappings.source_only)
+            elif "miriam" in mappings:
+                self.assertIn(mappings["miriam"], external_mappings.target_only)
+        self.assertEqual(ExternalMappings({}, [], []), table.get_mappings("nopenope", "nopenope"))
+
+    def test_providers_list(self):
+        """Test the provider table gives the same links as the provider functions."""
+        provider_functions = self.manager.get_provider_functions()
+        for prefix, resource in self.manager.registry.items():
+            example = resource.get_example() or "1234"
+            banana = resource.get_banana()
+            identifiers = [example]
+            if banana:
+                identifiers.append(f"{banana}{resource.get_banana_peel()}{example}")
+            for identifier in identifiers:
+                expected = []
+                for metaprefix, func in provider_functions.items():
+                    link = func(prefix, identifier)
+                    if link is not None:
+                        expected.append((metaprefix, link))
+                for provider in resource.get_extra_providers():
+                    expected.append((provider.code, provider.resolve(identifier)))
+                if expected:
+                    expected.insert(
+                        1 if expected[0][0] == "default" else 0,
+                        ("bioregistry", self.manager.get_bioregistry_iri(prefix, identifier)),
+                    )
+                with self.subTest(prefix=prefix, identifier=identifier):
+                    self.assertEqual(
+                        expected, list(self.manager.get_providers_list(prefix, identifier))
+                    )
+        with self.assertRaises(KeyError):
+            self.manager.get_providers_list("nope", "1234")
+
+    def test_snapshot(self):
+        """Test a manager loaded from a snapshot is the same as one built from the data."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("manager-test.pkl")
+            stale_path = Path(directory).joinpath("manager-stale.pkl")
+            stale_path.write_bytes(b"")
+            with mock.patch("bioregistry.resource_manager._get_snapshot_path", return_value=path):
+                built = Manager.from_snapshot()
+                self.assertTrue(path.is_file())
+                self.assertFalse(stale_path.exists())
+                loaded = Manager.from_snapshot()
+
+        self.assertIsNot(built, loaded)
+        self.assertEqual(self.manager.registry, loaded.registry)
+        self.assertEqual(self.manager.metaregistry, loaded.metaregistry)
+        self.assertEqual(self.manager.collections, loaded.collections)
+        self.assertEqual(self.manager.contexts, loaded.contexts)
+        self.assertEqual(self.manager.mismatches, loaded.mismatches)
+        self.assertEqual(self.manager.canonical_for, loaded.canonical_for)
+        self.assertEqual(dict(self.manager.synonyms), dict(loaded.synonyms))
+        self.assertEqual("go", loaded.normalize_prefix("GO"))
+        self.assertEqual("go:0000001", loaded.normalize_curie("GO:0000001"))
+        self.assertTrue(loaded.is_valid_identifier("go", "0000001"))
+
+    def test_snapshot_path(self):
+        """Test the snapshot's path changes with its format version and the source code."""
+        path = _get_snapshot_path()
+        self.assertEqual(path, _get_snapshot_path())
+        with mock.patch(
+            "bioregistry.resource_manager.SNAPSHOT_FORMAT_VERSION", SNAPSHOT_FORMAT_VERSION + 1
+        ):
+            self.assertNotEqual(path, _get_snapshot_path())
+        with tempfile.TemporaryDirectory() as directory:
+            source_path = Path(directory).joinpath("struct.py")
+            source_path.write_text("# version 1\n")
+            with mock.patch("bioregistry.resource_manager.SNAPSHOT_SOURCE_PATHS", (source_path,)):
+                first_path = _get_snapshot_path()
+                source_path.write_text("# version 2\n")
+                self.assertNotEqual(first_path, _get_snapshot_path())
+
+    def test_lazy(self):
+        """Test a lazy manager only loads its data when it's first used."""
+        calls = []
+
+        def _loader() -> Manager:
+            calls.append(True)
+            return self.manager
+
+        manager = Manager.lazy(_loader)
+        self.assertEqual([], calls)
+        self.assertEqual("go", manager.normalize_prefix("GO"))
+        self.assertEqual([True], calls)
+        self.assertIs(self.manager.registry, manager.registry)
+        self.assertEqual([True], calls)
+        with self.assertRaises(AttributeError):
+            manager.nope  # noqa:B018
+
+    def test_lazy_import(self):
+        """Test importing the package doesn't import its submodules or load any data."""
+        output = subprocess.check_output(  # noqa:S603
+            [
+                sys.executable,
+                "-c",
+                "import sys, bioregistry; print(sorted(m for m in sys.modules if m.startswith('bioregistry')))",
+            ],
+            text=True,
+        )
+        self.assertEqual("['bioregistry']", output.strip())
+        self.assertIsInstance(bioregistry.manager, Manager)
+        self.assertTrue(callable(bioregistry.parse_iri))
+
+    def test_compact(self):
+        """Test the compact manager gives the same results as the full one."""
+        compact_manager = self.manager.compact()
+        self.assertEqual(len(self.manager.registry), len(compact_manager))
+        # pickling shouldn't change any lookups
+        compact_manager = pickle.loads(pickle.dumps(compact_manager))  # noqa:S301
+        for prefix, resource in self.manager.registry.items():
+            view = compact_manager.get_resource_view(prefix)
+            self.assertEqual(self.manager.get_resource_view(prefix), view)
+            self.assertEqual(sorted(resource.get_synonyms()), list(view.synonyms))
+            example = resource.get_example() or "0000001"
+            for query in {prefix, prefix.upper(), *view.synonyms}:
+                for name in [
+                    "normalize_prefix",
+                    "get_name",
+                    "get_preferred_prefix",
+                    "get_pattern",
+                    "get_pattern_re",
+                    "get_uri_format",
+                    "get_uri_prefix",
+                    "get_banana",
+                    "get_example",
+                    "is_deprecated",
+                ]:
+                    with self.subTest(prefix=prefix, query=query, name=name):
+                        self.assertEqual(
+                            getattr(self.manager, name)(query),
+                            getattr(compact_manager, name)(query),
+                        )
+                for curie in [
+                    f"{query}:{example}",
+                    f"{query}:{query}:{example}",
+                    f"{query}:{view.banana}{view.banana_peel}{example}",
+                ]:
+                    with self.subTest(prefix=prefix, curie=curie):
+                        self.assertEqual(
+                            self.manager.normalize_curie(curie),
+                            compact_manager.normalize_curie(curie),
+                        )
+                        self.assertEqual(
+                            self.manager.is_valid_curie(curie),
+                            compact_manager.is_valid_curie(curie),
+                        )
+        self.assertIsNone(compact_manager.normalize_curie("nopenope:1"))
+        self.assertIsNone(compact_manager.get_resource_view("nopenope"))
+        self.assertFalse(compact_manager.is_valid_curie("nopenope:1"))
+
+    def test_use_compact_views(self):
+        """Test a manager using compact views gives the same results without loading."""
+        calls = []
+
+        def _loader() -> Manager:
+            calls.append(True)
+            return self.manager
+
+        compact_manager = pickle.loads(pickle.dumps(self.manager.compact()))  # noqa:S301
+        manager = Manager.lazy(_loader)
+        manager.use_compact_views(compact_manager)
+        for prefix, resource in self.manager.registry.items():
+            example = resource.get_example() or "0000001"
+            with self.subTest(prefix=prefix):
+                for name in [
+                    "normalize_prefix",
+                    "get_name",
+                    "get_preferred_prefix",
+                    "get_pattern",
+                    "get_uri_format",
+                    "get_uri_prefix",
+                    "get_banana",
+                    "get_example",
+                    "is_deprecated",
+                ]:
+                    self.assertEqual(
+                        getattr(self.manager, name)(prefix), getattr(manager, name)(prefix)
+                    )
+                self.assertEqual(
+                    self.manager.normalize_curie(f"{prefix}:{example}"),
+                    manager.normalize_curie(f"{prefix}:{example}"),
+                )
+                self.assertEqual(
+                    self.manager.is_valid_identifier(prefix, example),
+                    manager.is_valid_identifier(prefix, example),
+                )
+        self.assertEqual([], calls)
+
+        manager.use_compact_views(False)
+        self.assertIsNone(manager.compact_manager)
+        self.assertEqual("go", manager.normalize_prefix("GO"))
+        self.assertEqual([True], calls)
+
     def test_full_rdf(self):
         """Test the full dump."""
         full = get_full_rdf(self.manager)
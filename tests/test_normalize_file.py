@@ -0,0 +1,85 @@
+"""Tests for normalizing CURIEs and IRIs in files."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from bioregistry.normalize_file import UNPARSABLE_IRI, normalize_file
+
+ROWS = [
+    ("curie", "iri", "label"),
+    ("GO:0000001", "http://purl.obolibrary.org/obo/GO_0000001", "a"),
+    ("go:GO:0000001", "", "b"),
+    ("nopenope:0000001", "https://example.org/nope", "c"),
+    ("go:1", "http://purl.obolibrary.org/obo/CHEBI_1234", "d"),
+    ("nopenope", "", "e"),
+]
+
+EXPECTED = [
+    ["curie", "iri", "label"],
+    ["go:0000001", "go:0000001", "a"],
+    ["go:0000001", "", "b"],
+    ["nopenope:0000001", "https://example.org/nope", "c"],
+    ["go:1", "chebi:1234", "d"],
+    ["nopenope", "", "e"],
+]
+
+
+class TestNormalizeFile(unittest.TestCase):
+    """Tests for the ``bioregistry normalize-file`` command."""
+
+    def setUp(self) -> None:
+        """Set up a temporary directory with an input file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.directory_path = Path(self.directory.name)
+        self.input_path = self.directory_path.joinpath("input.tsv")
+        self.input_path.write_text("".join("\t".join(row) + "\n" for row in ROWS))
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def _run(self, *args: str):
+        output_path = self.directory_path.joinpath("output.tsv")
+        summary_path = self.directory_path.joinpath("summary.json")
+        result = CliRunner().invoke(
+            normalize_file,
+            [
+                self.input_path.as_posix(),
+                output_path.as_posix(),
+                "--curie-column",
+                "curie",
+                "--iri-column",
+                "iri",
+                "--summary",
+                summary_path.as_posix(),
+                *args,
+            ],
+        )
+        self.assertEqual(0, result.exit_code, msg=result.output)
+        rows = [line.split("\t") for line in output_path.read_text().splitlines()]
+        self.assertEqual(EXPECTED, rows)
+        summary = json.loads(summary_path.read_text())
+        self.assertEqual(5, summary["rows"])
+        self.assertEqual({"nopenope": 1, UNPARSABLE_IRI: 1}, summary["unknown_prefixes"])
+        self.assertEqual({"go": 1}, summary["invalid_identifiers"])
+        self.assertEqual(1, summary["not_curies"])
+
+    def test_normalize(self):
+        """Test normalizing a file in a single process."""
+        self._run("--chunksize", "3")
+
+    def test_normalize_processes(self):
+        """Test normalizing a file with several processes keeps the order."""
+        self._run("--chunksize", "1", "--processes", "2")
+
+    def test_missing_column(self):
+        """Test that an unknown column name gives an error."""
+        result = CliRunner().invoke(
+            normalize_file,
+            [self.input_path.as_posix(), "-", "--curie-column", "nope"],
+        )
+        self.assertNotEqual(0, result.exit_code)
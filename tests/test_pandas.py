@@ -4,6 +4,7 @@ import unittest
 
 import pandas as pd
 
+import bioregistry
 import bioregistry.pandas as brpd
 
 
@@ -81,6 +82,43 @@ class TestPandasUtils(unittest.TestCase):
         ]
         self.assertEqual(processed_rows, [tuple(row) for row in df.values])
 
+    def test_normalize_curies(self):
+        """Test normalizing CURIEs."""
+        rows = [
+            ("GO:0000001",),
+            ("go:GO:0000001",),
+            ("pmid:1234",),
+            ("nope:0000001",),
+            ("nope",),
+            (None,),
+        ]
+        df = pd.DataFrame(rows, columns=["curie"])
+        brpd.normalize_curies(df, "curie", target_column="norm")
+        self.assertEqual(
+            ["go:0000001", "go:0000001", "pubmed:1234", None, None, None],
+            list(df["norm"]),
+        )
+
+    def test_curies_to_iris(self):
+        """Test converting CURIEs to IRIs."""
+        rows = [
+            ("GO:0000001",),
+            ("chebi:24867",),
+            ("nope:0000001",),
+            (None,),
+        ]
+        df = pd.DataFrame(rows, columns=["curie"])
+        brpd.curies_to_iris(df, "curie", target_column="iri")
+        self.assertEqual(
+            [
+                bioregistry.get_iri("go:0000001"),
+                bioregistry.get_iri("chebi:24867"),
+                None,
+                None,
+            ],
+            list(df["iri"]),
+        )
+
     def test_validate_curies(self):
         """Test validating CURIEs."""
         rows = [
@@ -0,0 +1,98 @@
+"""Tests for writing RDF as a stream."""
+
+import io
+import itertools as itt
+import unittest
+
+import rdflib
+from rdflib import RDF, RDFS, XSD, BNode, Literal, Namespace, URIRef
+from rdflib.compare import isomorphic
+
+import bioregistry
+from bioregistry.export.rdf_export import (
+    get_full_namespaces,
+    get_full_rdf,
+    iter_full_rdf_chunks,
+)
+from bioregistry.export.rdf_stream import write_ntriples, write_turtle
+from bioregistry.resource_manager import Manager
+
+EX = Namespace("https://example.org/")
+
+
+class TestRDFStream(unittest.TestCase):
+    """Tests for writing RDF as a stream."""
+
+    def setUp(self) -> None:
+        """Set up the test case with a manager for a few resources."""
+        self.manager = Manager(
+            registry={
+                prefix: bioregistry.manager.registry[prefix]
+                for prefix in ["chebi", "go", "hgnc", "ncbitaxon", "uberon"]
+            }
+        )
+        self.graph = get_full_rdf(self.manager)
+
+    def test_ntriples(self):
+        """Test that the streamed N-Triples are the same graph."""
+        file = io.StringIO()
+        count = write_ntriples(itt.chain.from_iterable(iter_full_rdf_chunks(self.manager)), file)
+        self.assertGreaterEqual(count, len(self.graph))
+        graph = rdflib.Graph().parse(data=file.getvalue(), format="nt")
+        self.assertTrue(isomorphic(self.graph, graph))
+
+    def test_nquads(self):
+        """Test that the streamed N-Quads are in the given graph."""
+        file = io.StringIO()
+        write_ntriples(
+            itt.chain.from_iterable(iter_full_rdf_chunks(self.manager)), file, graph=EX.graph
+        )
+        dataset = rdflib.Dataset().parse(data=file.getvalue(), format="nquads")
+        self.assertTrue(isomorphic(self.graph, dataset.graph(EX.graph)))
+
+    def test_turtle(self):
+        """Test that the streamed Turtle is the same graph."""
+        file = io.StringIO()
+        write_turtle(
+            iter_full_rdf_chunks(self.manager), file, get_full_namespaces(manager=self.manager)
+        )
+        text = file.getvalue()
+        self.assertIn("\nbioregistry:chebi a bioregistry.schema:0000001 ;\n", text)
+        graph = rdflib.Graph().parse(data=text, format="turtle")
+        self.assertTrue(isomorphic(self.graph, graph))
+
+    def test_terms(self):
+        """Test writing literals, blank nodes, and IRIs that can't be abbreviated."""
+        node = BNode()
+        triples = [
+            (EX.a, RDF.type, EX["b~c"]),
+            (EX.a, RDFS.label, Literal('a "quoted"\nlabel\\', lang="en")),
+            (EX.a, EX.flag, Literal(True, datatype=XSD.boolean)),
+            (EX.a, EX.knows, node),
+            (node, RDFS.label, Literal("b")),
+            (URIRef("https://other.org/a"), EX.p, EX["a/b"]),
+        ]
+        expected = rdflib.Graph()
+        for triple in triples:
+            expected.add(triple)
+
+        file = io.StringIO()
+        self.assertEqual(6, write_ntriples(triples, file))
+        self.assertTrue(
+            isomorphic(expected, rdflib.Graph().parse(data=file.getvalue(), format="nt"))
+        )
+
+        file = io.StringIO()
+        namespaces = [
+            ("ex", str(EX)),
+            ("rdfs", str(RDFS)),
+            ("xsd", str(XSD)),
+            ("3d", "https://other.org/"),
+        ]
+        self.assertEqual(6, write_turtle([triples[:4], triples[4:]], file, namespaces))
+        text = file.getvalue()
+        self.assertNotIn("@prefix 3d:", text)
+        self.assertIn("<https://example.org/b~c>", text)
+        self.assertIn("<https://example.org/a/b>", text)
+        self.assertIn('"true"^^xsd:boolean', text)
+        self.assertTrue(isomorphic(expected, rdflib.Graph().parse(data=text, format="turtle")))
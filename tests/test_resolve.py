@@ -2,11 +2,13 @@
 
 """Tests for the bioregistry client."""
 
+import importlib
 import unittest
 from typing import Iterable, Tuple
 
 import bioregistry
 from bioregistry import manager
+from bioregistry.parse_iri import _get_prefix_trie
 from bioregistry.resolve import get_external
 
 
@@ -163,3 +165,51 @@ class TestResolve(unittest.TestCase):
         fobi_dependencies = bioregistry.get_depends_on(test_prefix)
         self.assertIsNotNone(fobi_dependencies)
         self.assertIn(test_target, fobi_dependencies)
+
+    def test_parse_iris(self):
+        """Test parsing IRIs in bulk gives the same results, in order, as one at a time."""
+        iris = [
+            "http://purl.obolibrary.org/obo/DRON_00023232",
+            "https://example.org/nope",
+            "https://bioregistry.io/chebi:24867",
+            "https://www.alzforum.org/mutations/1234",
+        ] * 5
+        expected = [tuple(bioregistry.parse_iri(iri)) for iri in iris]
+        for processes in [1, 2]:
+            with self.subTest(processes=processes):
+                self.assertEqual(
+                    expected, list(bioregistry.parse_iris(iris, processes=processes, chunksize=3))
+                )
+        # parsing in the current process doesn't set the workers' converter
+        self.assertIsNone(importlib.import_module("bioregistry.parse_iri")._WORKER_CONVERTER)
+        for processes in [0, -1]:
+            with self.subTest(processes=processes), self.assertRaises(ValueError):
+                bioregistry.parse_iris(iris, processes=processes)
+
+    def test_parse_iri_prefix_map(self):
+        """Test parsing IRIs with a custom prefix map, as a mapping, list, or trie."""
+        prefix_map = {
+            "chebi": "https://example.org/chebi:",
+            "chebi.sub": "https://example.org/chebi:sub",
+        }
+        iri = "https://example.org/chebi:sub1234"
+        for value in [prefix_map, bioregistry.ensure_prefix_list(prefix_map)]:
+            with self.subTest(type=type(value).__name__), self.assertWarns(Warning):
+                self.assertEqual(
+                    ("chebi.sub", "1234"), bioregistry.parse_iri(iri, prefix_map=value)
+                )
+        prefix_trie = bioregistry.ensure_prefix_trie(prefix_map)
+        self.assertEqual(("chebi.sub", "1234"), bioregistry.parse_iri(iri, prefix_map=prefix_trie))
+
+    def test_parse_iri_prefix_list_cache(self):
+        """Test the index of a prefix list is built once and not shared with other lists."""
+        prefix_list = [("chebi", "https://example.org/chebi:")]
+        with self.assertWarns(Warning):
+            self.assertEqual(
+                ("chebi", "1"),
+                bioregistry.parse_iri("https://example.org/chebi:1", prefix_map=prefix_list),
+            )
+        prefix_trie = _get_prefix_trie(prefix_list)
+        self.assertIs(prefix_trie, _get_prefix_trie(prefix_list))
+        # an equal list gets its own index
+        self.assertIsNot(prefix_trie, _get_prefix_trie(list(prefix_list)))
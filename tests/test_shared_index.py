@@ -0,0 +1,91 @@
+"""Tests for the memory-mapped shared index."""
+
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from bioregistry import Manager, manager
+from bioregistry.shared_index import SharedIndex
+
+
+class TestSharedIndex(unittest.TestCase):
+    """Tests for the memory-mapped shared index."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Write a shared index for the default manager."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = Path(cls.directory.name).joinpath("bioregistry.idx")
+        manager.write_shared_index(cls.path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared index."""
+        cls.directory.cleanup()
+
+    def setUp(self) -> None:
+        """Open the shared index."""
+        self.index = SharedIndex(self.path)
+
+    def tearDown(self) -> None:
+        """Close the shared index."""
+        self.index.close()
+
+    def test_invalid(self):
+        """Test that opening a file that isn't a shared index gives an error."""
+        path = Path(self.directory.name).joinpath("nope.idx")
+        path.write_bytes(b"nope" * 100)
+        with self.assertRaises(ValueError):
+            SharedIndex(path)
+
+    def test_lookups(self):
+        """Test that lookups give the same results as the manager."""
+        self.assertEqual(len(manager.registry), len(self.index))
+        for synonym, prefix in manager.synonyms.items():
+            for query in {synonym, synonym.upper()}:
+                with self.subTest(query=query):
+                    self.assertEqual(prefix, self.index.normalize_prefix(query))
+        self.assertIsNone(self.index.normalize_prefix("nopenope"))
+        for prefix in manager.registry:
+            with self.subTest(prefix=prefix):
+                self.assertEqual(manager.get_pattern(prefix), self.index.get_pattern(prefix))
+                self.assertEqual(manager.get_pattern_re(prefix), self.index.get_pattern_re(prefix))
+                self.assertEqual(manager.get_uri_format(prefix), self.index.get_uri_format(prefix))
+
+    def test_parse_uri(self):
+        """Test that parsing URIs gives the same results as the manager's converter."""
+        uris = ["", "https://example.org/nope", "http://purl.obolibrary.org/obo/GO_0000001"]
+        for uri_prefix in manager.converter.reverse_prefix_map:
+            uris.extend([uri_prefix, f"{uri_prefix}1234", uri_prefix[:-1], f"{uri_prefix}ü/1"])
+        for uri in uris:
+            with self.subTest(uri=uri):
+                self.assertEqual(manager.parse_uri(uri), self.index.parse_uri(uri))
+
+    def test_pickle(self):
+        """Test that a pickled index is opened again."""
+        index = pickle.loads(pickle.dumps(self.index))  # noqa:S301
+        self.assertEqual("go", index.normalize_prefix("GO"))
+        index.close()
+
+    def test_manager(self):
+        """Test that a lazy manager uses the shared index without loading its data."""
+        calls = []
+
+        def _loader():
+            calls.append(True)
+            return manager
+
+        lazy_manager = Manager.lazy(_loader)
+        lazy_manager.use_shared_index(self.path)
+        self.assertEqual("go", lazy_manager.normalize_prefix("GO"))
+        self.assertEqual(
+            ("go", "0000001"),
+            lazy_manager.parse_uri("http://purl.obolibrary.org/obo/GO_0000001"),
+        )
+        self.assertEqual(manager.get_pattern("go"), lazy_manager.get_pattern("GO"))
+        self.assertEqual([], calls)
+        # other lookups load the data
+        self.assertEqual(manager.get_name("go"), lazy_manager.get_name("GO"))
+        self.assertEqual([True], calls)
+        lazy_manager.shared_index.close()
@@ -2,7 +2,7 @@
 
 import unittest
 
-from bioregistry.utils import backfill, deduplicate
+from bioregistry.utils import SearchIndex, URIPrefixTrie, backfill, deduplicate
 
 
 class TestDeduplicate(unittest.TestCase):
@@ -65,3 +65,56 @@ class TestDeduplicate(unittest.TestCase):
             ],
             res,
         )
+
+
+class TestURIPrefixTrie(unittest.TestCase):
+    """Test the longest-prefix-match URI index."""
+
+    def test_parse_uri(self):
+        """Test the longest URI prefix is used, regardless of insertion order."""
+        trie = URIPrefixTrie(
+            [
+                ("a", "https://example.org/"),
+                ("b", "https://example.org/b/"),
+                ("c", "https://example.org/b/"),
+            ]
+        )
+        self.assertEqual(2, len(trie))
+        self.assertEqual(("b", "1"), trie.parse_uri("https://example.org/b/1"))
+        self.assertEqual(("a", "c/1"), trie.parse_uri("https://example.org/c/1"))
+        self.assertEqual(("a", ""), trie.parse_uri("https://example.org/"))
+        self.assertEqual((None, None), trie.parse_uri("https://example.org"))
+        self.assertEqual((None, None), trie.parse_uri(""))
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test the n-gram search index."""
+
+    def test_search(self):
+        """Test results are ranked, deduplicated, and limited, for short and long queries."""
+        index = SearchIndex(
+            [
+                ("abcd", 0, "x"),
+                ("abcdef", 0, "y"),
+                ("zabcd", 0, "z"),
+                ("abcd", 1, "y"),
+                ("acbd", 0, "w"),
+            ]
+        )
+        self.assertEqual(5, len(index))
+        self.assertEqual(["x", "y", "z"], index.search("ABCD"))
+        self.assertEqual(["x", "y"], index.search("abcd", limit=2))
+        self.assertEqual(["y"], index.search("cde"))
+        self.assertEqual(["x", "y", "z"], index.search("a-b"))
+        self.assertEqual(["x"], index.search("ab", limit=1))
+        self.assertEqual(["w", "x", "y", "z"], index.search("b"))
+        self.assertEqual([], index.search("abdc"))
+        self.assertEqual([], index.search(""))
+
+    def test_short_rankings(self):
+        """Test only the rankings of short queries that match something are kept."""
+        index = SearchIndex([("abcd", 0, "x"), ("bcd", 0, "y")])
+        self.assertEqual(["y", "x"], index.search("bc"))
+        self.assertEqual([], index.search("zz"))
+        self.assertEqual([], index.search("q"))
+        self.assertEqual({"bc"}, set(index._short_rankings))
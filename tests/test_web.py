@@ -3,14 +3,21 @@
 """Test for web."""
 
 import json
+import os
+import tempfile
+import time
 import unittest
+from pathlib import Path
 from typing import List
 
 import rdflib
 import yaml
 
 from bioregistry import Collection, Manager
+from bioregistry.app import proxies
 from bioregistry.app.impl import get_app
+from bioregistry.app.reload import ManagerReloader
+from bioregistry.app.utils import RESPONSE_CACHE_KEY
 
 
 class TestWeb(unittest.TestCase):
@@ -293,6 +300,54 @@ class TestWeb(unittest.TestCase):
         with self.app.test_client() as client:
             res = client.get("/api/search?q=che")
             self.assertEqual(200, res.status_code)
+            res = client.get("/api/search?q=cheb&limit=2")
+            self.assertEqual(200, res.status_code)
+            self.assertEqual([["chebi", ""], ["chebi", "chebiid"]], res.json)
+
+    def test_etag(self):
+        """Test responses have strong ETags and conditional requests get a 304."""
+        with self.app.test_client() as client:
+            res = client.get("/api/registry/chebi")
+            self.assertEqual(200, res.status_code)
+            etag = res.headers["ETag"]
+            self.assertFalse(etag.startswith("W/"))
+
+            cached = client.get("/api/registry/chebi")
+            self.assertEqual(res.data, cached.data)
+            self.assertEqual(res.content_type, cached.content_type)
+            self.assertEqual(etag, cached.headers["ETag"])
+
+            res = client.get("/api/registry/chebi", headers={"If-None-Match": etag})
+            self.assertEqual(304, res.status_code)
+            self.assertEqual(b"", res.data)
+
+            res = client.get("/api/registry/chebi?format=yaml", headers={"If-None-Match": etag})
+            self.assertEqual(200, res.status_code)
+            self.assertNotEqual(etag, res.headers["ETag"])
+
+            # Accept headers that negotiate the same media type share a cache entry
+            self.assertEqual("Accept", res.headers["Vary"])
+            cache = self.app.extensions[RESPONSE_CACHE_KEY]
+            size = len(cache)
+            for accept in ["text/html", "text/html,application/xhtml+xml", "*/*"]:
+                res = client.get("/api/registry/chebi", headers={"Accept": accept})
+                self.assertEqual(200, res.status_code)
+                self.assertEqual(etag, res.headers["ETag"])
+            self.assertEqual(size, len(cache))
+
+            # errors aren't cached
+            self.assertEqual(404, client.get("/api/registry/nopenope").status_code)
+            self.assertEqual(404, client.get("/api/registry/nopenope").status_code)
+
+    def test_external_mapping(self):
+        """Test the mappings between external registries."""
+        with self.app.test_client() as client:
+            res = client.get("/api/external/mapping/obofoundry/wikidata")
+            self.assertEqual(200, res.status_code)
+            self.assertEqual("P686", res.json["mappings"]["go"])
+            self.assertEqual(len(res.json["mappings"]), res.json["meta"]["len_overlap"])
+            res = client.get("/api/external/mapping/nopenope/wikidata")
+            self.assertEqual(400, res.status_code)
 
     def test_autocomplete(self):
         """Test search."""
@@ -341,3 +396,73 @@ class TestWeb(unittest.TestCase):
                         msg=f"{prefix}\nHeaders: {res.headers}\nRequest: {res.request}",
                     )
                     self.assertEqual(location, res.headers["Location"])
+
+
+class TestReload(unittest.TestCase):
+    """Tests for swapping in a new manager while the app is running."""
+
+    def setUp(self) -> None:
+        """Set up the test case with an app for a small registry."""
+        default_manager = Manager()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("registry.json")
+        self.path.write_text("{}")
+        self.prefixes = ["chebi"]
+
+        def _loader() -> Manager:
+            return Manager(
+                registry={prefix: default_manager.registry[prefix] for prefix in self.prefixes},
+                metaregistry=default_manager.metaregistry,
+                collections=default_manager.collections,
+                contexts=default_manager.contexts,
+                mismatches=default_manager.mismatches,
+            )
+
+        self.reloader = ManagerReloader(_loader, paths=[self.path])
+        _, self.app = get_app(
+            manager=_loader(),
+            config={"METAREGISTRY_RELOAD_TOKEN": "secret"},
+            reloader=self.reloader,
+            return_flask=True,
+        )
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_reload(self):
+        """Test requests that are in progress keep using the old manager."""
+        old_manager = self.app.manager
+        self.prefixes.append("go")
+        with self.app.test_request_context():
+            self.assertIs(old_manager, proxies.manager._get_current_object())
+            new_manager = self.reloader.reload()
+            self.assertIs(new_manager, self.app.manager)
+            self.assertIs(old_manager, proxies.manager._get_current_object())
+        with self.app.test_request_context():
+            self.assertIs(new_manager, proxies.manager._get_current_object())
+        self.assertIs(new_manager.converter, self.reloader.sparql_graph.converter)
+        with self.app.test_client() as client:
+            self.assertEqual(200, client.get("/api/registry/go").status_code)
+
+    def test_check(self):
+        """Test modifying a data file triggers a reload."""
+        self.assertFalse(self.reloader.check())
+        stat = os.stat(self.path)
+        os.utime(self.path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertTrue(self.reloader.check())
+        self.assertEqual(1, self.reloader.reloads)
+        self.assertFalse(self.reloader.check())
+
+    def test_reload_endpoint(self):
+        """Test the endpoint for triggering a reload."""
+        with self.app.test_client() as client:
+            res = client.post("/api/reload", headers={"Authorization": "Bearer nope"})
+            self.assertEqual(403, res.status_code)
+            res = client.post("/api/reload", headers={"Authorization": "Bearer secret"})
+            self.assertEqual(202, res.status_code)
+        for _ in range(100):
+            if self.reloader.reloads:
+                break
+            time.sleep(0.1)
+        self.assertEqual(1, self.reloader.reloads)